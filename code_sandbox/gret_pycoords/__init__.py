@@ -2,4 +2,6 @@
 gret_pycords package
 """
 
+from .arrays import *
+from .spatial import *
 from .vectors import *
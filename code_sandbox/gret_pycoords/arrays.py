@@ -0,0 +1,259 @@
+"""
+Vector arrays module
+"""
+
+__all__ = [
+    "Vector2DArray",
+    "Vector2DView",
+]
+
+import itertools
+import math
+import operator
+from array import array
+from numbers import Real
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Union
+
+from .vectors import Vector2D
+
+
+class Vector2DView(Vector2D):
+    """
+    Vector2D reading and writing its coordinates directly in Vector2DArray's buffer
+    """
+
+    __slots__ = ("_data", "_offset")
+
+    _data: array
+    _offset: int
+
+    def __init__(self, data: array, index: int) -> None:
+        self._data = data
+        self._offset = 2 * index
+
+    def _new(self, x: float, y: float) -> Vector2D:
+        # results are independent of the buffer
+        return Vector2D._from_floats(x, y)
+
+    @property
+    def _x(self) -> float:
+        return self._data[self._offset]
+
+    @_x.setter
+    def _x(self, value: float) -> None:
+        self._data[self._offset] = value
+
+    @property
+    def _y(self) -> float:
+        return self._data[self._offset + 1]
+
+    @_y.setter
+    def _y(self, value: float) -> None:
+        self._data[self._offset + 1] = value
+
+
+Operand = Union["Vector2DArray", Vector2D, Sequence[float], float]
+
+
+class Vector2DArray:
+    """
+    Array of 2 dimensional vectors kept in single contiguous buffer of doubles, as
+    x and y coordinates one after another. Arithmetic works on all vectors at once:
+    with other array of the same length element by element, and with a single vector
+    or a number - for each vector of the array.
+    """
+
+    __slots__ = ("_data",)
+
+    _data: array
+
+    def __init__(self, points: Iterable[Union[Vector2D, Sequence[float]]] = ()) -> None:
+        self._data = array("d")
+        self.extend(points)
+
+    @classmethod
+    def zeros(cls, count: int) -> "Vector2DArray":
+        return cls._from_data(array("d", bytes(16 * count)))
+
+    @classmethod
+    def from_flat(cls, coordinates: Iterable[float]) -> "Vector2DArray":
+        """Array from coordinates given as x0, y0, x1, y1, ..."""
+        data = array("d", coordinates)
+        if len(data) % 2:
+            raise ValueError("Amount of coordinates has to be even")
+        return cls._from_data(data)
+
+    @classmethod
+    def _from_data(cls, data: array) -> "Vector2DArray":
+        instance = cls.__new__(cls)
+        instance._data = data
+        return instance
+
+    @property
+    def xs(self) -> array:
+        """Copy of all x coordinates"""
+        return self._data[0::2]
+
+    @property
+    def ys(self) -> array:
+        """Copy of all y coordinates"""
+        return self._data[1::2]
+
+    def append(self, point: Union[Vector2D, Sequence[float]]) -> None:
+        self._data.extend(self._coordinates(point))
+
+    def extend(self, points: Iterable[Union[Vector2D, Sequence[float]]]) -> None:
+        if isinstance(points, Vector2DArray):
+            self._data.extend(points._data)
+            return
+
+        for point in points:
+            self._data.extend(self._coordinates(point))
+
+    def to_vectors(self) -> List[Vector2D]:
+        """Copies of all vectors as independent Vector2D objects"""
+        data = self._data
+        return [Vector2D(data[i], data[i + 1]) for i in range(0, len(data), 2)]
+
+    def __len__(self) -> int:
+        return len(self._data) // 2
+
+    def __getitem__(
+        self, idx: Union[int, slice]
+    ) -> Union[Vector2DView, "Vector2DArray"]:
+        """Single vector is a view of the array, slice is a copy"""
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(len(self))
+            data = array("d")
+            for i in range(start, stop, step):
+                data.extend(self._data[2 * i : 2 * i + 2])
+            return self._from_data(data)
+
+        return Vector2DView(self._data, self._index(idx))
+
+    def __setitem__(self, idx: int, point: Union[Vector2D, Sequence[float]]) -> None:
+        offset = 2 * self._index(idx)
+        self._data[offset : offset + 2] = array("d", self._coordinates(point))
+
+    def __iter__(self) -> Iterator[Vector2DView]:
+        data = self._data
+        return (Vector2DView(data, i) for i in range(len(self)))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Vector2DArray):
+            return self._data == other._data
+        try:
+            if len(other) != len(self):
+                return False
+        except TypeError:
+            return False
+
+        return all(vector == point for vector, point in zip(self, other))
+
+    def equal(self, other: Operand) -> List[bool]:
+        """Element-wise equality"""
+        return self.isclose(other, rel_tol=0.0, abs_tol=0.0)
+
+    def isclose(
+        self, other: Operand, rel_tol: float = 1e-09, abs_tol: float = 0.0
+    ) -> List[bool]:
+        """Element-wise check if vectors are close to the other ones, see math.isclose"""
+        operand = self._required_operand(other)
+        close = [
+            math.isclose(a, b, rel_tol=rel_tol, abs_tol=abs_tol)
+            for a, b in zip(self._data, operand)
+        ]
+        return [x and y for x, y in zip(close[0::2], close[1::2])]
+
+    def __add__(self, other: Operand) -> "Vector2DArray":
+        return self._binary(operator.add, other)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Operand) -> "Vector2DArray":
+        return self._binary(operator.sub, other)
+
+    def __rsub__(self, other: Operand) -> "Vector2DArray":
+        return self._binary(operator.sub, other, reflected=True)
+
+    def __mul__(self, other: Operand) -> "Vector2DArray":
+        return self._binary(operator.mul, other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Operand) -> "Vector2DArray":
+        return self._binary(operator.truediv, other)
+
+    def __neg__(self) -> "Vector2DArray":
+        return self._from_data(array("d", map(operator.neg, self._data)))
+
+    def dot(self, other: Operand) -> array:
+        """Dot product of every vector"""
+        products = array(
+            "d", map(operator.mul, self._data, self._required_operand(other))
+        )
+        return array("d", map(operator.add, products[0::2], products[1::2]))
+
+    def cross(self, other: Operand) -> array:
+        """Z coordinate of cross product of every vector"""
+        operand = self._required_operand(other)
+        # swapping other's coordinates turns cross product into difference of products
+        swapped = array("d", itertools.islice(operand, 2 * len(self)))
+        swapped[0::2], swapped[1::2] = swapped[1::2], swapped[0::2]
+        products = array("d", map(operator.mul, self._data, swapped))
+        return array("d", map(operator.sub, products[0::2], products[1::2]))
+
+    def norms(self) -> array:
+        """Length of every vector"""
+        return array("d", map(math.hypot, self.xs, self.ys))
+
+    def normalized(self) -> "Vector2DArray":
+        """Vectors scaled to unit length, zero vectors stay zero"""
+        scales = [1 / norm if norm else 0.0 for norm in self.norms()]
+        per_coordinate = itertools.chain.from_iterable(zip(scales, scales))
+        return self._from_data(
+            array("d", map(operator.mul, self._data, per_coordinate))
+        )
+
+    def _binary(
+        self, op: Callable[[float, float], float], other: Operand, reflected=False
+    ) -> "Vector2DArray":
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+
+        args = (operand, self._data) if reflected else (self._data, operand)
+        return self._from_data(array("d", map(op, *args)))
+
+    def _operand(self, other: Operand) -> Optional[Iterable[float]]:
+        """Coordinates matching array's ones, None if other cannot be an operand"""
+        if isinstance(other, Vector2DArray):
+            if len(other) != len(self):
+                raise ValueError(
+                    f"Arrays' lengths differ: {len(self)} and {len(other)}"
+                )
+            return other._data
+        if isinstance(other, Real):
+            return itertools.repeat(float(other))
+        try:
+            return itertools.cycle(self._coordinates(other))
+        except (TypeError, ValueError):
+            return None
+
+    def _required_operand(self, other: Operand) -> Iterable[float]:
+        operand = self._operand(other)
+        if operand is None:
+            raise TypeError(f"Unsupported operand type: {type(other).__name__}")
+        return operand
+
+    @staticmethod
+    def _coordinates(point: Union[Vector2D, Sequence[float]]) -> Sequence[float]:
+        if len(point) != 2:
+            raise ValueError("Vectors need exactly 2 coordinates")
+        return float(point[0]), float(point[1])
+
+    def _index(self, idx: int) -> int:
+        count = len(self)
+        if not -count <= idx < count:
+            raise IndexError("Vector2DArray index out of range")
+        return idx % count
@@ -0,0 +1,3 @@
+"""
+gret_pycoords benchmarks package - run modules with `python -m`
+"""
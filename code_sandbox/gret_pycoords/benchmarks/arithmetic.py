@@ -0,0 +1,74 @@
+"""
+Module for comparing Vector2D arithmetic with computing results by hand, through
+generic construction path
+
+Usage: python -m code_sandbox.gret_pycoords.benchmarks.arithmetic
+"""
+import math
+import random
+import time
+from typing import Callable
+
+from .. import Vector2D
+from ... import utils
+
+random.seed(321322)
+
+VECTORS = 100_000
+
+
+def measure(operation: Callable[[], object], repeat: int = 5) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def generic_vector(x: float, y: float) -> Vector2D:
+    """Construction as it was before the fast path - always converting args"""
+    vector = Vector2D.__new__(Vector2D)
+    vector._x, vector._y = utils.turn_into_floats(x, y, output_count=2)
+    return vector
+
+
+if __name__ == "__main__":
+    vectors = [Vector2D(random.random(), random.random()) for _ in range(VECTORS)]
+    shift = Vector2D(1, 2)
+
+    def accumulate() -> None:
+        total = Vector2D()
+        for vector in vectors:
+            total += vector
+
+    operations = {
+        "construct": (
+            lambda: [generic_vector(v[0], v[1]) for v in vectors],
+            lambda: [Vector2D(v[0], v[1]) for v in vectors],
+        ),
+        "add": (
+            lambda: [generic_vector(v[0] + shift[0], v[1] + shift[1]) for v in vectors],
+            lambda: [v + shift for v in vectors],
+        ),
+        "scale": (
+            lambda: [generic_vector(v[0] * 2, v[1] * 2) for v in vectors],
+            lambda: [v * 2 for v in vectors],
+        ),
+        "accumulate": (
+            lambda: generic_vector(
+                sum(v[0] for v in vectors), sum(v[1] for v in vectors)
+            ),
+            accumulate,
+        ),
+    }
+
+    print(f"{VECTORS} vectors")
+    print(f"{'operation':<12} | {'by hand':>9} | {'operator':>9} | speedup")
+    for name, (by_hand, with_operator) in operations.items():
+        by_hand_seconds, operator_seconds = measure(by_hand), measure(with_operator)
+        print(
+            f"{name:<12} | {by_hand_seconds * 1000:>7.1f}ms | "
+            f"{operator_seconds * 1000:>7.1f}ms | "
+            f"{by_hand_seconds / operator_seconds:.1f}x"
+        )
@@ -0,0 +1,66 @@
+"""
+Module for comparing bulk operations on list of Vector2D and on Vector2DArray
+
+Usage: python -m code_sandbox.gret_pycoords.benchmarks.arrays
+"""
+import math
+import random
+import time
+from typing import Callable
+
+from .. import Vector2D, Vector2DArray
+from ...utils.benchmarks.memory import bytes_per_instance
+
+random.seed(321322)
+
+POINTS = 100_000
+
+
+def measure(operation: Callable[[], object], repeat: int = 5) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    coordinates = [(random.random(), random.random()) for _ in range(POINTS)]
+    vectors = [Vector2D(x, y) for x, y in coordinates]
+    vec_array = Vector2DArray(coordinates)
+    shift = Vector2D(1, 2)
+
+    operations = {
+        "add vector": (
+            lambda: [Vector2D(v[0] + shift[0], v[1] + shift[1]) for v in vectors],
+            lambda: vec_array + shift,
+        ),
+        "scale": (
+            lambda: [Vector2D(v[0] * 2, v[1] * 2) for v in vectors],
+            lambda: vec_array * 2,
+        ),
+        "dot": (
+            lambda: [v[0] * shift[0] + v[1] * shift[1] for v in vectors],
+            lambda: vec_array.dot(shift),
+        ),
+        "norms": (
+            lambda: [math.hypot(v[0], v[1]) for v in vectors],
+            vec_array.norms,
+        ),
+    }
+
+    print(f"{POINTS} points")
+    print(f"{'operation':<12} | {'list':>9} | {'array':>9} | speedup")
+    for name, (on_list, on_array) in operations.items():
+        list_seconds, array_seconds = measure(on_list), measure(on_array)
+        print(
+            f"{name:<12} | {list_seconds * 1000:>7.1f}ms | "
+            f"{array_seconds * 1000:>7.1f}ms | {list_seconds / array_seconds:.1f}x"
+        )
+
+    vector_bytes = bytes_per_instance(lambda i: Vector2D(i, -i))
+    array_bytes = (
+        bytes_per_instance(lambda i: Vector2DArray.zeros(1000), count=1000) / 1000
+    )
+    print(f"memory per point: Vector2D {vector_bytes:.0f}B, array {array_bytes:.0f}B")
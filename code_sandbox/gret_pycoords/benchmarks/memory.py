@@ -0,0 +1,10 @@
+"""
+Module for measuring memory taken by single Vector2D
+
+Usage: python -m code_sandbox.gret_pycoords.benchmarks.memory
+"""
+from .. import Vector2D
+from ...utils.benchmarks.memory import bytes_per_instance
+
+if __name__ == "__main__":
+    print(f"Vector2D | {bytes_per_instance(lambda i: Vector2D(i, -i)):,.0f} bytes")
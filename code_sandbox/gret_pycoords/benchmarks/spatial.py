@@ -0,0 +1,66 @@
+"""
+Module for comparing GridIndex queries with brute force scans of all points
+
+Usage: python -m code_sandbox.gret_pycoords.benchmarks.spatial
+"""
+import heapq
+import math
+import random
+import time
+from typing import Callable, List, Tuple
+
+from .. import GridIndex
+
+random.seed(321322)
+
+SIZES = [10**4, 10**5, 10**6]
+QUERIES = 20
+K = 10
+RADIUS = 0.01
+
+
+def brute_nearest(points: List[Tuple[float, float]], query, k: int) -> List[int]:
+    return heapq.nsmallest(
+        k, range(len(points)), key=lambda i: math.dist(points[i], query)
+    )
+
+
+def brute_radius(points: List[Tuple[float, float]], query, radius: float) -> List[int]:
+    return [i for i, point in enumerate(points) if math.dist(point, query) <= radius]
+
+
+def per_query(
+    query_function: Callable[[Tuple[float, float]], object], queries
+) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        query_function(query)
+    return (time.perf_counter() - start) / len(queries)
+
+
+if __name__ == "__main__":
+    print(f"{'points':>8} | {'build':>7} | {'query':<7} | {'index':>9} | {'brute':>9}")
+    for size in SIZES:
+        points = [(random.random(), random.random()) for _ in range(size)]
+        queries = [(random.random(), random.random()) for _ in range(QUERIES)]
+
+        start = time.perf_counter()
+        index = GridIndex.from_points(points)
+        build = time.perf_counter() - start
+
+        comparisons = {
+            f"{K}-nn": (
+                lambda query: index.nearest(query, K),
+                lambda query: brute_nearest(points, query, K),
+            ),
+            "radius": (
+                lambda query: index.within_radius(query, RADIUS),
+                lambda query: brute_radius(points, query, RADIUS),
+            ),
+        }
+        for name, (with_index, brute_force) in comparisons.items():
+            print(
+                f"{size:>8} | {build:>6.2f}s | {name:<7} | "
+                f"{per_query(with_index, queries) * 1e6:>7.0f}us | "
+                f"{per_query(brute_force, queries) * 1e6:>7.0f}us"
+            )
@@ -0,0 +1,286 @@
+"""
+Spatial indexes module
+"""
+
+__all__ = [
+    "GridIndex",
+]
+
+import heapq
+import itertools
+import math
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .arrays import Vector2DArray
+
+Point = Tuple[float, float]
+Cell = Tuple[int, int]
+
+
+class GridIndex:
+    """
+    Spatial index of points kept in uniform grid of square cells. Queries visit only
+    the cells around queried area, so for reasonably spread points they take time
+    proportional to amount of points nearby, not to amount of all points.
+
+    Points are identified by keys - given on insert or generated as consecutive ints,
+    skipping ints already used as keys.
+    """
+
+    __slots__ = ("_cell_size", "_points", "_cells", "_bounds", "_keys")
+
+    _cell_size: float
+    _points: Dict[Hashable, Point]
+    _cells: Dict[Cell, Dict[Hashable, Point]]
+    # min and max cell coordinates ever occupied - they are not shrunk on removal
+    _bounds: Optional[List[int]]
+
+    def __init__(self, cell_size: float = 1.0) -> None:
+        if cell_size <= 0:
+            raise ValueError("Cell size has to be positive")
+
+        self._cell_size = float(cell_size)
+        self._points = {}
+        self._cells = {}
+        self._bounds = None
+        self._keys = itertools.count()
+
+    @classmethod
+    def from_points(
+        cls,
+        points: Iterable[Sequence[float]],
+        cell_size: Optional[float] = None,
+        points_per_cell: float = 2.0,
+    ) -> "GridIndex":
+        """
+        Index of points, keyed by their positions in points.
+
+        :param cell_size: Size of grid's cells, if not given it is chosen to have about
+            points per cell amount of points in each cell of points' bounding box
+        """
+        if isinstance(points, Vector2DArray):
+            pairs = list(zip(points.xs, points.ys))
+        else:
+            pairs = [(float(point[0]), float(point[1])) for point in points]
+
+        if cell_size is None:
+            cell_size = cls._fitting_cell_size(pairs, points_per_cell)
+
+        index = cls(cell_size)
+        index._insert_many(pairs)
+        return index
+
+    def _insert_many(self, pairs: List[Point]) -> None:
+        """Bulk insert of points under consecutive keys into empty index"""
+        size = self._cell_size
+        floor = math.floor
+        cells = self._cells
+        for key, point in enumerate(pairs):
+            cell = floor(point[0] / size), floor(point[1] / size)
+            cell_points = cells.get(cell)
+            if cell_points is None:
+                cells[cell] = {key: point}
+            else:
+                cell_points[key] = point
+
+        self._points = dict(enumerate(pairs))
+        self._keys = itertools.count(len(pairs))
+        if cells:
+            xs = [cx for cx, _ in cells]
+            ys = [cy for _, cy in cells]
+            self._bounds = [min(xs), min(ys), max(xs), max(ys)]
+
+    @staticmethod
+    def _fitting_cell_size(pairs: List[Point], points_per_cell: float) -> float:
+        if len(pairs) < 2:
+            return 1.0
+
+        xs = [x for x, _ in pairs]
+        ys = [y for _, y in pairs]
+        width, height = max(xs) - min(xs), max(ys) - min(ys)
+        area = width * height or max(width, height) ** 2
+        return math.sqrt(area * points_per_cell / len(pairs)) or 1.0
+
+    @property
+    def cell_size(self) -> float:
+        return self._cell_size
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._points
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._points)
+
+    def point(self, key: Hashable) -> Point:
+        return self._points[key]
+
+    def insert(
+        self, point: Sequence[float], key: Optional[Hashable] = None
+    ) -> Hashable:
+        """
+        Add point to the index, moving it if the key is already there
+
+        :return: Key of the point
+        """
+        if key is None:
+            # generated keys skip the ones given explicitly
+            key = next(self._keys)
+            while key in self._points:
+                key = next(self._keys)
+        elif key in self._points:
+            self.remove(key)
+
+        point = float(point[0]), float(point[1])
+        cell = self._cell_of(point)
+        self._points[key] = point
+        self._cells.setdefault(cell, {})[key] = point
+        self._extend_bounds(cell)
+        return key
+
+    def remove(self, key: Hashable) -> bool:
+        point = self._points.pop(key, None)
+        if point is None:
+            return False
+
+        cell = self._cell_of(point)
+        cell_points = self._cells[cell]
+        del cell_points[key]
+        if not cell_points:
+            del self._cells[cell]
+        return True
+
+    def nearest(
+        self, point: Sequence[float], k: int = 1
+    ) -> List[Tuple[Hashable, float]]:
+        """K nearest points' keys with distances, from the closest"""
+        if k <= 0 or not self._points:
+            return []
+
+        x, y = float(point[0]), float(point[1])
+        cx, cy = self._cell_of((x, y))
+        # max heap of k best candidates: (-squared distance, tiebreaker, key)
+        best: List[Tuple[float, int, Hashable]] = []
+        counter = itertools.count()
+
+        def consider(cell_points: Dict[Hashable, Point]) -> None:
+            for key, (px, py) in cell_points.items():
+                distance = (px - x) ** 2 + (py - y) ** 2
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, next(counter), key))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, next(counter), key))
+
+        max_ring = self._max_ring(cx, cy)
+        for ring in range(max_ring + 1):
+            if 8 * ring > len(self._cells):
+                # ring has more cells than the whole grid - scanning occupied cells
+                # of this and further rings is cheaper
+                for (px, py), cell_points in self._cells.items():
+                    if max(abs(px - cx), abs(py - cy)) >= ring:
+                        consider(cell_points)
+                break
+
+            for cell in self._ring(cx, cy, ring):
+                cell_points = self._cells.get(cell)
+                if cell_points:
+                    consider(cell_points)
+
+            # points in further rings are at least ring cells away
+            reach = ring * self._cell_size
+            if len(best) == k and -best[0][0] <= reach * reach:
+                break
+
+        return [
+            (key, math.sqrt(-distance))
+            for distance, _, key in sorted(best, reverse=True)
+        ]
+
+    def within_radius(self, center: Sequence[float], radius: float) -> List[Hashable]:
+        """Keys of points not further than radius from center, in no particular order"""
+        x, y = float(center[0]), float(center[1])
+        squared_radius = radius * radius
+        return [
+            key
+            for key, (px, py) in self._points_in_cells(
+                (x - radius, y - radius), (x + radius, y + radius)
+            )
+            if (px - x) ** 2 + (py - y) ** 2 <= squared_radius
+        ]
+
+    def within_box(
+        self, min_corner: Sequence[float], max_corner: Sequence[float]
+    ) -> List[Hashable]:
+        """Keys of points inside box, including its edges, in no particular order"""
+        min_x, min_y = float(min_corner[0]), float(min_corner[1])
+        max_x, max_y = float(max_corner[0]), float(max_corner[1])
+        return [
+            key
+            for key, (px, py) in self._points_in_cells((min_x, min_y), (max_x, max_y))
+            if min_x <= px <= max_x and min_y <= py <= max_y
+        ]
+
+    def _points_in_cells(
+        self, min_corner: Point, max_corner: Point
+    ) -> Iterator[Tuple[Hashable, Point]]:
+        """Points of all cells overlapping the box"""
+        if not self._points or min_corner[0] > max_corner[0]:
+            return
+
+        min_cx, min_cy = self._cell_of(min_corner)
+        max_cx, max_cy = self._cell_of(max_corner)
+        min_bx, min_by, max_bx, max_by = self._bounds
+        min_cx, min_cy = max(min_cx, min_bx), max(min_cy, min_by)
+        max_cx, max_cy = min(max_cx, max_bx), min(max_cy, max_by)
+        if min_cx > max_cx or min_cy > max_cy:
+            return
+
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(self._cells):
+            for (cx, cy), cell_points in self._cells.items():
+                if min_cx <= cx <= max_cx and min_cy <= cy <= max_cy:
+                    yield from cell_points.items()
+            return
+
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                cell_points = self._cells.get((cx, cy))
+                if cell_points:
+                    yield from cell_points.items()
+
+    def _cell_of(self, point: Point) -> Cell:
+        return (
+            math.floor(point[0] / self._cell_size),
+            math.floor(point[1] / self._cell_size),
+        )
+
+    def _extend_bounds(self, cell: Cell) -> None:
+        if self._bounds is None:
+            self._bounds = [cell[0], cell[1], cell[0], cell[1]]
+            return
+
+        bounds = self._bounds
+        bounds[0] = min(bounds[0], cell[0])
+        bounds[1] = min(bounds[1], cell[1])
+        bounds[2] = max(bounds[2], cell[0])
+        bounds[3] = max(bounds[3], cell[1])
+
+    def _max_ring(self, cx: int, cy: int) -> int:
+        """Ring around the cell, that reaches all occupied cells"""
+        min_bx, min_by, max_bx, max_by = self._bounds
+        return max(cx - min_bx, max_bx - cx, cy - min_by, max_by - cy, 0)
+
+    @staticmethod
+    def _ring(cx: int, cy: int, ring: int) -> Iterator[Cell]:
+        """Cells in Chebyshev distance of ring from the cell"""
+        if ring == 0:
+            yield cx, cy
+            return
+
+        for x in range(cx - ring, cx + ring + 1):
+            yield x, cy - ring
+            yield x, cy + ring
+        for y in range(cy - ring + 1, cy + ring):
+            yield cx - ring, y
+            yield cx + ring, y
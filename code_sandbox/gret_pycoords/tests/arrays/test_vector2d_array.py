@@ -0,0 +1,148 @@
+"""
+Vector2DArray testing module
+"""
+# pylint: disable-all
+import math
+
+import pytest
+
+from ... import Vector2D, Vector2DArray, Vector2DView
+
+
+@pytest.fixture
+def points():
+    return [(1.0, 2.0), (3.0, -4.0), (0.0, 0.0)]
+
+
+@pytest.fixture
+def vec_array(points):
+    return Vector2DArray(points)
+
+
+class TestConstruction:
+    def test_from_points_and_vectors(self, points):
+        vec_array = Vector2DArray([Vector2D(*points[0]), *points[1:]])
+        assert len(vec_array) == 3
+        assert vec_array == points
+
+    def test_empty(self):
+        assert len(Vector2DArray()) == 0
+        assert Vector2DArray() == []
+
+    def test_zeros(self):
+        assert Vector2DArray.zeros(2) == [(0, 0), (0, 0)]
+
+    def test_from_flat(self, vec_array):
+        assert Vector2DArray.from_flat([1, 2, 3, -4, 0, 0]) == vec_array
+        with pytest.raises(ValueError):
+            Vector2DArray.from_flat([1, 2, 3])
+
+    def test_points_need_two_coordinates(self):
+        with pytest.raises(ValueError):
+            Vector2DArray([(1, 2, 3)])
+
+    def test_append_and_extend(self, vec_array, points):
+        vec_array.append(Vector2D(5, 6))
+        vec_array.extend(Vector2DArray([(7, 8)]))
+        assert vec_array == points + [(5, 6), (7, 8)]
+
+
+class TestViews:
+    def test_items_are_vector_views(self, vec_array):
+        assert isinstance(vec_array[0], Vector2DView)
+        assert isinstance(vec_array[0], Vector2D)
+
+    def test_views_equal_to_vectors(self, vec_array):
+        assert vec_array[1] == Vector2D(3, -4)
+        assert Vector2D(3, -4) == vec_array[1]
+        assert vec_array[-1] == [0, 0]
+        assert vec_array[1][:] == [3, -4]
+
+    def test_writing_through_view(self, vec_array):
+        view = vec_array[1]
+        view[0] = 10
+        view[1:] = [20]
+        assert vec_array[1] == (10, 20)
+
+    def test_view_sees_array_changes(self, vec_array):
+        view = vec_array[0]
+        vec_array[0] = Vector2D(7, 7)
+        assert view == (7, 7)
+
+    def test_index_out_of_range(self, vec_array):
+        with pytest.raises(IndexError):
+            vec_array[3]
+        with pytest.raises(IndexError):
+            vec_array[-4] = (1, 1)
+
+    def test_slice_is_copy(self, vec_array):
+        sliced = vec_array[::2]
+        assert sliced == [(1, 2), (0, 0)]
+        sliced[0] = (9, 9)
+        assert vec_array[0] == (1, 2)
+
+    def test_to_vectors(self, vec_array, points):
+        vectors = vec_array.to_vectors()
+        assert vectors == points
+        assert not any(isinstance(vector, Vector2DView) for vector in vectors)
+
+
+class TestArithmetic:
+    def test_with_array(self, vec_array):
+        assert vec_array + vec_array == [(2, 4), (6, -8), (0, 0)]
+        assert vec_array - vec_array == Vector2DArray.zeros(3)
+        assert vec_array * vec_array == [(1, 4), (9, 16), (0, 0)]
+
+    def test_with_vector(self, vec_array):
+        assert vec_array + Vector2D(1, 1) == [(2, 3), (4, -3), (1, 1)]
+        assert (1, 1) - vec_array == [(0, -1), (-2, 5), (1, 1)]
+        assert vec_array / (2, 4) == [(0.5, 0.5), (1.5, -1), (0, 0)]
+
+    def test_with_number(self, vec_array):
+        assert 2 * vec_array == [(2, 4), (6, -8), (0, 0)]
+        assert vec_array / 2 == [(0.5, 1), (1.5, -2), (0, 0)]
+        assert -vec_array == [(-1, -2), (-3, 4), (0, 0)]
+
+    def test_lengths_must_match(self, vec_array):
+        with pytest.raises(ValueError):
+            vec_array + Vector2DArray([(1, 1)])
+
+    def test_unsupported_operand(self, vec_array):
+        with pytest.raises(TypeError):
+            vec_array + "text"
+        with pytest.raises(TypeError):
+            vec_array.dot(None)
+
+
+class TestProducts:
+    def test_dot(self, vec_array):
+        assert list(vec_array.dot((1, 1))) == [3, -1, 0]
+        assert list(vec_array.dot(vec_array)) == [5, 25, 0]
+
+    def test_cross(self, vec_array):
+        assert list(vec_array.cross((1, 0))) == [-2, 4, 0]
+        assert list(vec_array.cross(vec_array)) == [0, 0, 0]
+
+    def test_norms(self, vec_array):
+        assert list(vec_array.norms()) == [math.sqrt(5), 5, 0]
+
+    def test_normalized(self, vec_array):
+        expected = Vector2DArray(
+            [(1 / math.sqrt(5), 2 / math.sqrt(5)), (0.6, -0.8), (0, 0)]
+        )
+        assert vec_array.normalized().isclose(expected) == [True] * 3
+
+
+class TestComparison:
+    def test_element_wise_equality(self, vec_array):
+        assert vec_array.equal((0, 0)) == [False, False, True]
+        assert vec_array.equal(vec_array) == [True] * 3
+
+    def test_isclose(self, vec_array):
+        shifted = vec_array + 1e-12
+        assert shifted != vec_array
+        assert shifted.isclose(vec_array, abs_tol=1e-9) == [True] * 3
+
+    def test_not_equal_to_other_types(self, vec_array):
+        assert vec_array != 0
+        assert vec_array != [(1, 2)]
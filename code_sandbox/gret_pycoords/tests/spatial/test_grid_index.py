@@ -0,0 +1,110 @@
+"""
+GridIndex testing module
+"""
+# pylint: disable-all
+import math
+import random
+
+import pytest
+
+from ... import GridIndex, Vector2D, Vector2DArray
+
+
+@pytest.fixture
+def points():
+    rng = random.Random(321322)
+    # dense cluster and a few outliers far away
+    return [(rng.gauss(0, 1), rng.gauss(0, 1)) for _ in range(500)] + [
+        (100, 100),
+        (-250, 30),
+        (0, 1000),
+    ]
+
+
+@pytest.fixture
+def index(points):
+    return GridIndex.from_points(points)
+
+
+def brute_nearest(points, query, k):
+    distances = sorted(
+        (math.dist(point, query), key) for key, point in enumerate(points)
+    )
+    return [(key, distance) for distance, key in distances[:k]]
+
+
+class TestQueries:
+    @pytest.mark.parametrize("query", [(0, 0), (0.3, -1.7), (50, 50), (-1000, 0)])
+    @pytest.mark.parametrize("k", [1, 5, 50])
+    def test_nearest_matches_brute_force(self, index, points, query, k):
+        found = index.nearest(query, k)
+        expected = brute_nearest(points, query, k)
+        assert [distance for _, distance in found] == pytest.approx(
+            [distance for _, distance in expected]
+        )
+
+    def test_nearest_more_than_all(self, index, points):
+        assert len(index.nearest((0, 0), k=1000)) == len(points)
+
+    @pytest.mark.parametrize("radius", [0, 0.5, 2, 150])
+    def test_within_radius(self, index, points, radius):
+        query = (0.5, 0.5)
+        expected = {
+            key for key, point in enumerate(points) if math.dist(point, query) <= radius
+        }
+        assert set(index.within_radius(query, radius)) == expected
+
+    def test_within_box(self, index, points):
+        expected = {
+            key
+            for key, (x, y) in enumerate(points)
+            if -1 <= x <= 0.5 and -300 <= y <= 0
+        }
+        assert set(index.within_box((-1, -300), (0.5, 0))) == expected
+
+    def test_empty_index(self):
+        index = GridIndex()
+        assert index.nearest((0, 0)) == []
+        assert index.within_radius((0, 0), 10) == []
+        assert index.within_box((0, 0), (1, 1)) == []
+
+
+class TestUpdates:
+    def test_insert_and_remove(self):
+        index = GridIndex(cell_size=2)
+        first = index.insert(Vector2D(1, 1))
+        second = index.insert((5, 5))
+        assert len(index) == 2
+        assert index.nearest((4, 4)) == [(second, math.sqrt(2))]
+
+        assert index.remove(second)
+        assert not index.remove(second)
+        assert second not in index
+        assert index.nearest((4, 4)) == [(first, math.sqrt(18))]
+
+    def test_custom_keys_move_points(self):
+        index = GridIndex()
+        index.insert((0, 0), key="a")
+        index.insert((10, 10), key="a")
+        assert len(index) == 1
+        assert index.point("a") == (10, 10)
+        assert index.within_radius((0, 0), 1) == []
+
+    def test_generated_keys_skip_given_ones(self):
+        index = GridIndex.from_points([(0, 0), (1, 1)])
+        assert index.insert((50, 50), key=2) == 2
+        key = index.insert((9, 9))
+        assert key == 3
+        assert index.point(2) == (50, 50)
+        assert index.remove(2)
+        assert index.nearest((50, 50)) == [(key, math.dist((9, 9), (50, 50)))]
+        assert index.within_box((40, 40), (60, 60)) == []
+
+    def test_from_vector_array(self, points):
+        index = GridIndex.from_points(Vector2DArray(points), cell_size=0.5)
+        assert len(index) == len(points)
+        assert index.point(500) == points[500]
+
+    def test_cell_size_must_be_positive(self):
+        with pytest.raises(ValueError):
+            GridIndex(0)
@@ -0,0 +1,110 @@
+"""
+Vector2D arithmetic testing module
+"""
+# pylint: disable-all
+import math
+
+import pytest
+
+from ... import FrozenVector2D, Vector2D, Vector2DArray
+
+
+class TestArithmetic:
+    def test_adding(self, vec2d):
+        assert vec2d + Vector2D(1, 1) == [2.2, -1.1]
+        assert vec2d + (1, 1) == [2.2, -1.1]
+        assert [1, 1] + vec2d == [2.2, -1.1]
+
+    def test_subtracting(self, vec2d):
+        assert vec2d - vec2d == [0, 0]
+        assert (1, 1) - Vector2D(1, 2) == [0, -1]
+
+    def test_scaling(self, vec2d):
+        assert vec2d * 2 == [2.4, -4.2]
+        assert 2 * vec2d == [2.4, -4.2]
+        assert Vector2D(3, -6) / 3 == [1, -2]
+
+    def test_dot_product(self):
+        assert Vector2D(1, 2) @ Vector2D(3, 4) == 11
+        assert (3, 4) @ Vector2D(1, 2) == 11
+
+    def test_negation_and_length(self):
+        assert -Vector2D(3, -4) == [-3, 4]
+        assert abs(Vector2D(3, -4)) == 5
+
+    def test_results_are_new_vectors(self, vec2d, args2d):
+        result = vec2d + (0, 0)
+        assert type(result) is Vector2D
+        assert result is not vec2d
+        assert vec2d == args2d
+
+    def test_unsupported_operands(self, vec2d):
+        with pytest.raises(TypeError):
+            vec2d + 1
+        with pytest.raises(TypeError):
+            vec2d + (1, 2, 3)
+        with pytest.raises(TypeError):
+            vec2d * vec2d
+        with pytest.raises(TypeError):
+            vec2d @ "ab"
+
+    def test_array_operand_handled_by_array(self, vec2d):
+        vec_array = Vector2DArray([(0, 0), (1, 1)])
+        assert vec2d + vec_array == [vec2d, vec2d + (1, 1)]
+
+
+class TestInPlaceArithmetic:
+    def test_mutates_vector(self, vec2d):
+        vector = vec2d
+        vector += (1, 1)
+        vector -= Vector2D(0, 1)
+        vector *= 2
+        vector /= 4
+        assert vector is vec2d
+        assert vector == [1.1, -1.05]
+
+    def test_writes_through_array_view(self):
+        vec_array = Vector2DArray([(1, 2)])
+        view = vec_array[0]
+        view += (1, 1)
+        assert vec_array == [(2, 3)]
+        assert type(view + (0, 0)) is Vector2D
+
+
+class TestFastConstruction:
+    def test_from_floats(self):
+        vector = Vector2D._from_floats(1.5, -2.0)
+        assert type(vector) is Vector2D
+        assert vector == [1.5, -2.0]
+
+    def test_floats_and_other_args_give_same_vectors(self):
+        assert Vector2D(1.0, 2.0) == Vector2D(1, "2") == Vector2D(1.0, 2.0, 3.0)
+        assert type(Vector2D(True, 2.0)[0]) is float
+
+
+class TestFrozenVector2D:
+    def test_hashable(self):
+        vectors = {FrozenVector2D(1, 2): "a"}
+        assert vectors[FrozenVector2D(1.0, 2.0)] == "a"
+        assert hash(FrozenVector2D(1, 2)) == hash((1.0, 2.0))
+
+    def test_mutable_vectors_not_hashable(self, vec2d):
+        with pytest.raises(TypeError):
+            hash(vec2d)
+
+    def test_item_assignment_forbidden(self):
+        vector = FrozenVector2D(1, 2)
+        with pytest.raises(TypeError):
+            vector[0] = 3
+
+    def test_in_place_operators_return_new_vectors(self):
+        vector = original = FrozenVector2D(1, 2)
+        vector += (1, 1)
+        vector *= 2
+        assert original == [1, 2]
+        assert vector == [4, 6]
+        assert type(vector) is FrozenVector2D
+
+    def test_equal_to_mutable_vector(self):
+        assert FrozenVector2D(1, 2) == Vector2D(1, 2)
+        assert math.isclose(abs(FrozenVector2D(3, 4)), 5)
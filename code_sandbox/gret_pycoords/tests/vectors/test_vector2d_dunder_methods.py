@@ -2,6 +2,8 @@
 Vector2D dunder methods testing module
 """
 # pylint: disable-all
+import pytest
+
 from ... import Vector2D
 
 
@@ -128,3 +130,14 @@ class TestEquality:
         assert Vector2D() != [0]
         assert Vector2D() != 0
         assert Vector2D() != 0.0
+
+
+class TestMemoryLayout:
+    def test_no_instance_dict(self, vec2d):
+        assert not hasattr(vec2d, "__dict__")
+
+    def test_index_out_of_range(self, vec2d):
+        with pytest.raises(IndexError):
+            vec2d[2]
+        assert list(vec2d) == vec2d[:]
+        assert vec2d[-1] == vec2d[1]
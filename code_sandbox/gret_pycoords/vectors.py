@@ -4,35 +4,73 @@ Vectors module
 
 __all__ = [
     "Vector2D",
+    "FrozenVector2D",
 ]
 
-from typing import Any, List, Sequence, Sized, Union
+import math
+from numbers import Real
+from typing import Any, List, Optional, Sequence, Sized, Tuple, Union
 
 from .. import utils
 
 
+def _is_number(value: Any) -> bool:
+    # checking against Real ABC is slow, most of the time value is int or float
+    return type(value) is float or type(value) is int or isinstance(value, Real)
+
+
 class Vector2D:
     """
     Vector class for 2 dimensional space
     """
 
-    _data: List[float]
+    __slots__ = ("_x", "_y")
+
+    _x: float
+    _y: float
 
     def __init__(self, *args: float) -> None:
 
-        self._data = utils.turn_into_floats(*args, output_count=len(self))
+        if len(args) == 2 and type(args[0]) is float and type(args[1]) is float:
+            self._x, self._y = args
+            return
+
+        self._x, self._y = utils.turn_into_floats(*args, output_count=len(self))
+
+    @classmethod
+    def _from_floats(cls, x: float, y: float) -> "Vector2D":
+        """Fast constructor for coordinates, that are floats already"""
+        vector = cls.__new__(cls)
+        vector._x = x
+        vector._y = y
+        return vector
 
-    def __getitem__(self, idx: int) -> float:
-        return self._data.__getitem__(idx)
+    def _new(self, x: float, y: float) -> "Vector2D":
+        """Vector of the same kind, for results of arithmetic"""
+        vector = object.__new__(type(self))
+        vector._x = x
+        vector._y = y
+        return vector
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[float, List[float]]:
+        if isinstance(idx, slice):
+            return [self._x, self._y][idx]
+        if idx in (0, -2):
+            return self._x
+        if idx in (1, -1):
+            return self._y
+        raise IndexError("Vector2D index out of range")
 
     def __setitem__(self, key: Union[int, slice], value: Any):
+        data = [self._x, self._y]
         if isinstance(key, slice):
-            slice_len = len(self._data[key])
+            slice_len = len(data[key])
             value = utils.turn_into_floats(*value, output_count=slice_len)
         else:
             value = float(value)
 
-        self._data.__setitem__(key, value)
+        data.__setitem__(key, value)
+        self._x, self._y = data
 
     def __len__(self):
         return 2
@@ -45,3 +83,112 @@ class Vector2D:
             return False
 
         return all(self[i] == other[i] for i in range(len(self)))
+
+    def __add__(self, other: Sequence[float]) -> "Vector2D":
+        coordinates = self._coordinates(other)
+        if coordinates is None:
+            return NotImplemented
+        return self._new(self._x + coordinates[0], self._y + coordinates[1])
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Sequence[float]) -> "Vector2D":
+        coordinates = self._coordinates(other)
+        if coordinates is None:
+            return NotImplemented
+        return self._new(self._x - coordinates[0], self._y - coordinates[1])
+
+    def __rsub__(self, other: Sequence[float]) -> "Vector2D":
+        coordinates = self._coordinates(other)
+        if coordinates is None:
+            return NotImplemented
+        return self._new(coordinates[0] - self._x, coordinates[1] - self._y)
+
+    def __mul__(self, scalar: float) -> "Vector2D":
+        if not _is_number(scalar):
+            return NotImplemented
+        return self._new(self._x * scalar, self._y * scalar)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar: float) -> "Vector2D":
+        if not _is_number(scalar):
+            return NotImplemented
+        return self._new(self._x / scalar, self._y / scalar)
+
+    def __matmul__(self, other: Sequence[float]) -> float:
+        """Dot product"""
+        coordinates = self._coordinates(other)
+        if coordinates is None:
+            return NotImplemented
+        return self._x * coordinates[0] + self._y * coordinates[1]
+
+    __rmatmul__ = __matmul__
+
+    def __neg__(self) -> "Vector2D":
+        return self._new(-self._x, -self._y)
+
+    def __abs__(self) -> float:
+        return math.hypot(self._x, self._y)
+
+    def __iadd__(self, other: Sequence[float]) -> "Vector2D":
+        coordinates = self._coordinates(other)
+        if coordinates is None:
+            return NotImplemented
+        self._x += coordinates[0]
+        self._y += coordinates[1]
+        return self
+
+    def __isub__(self, other: Sequence[float]) -> "Vector2D":
+        coordinates = self._coordinates(other)
+        if coordinates is None:
+            return NotImplemented
+        self._x -= coordinates[0]
+        self._y -= coordinates[1]
+        return self
+
+    def __imul__(self, scalar: float) -> "Vector2D":
+        if not _is_number(scalar):
+            return NotImplemented
+        self._x *= scalar
+        self._y *= scalar
+        return self
+
+    def __itruediv__(self, scalar: float) -> "Vector2D":
+        if not _is_number(scalar):
+            return NotImplemented
+        self._x /= scalar
+        self._y /= scalar
+        return self
+
+    @staticmethod
+    def _coordinates(other: Any) -> Optional[Tuple[float, float]]:
+        """Coordinates of other vector, None if it is not a vector"""
+        if isinstance(other, Vector2D):
+            return other._x, other._y
+        try:
+            if len(other) != 2:
+                return None
+            return float(other[0]), float(other[1])
+        except (TypeError, ValueError):
+            return None
+
+
+class FrozenVector2D(Vector2D):
+    """
+    Immutable Vector2D, that can be hashed - e.g. used as dict key. In-place operators
+    return new vectors.
+    """
+
+    __slots__ = ()
+
+    def __setitem__(self, key: Union[int, slice], value: Any):
+        raise TypeError("FrozenVector2D does not support item assignment")
+
+    def __hash__(self) -> int:
+        return hash((self._x, self._y))
+
+    __iadd__ = Vector2D.__add__
+    __isub__ = Vector2D.__sub__
+    __imul__ = Vector2D.__mul__
+    __itruediv__ = Vector2D.__truediv__
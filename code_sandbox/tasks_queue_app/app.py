@@ -1,30 +1,199 @@
+import asyncio
+import collections
+import collections.abc
+import concurrent.futures
 import enum
-import time
-from typing import Any, Dict, Iterable
+import heapq
+import itertools
+import threading
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from . import src
+from .. import utils
 
 
 class App:
     _event_pool: Dict[enum.Enum, Any]
     _task_pool: src.TaskPool
 
+    _clock: src.Clock
     _start_time: float
+    _executor: Optional[concurrent.futures.Executor]
+    _log_sink: Optional[src.LogSink]
 
-    def __init__(self) -> None:
-        self._event_pool = src.create_event_pool()
-        self._task_pool = src.TaskPool()
+    _timers: List[Tuple[float, int, src.Task, src.Worker]]
+    _running_payloads: int
+    _finished_payloads: Deque[Tuple[src.Task, src.Worker]]
+    _wakeup: threading.Event
 
-        self._start_time = time.time()
-        self._event_pool[src.EntityEvents.Log].attach(self.print_log)
+    # feeds with their high water marks
+    _feeds: Deque[Tuple[Iterator[src.Task], int]]
+
+    def __init__(
+        self,
+        executor: Optional[concurrent.futures.Executor] = None,
+        weak_subscriptions: bool = False,
+        clock: Optional[src.Clock] = None,
+        task_pool: Optional[src.TaskPool] = None,
+        task_distribution: Optional[utils.EventDistribution] = None,
+    ) -> None:
+        """
+        :param executor: Executor running tasks' payloads, given to every added Worker
+            that has no executor of its own. Use thread pool for I/O bound payloads and
+            process pool for CPU bound ones.
+        :param weak_subscriptions: Do not keep added entities alive - the ones dropped
+            without `remove_entities` are unsubscribed automatically
+        :param clock: Clock shared by app and all added entities, wall clock by default.
+            With `VirtualClock`, `run_scheduled` jumps straight to the next task's finish
+            time instead of sleeping - runs are deterministic and as fast as possible.
+        :param task_pool: Pool of loaded tasks, new TaskPool if not given. Done tasks
+            are recorded in the journal of JournaledTaskPool.
+        :param task_distribution: Strategy choosing which of waiting workers gets
+            disposed task, e.g. ShortestExpectedTimeDistribution. The last queued worker
+            gets it if not given.
+        """
+        self._event_pool = src.create_event_pool(weak_subscriptions, task_distribution)
+        self._task_pool = src.TaskPool() if task_pool is None else task_pool
+        self._executor = executor
+        self._clock = src.WALL_CLOCK if clock is None else clock
+
+        self._start_time = self._clock.now()
+        self._timers = []
+        self._timers_counter = itertools.count()
+        self._finished_tasks = 0
+        self._running_payloads = 0
+        self._finished_payloads = collections.deque()
+        self._wakeup = threading.Event()
+        self._feeds = collections.deque()
+
+        self._log_sink = None
+        self.log_sink = src.TextLogSink(start_time=self._start_time)
+        self._event_pool[src.EntityEvents.TaskStarted].attach(self.schedule_task)
+        if isinstance(self._task_pool, src.JournaledTaskPool):
+            self._event_pool[src.EntityEvents.TaskDone].attach(
+                self._task_pool.journal.on_task_done
+            )
+        if isinstance(task_distribution, src.TaskDistribution):
+            task_distribution.subscribe(self._event_pool)
+
+    @property
+    def log_sink(self) -> Optional[src.LogSink]:
+        """Sink of entities' logs. Without sink, log records are not even created."""
+        return self._log_sink
+
+    @log_sink.setter
+    def log_sink(self, sink: Optional[src.LogSink]) -> None:
+        if self._log_sink is not None:
+            self._event_pool[src.EntityEvents.Log].detach(self._log_sink.write)
+        self._log_sink = sink
+        if sink is not None:
+            self._event_pool[src.EntityEvents.Log].attach(sink.write)
+
+    def print_log(self, message: str) -> None:
+        """Print message with time since app's start, as the default log sink does"""
+        print(f"Time: {self._clock.now() - self._start_time:.2f}s | {message}")
+
+    @property
+    def clock(self) -> src.Clock:
+        return self._clock
+
+    @property
+    def task_pool(self) -> src.TaskPool:
+        return self._task_pool
+
+    @property
+    def event_pool(self) -> Dict[src.EntityEvents, utils.Event]:
+        """Events of the app's entities, e.g. to follow done tasks"""
+        return self._event_pool
+
+    def enable_profiling(self) -> None:
+        """Record call counts and latencies of events and of their subscribers"""
+        for event in self._event_pool.values():
+            if not isinstance(event.event_distribution, utils.InstrumentedDistribution):
+                event.event_distribution = utils.InstrumentedDistribution(
+                    event.event_distribution
+                )
+
+    def disable_profiling(self) -> None:
+        for event in self._event_pool.values():
+            if isinstance(event.event_distribution, utils.InstrumentedDistribution):
+                event.event_distribution = event.event_distribution.distribution
+
+    def profile_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Stats of every event, for which profiling is enabled, by event's name"""
+        return {
+            event_type.name: event.event_distribution.stats.snapshot()
+            for event_type, event in self._event_pool.items()
+            if isinstance(event.event_distribution, utils.InstrumentedDistribution)
+        }
 
     def run(self) -> None:
+        """
+        Single update of entities. Only active entities are updated - workers of done
+        tasks are woken up by the app before the update.
+        """
+        if self._feeds:
+            self._top_up()
+        self._collect_finished_payloads()
+        self._pop_finished_timers()
         self._event_pool[src.EntityEvents.Update]()
         self._event_pool[src.EntityEvents.AfterUpdate]()
         self._event_pool[src.EntityEvents.GetTask](self._task_pool)
 
+    def run_scheduled(self, stop_when_idle: bool = False) -> None:
+        """
+        Event driven alternative for calling `run` in a loop. App runs only as many
+        updates as needed for tasks distribution to settle, then sleeps until the closest
+        finish time of started tasks or until new tasks are loaded.
+
+        :param stop_when_idle: Return when no task is in progress and nothing else can
+            change. Otherwise, app waits for new tasks to be loaded.
+        """
+        while True:
+            if self.run_step():
+                continue
+
+            if stop_when_idle:
+                return
+
+            self._clock.wait(self._wakeup)
+
+    def run_step(self) -> bool:
+        """
+        Single iteration of `run_scheduled` - settles tasks distribution and, if some
+        task is in progress, waits for the closest finish time or for new tasks.
+
+        :return: False if app is idle - no task is in progress
+        """
+        self._wakeup.clear()
+        self._collect_finished_payloads()
+        self._run_until_settled()
+        if self._pop_finished_timers():
+            return True
+
+        if not self._tasks_in_progress:
+            return False
+
+        self._clock.wait(self._wakeup, self._next_timer_deadline())
+        return True
+
     def add_entities(self, *entities_: src.Entity) -> None:
         for entity in entities_:
+            if isinstance(entity, src.Worker) and entity.executor is None:
+                entity.executor = self._executor
+            entity.clock = self._clock
             entity.subscribe(self._event_pool)
 
     def remove_entities(self, *entities_: src.Entity) -> None:
@@ -32,7 +201,209 @@ class App:
             entity.unsubscribe()
 
     def load_tasks(self, tasks_iterable: Iterable[src.Task]) -> None:
-        self._task_pool.put(*tasks_iterable)
+        self._task_pool.extend(tasks_iterable)
+        self._wakeup.set()
 
-    def print_log(self, message: str) -> None:
-        print(f"Time: {time.time() - self._start_time:.2f}s | {message}")
+    def feed_tasks(
+        self, tasks_iterable: Iterable[src.Task], high_water: int = 1024
+    ) -> None:
+        """
+        Load tasks lazily - on every run, task pool is topped up from the iterable until
+        it holds high water amount of tasks, so memory use does not depend on the
+        iterable's length. Iterables fed one after another are consumed in that order.
+
+        :param high_water: Maximum amount of tasks kept in task pool, while tasks are
+            pulled from this iterable
+        """
+        self._feeds.append((iter(tasks_iterable), high_water))
+        self._wakeup.set()
+
+    def schedule_task(self, worker: src.Worker, task: src.Task) -> None:
+        worker.expect_wakeup()
+        if task.future is None or task.future.done():
+            self._push_timer(task, worker)
+            return
+
+        # payload's finish time is unknown - its future wakes the app up when done
+        self._running_payloads += 1
+        task.future.add_done_callback(lambda _: self._on_payload_done(task, worker))
+
+    def _top_up(self) -> None:
+        while self._feeds:
+            feed, high_water = self._feeds[0]
+            missing = high_water - len(self._task_pool)
+            if missing <= 0:
+                return
+
+            tasks = list(itertools.islice(feed, missing))
+            self._task_pool.extend(tasks)
+            if len(tasks) < missing:
+                self._feeds.popleft()
+
+    def _push_timer(self, task: src.Task, worker: src.Worker) -> None:
+        heapq.heappush(
+            self._timers, (task.finish_time, next(self._timers_counter), task, worker)
+        )
+
+    def _on_payload_done(self, task: src.Task, worker: src.Worker) -> None:
+        # called from executor's thread
+        self._finished_payloads.append((task, worker))
+        self._wakeup.set()
+
+    def _collect_finished_payloads(self) -> None:
+        while self._finished_payloads:
+            self._running_payloads -= 1
+            self._push_timer(*self._finished_payloads.popleft())
+
+    def _run_until_settled(self) -> None:
+        previous_state, state = None, self._distribution_state()
+        while previous_state != state:
+            self.run()
+            previous_state, state = state, self._distribution_state()
+
+    def _distribution_state(self) -> Tuple[int, int, int, int]:
+        """Values changing every time any task is collected, disposed or finished"""
+        return (
+            len(self._task_pool),
+            len(self._event_pool[src.EntityEvents.DisposeTask]),
+            self._tasks_in_progress,
+            self._finished_tasks,
+        )
+
+    @property
+    def _tasks_in_progress(self) -> int:
+        return len(self._timers) + self._running_payloads
+
+    def _pop_finished_timers(self) -> bool:
+        """Wake up workers of done tasks"""
+        popped = False
+        while self._timers and self._timers[0][2].is_done:
+            heapq.heappop(self._timers)[3].request_update()
+            self._finished_tasks += 1
+            popped = True
+        return popped
+
+    def _next_timer_deadline(self) -> Optional[float]:
+        if not self._timers:
+            return None
+
+        return self._timers[0][0]
+
+
+class AsyncApp(App):
+    """
+    App running on asyncio event loop. Coroutine subscribers of events are awaited
+    concurrently and tasks' completion is signalled by loop's timers and payloads'
+    futures, so Workers are updated only when their tasks are done.
+
+    Loop's timers run in real time, so this app always uses the wall clock.
+    """
+
+    _wakeup: asyncio.Event
+    _in_progress: int
+
+    def __init__(
+        self,
+        executor: Optional[concurrent.futures.Executor] = None,
+        weak_subscriptions: bool = False,
+        task_pool: Optional[src.TaskPool] = None,
+        task_distribution: Optional[utils.EventDistribution] = None,
+    ) -> None:
+        super().__init__(
+            executor,
+            weak_subscriptions,
+            task_pool=task_pool,
+            task_distribution=task_distribution,
+        )
+        self._wakeup = asyncio.Event()
+        self._in_progress = 0
+
+    _feeds: Deque[Tuple[Union[Iterator[src.Task], AsyncIterator[src.Task]], int]]
+
+    async def run(self) -> None:
+        if self._feeds:
+            await self._top_up_async()
+        await self._event_pool[src.EntityEvents.Update].call_async()
+        await self._event_pool[src.EntityEvents.AfterUpdate].call_async()
+        await self._event_pool[src.EntityEvents.GetTask].call_async(self._task_pool)
+
+    async def run_scheduled(self, stop_when_idle: bool = False) -> None:
+        while True:
+            if await self.run_step():
+                continue
+
+            if stop_when_idle:
+                return
+
+            await self._wakeup.wait()
+
+    async def run_step(self) -> bool:
+        self._wakeup.clear()
+        await self._run_until_settled()
+        if not self._tasks_in_progress:
+            return False
+
+        await self._wakeup.wait()
+        return True
+
+    def feed_tasks(
+        self,
+        tasks_iterable: Union[Iterable[src.Task], AsyncIterable[src.Task]],
+        high_water: int = 1024,
+    ) -> None:
+        """Same as `App.feed_tasks`, but accepts async iterables too"""
+        if isinstance(tasks_iterable, collections.abc.AsyncIterable):
+            self._feeds.append((aiter(tasks_iterable), high_water))
+            self._wakeup.set()
+            return
+
+        super().feed_tasks(tasks_iterable, high_water)
+
+    def schedule_task(self, worker: src.Worker, task: src.Task) -> None:
+        worker.expect_wakeup()
+        self._in_progress += 1
+        if task.future is None or task.future.done():
+            self._schedule_finish(task, worker)
+            return
+
+        asyncio.wrap_future(task.future).add_done_callback(
+            lambda _: self._schedule_finish(task, worker)
+        )
+
+    def _schedule_finish(self, task: src.Task, worker: src.Worker) -> None:
+        delay = max(0.0, task.finish_time - self._clock.now())
+        asyncio.get_running_loop().call_later(delay, self._finish, task, worker)
+
+    def _finish(self, task: src.Task, worker: src.Worker) -> None:
+        # loop's clock may be slightly ahead of task's one
+        if not task.is_done:
+            self._schedule_finish(task, worker)
+            return
+
+        self._in_progress -= 1
+        worker.request_update()
+        self._wakeup.set()
+
+    async def _top_up_async(self) -> None:
+        while self._feeds and len(self._task_pool) < self._feeds[0][1]:
+            feed = self._feeds[0][0]
+            try:
+                if isinstance(feed, collections.abc.AsyncIterator):
+                    task = await anext(feed)
+                else:
+                    task = next(feed)
+            except (StopIteration, StopAsyncIteration):
+                self._feeds.popleft()
+                continue
+
+            self._task_pool.put(task)
+
+    async def _run_until_settled(self) -> None:
+        previous_state, state = None, self._distribution_state()
+        while previous_state != state:
+            await self.run()
+            previous_state, state = state, self._distribution_state()
+
+    @property
+    def _tasks_in_progress(self) -> int:
+        return self._in_progress
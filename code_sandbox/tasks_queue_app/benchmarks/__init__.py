@@ -0,0 +1,3 @@
+"""
+tasks queue benchmarks package - run modules with `python -m`
+"""
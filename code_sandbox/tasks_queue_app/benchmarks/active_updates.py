@@ -0,0 +1,72 @@
+"""
+Module for comparing cost of app's ticks with idle entities suspended and with all
+entities updated on every tick
+
+Usage: python -m code_sandbox.tasks_queue_app.benchmarks.active_updates
+"""
+import random
+import time
+from typing import Type
+
+from .. import app
+
+random.seed(321322)
+
+WORKERS = (100, 1_000, 10_000)
+MANAGERS = 4
+TICKS = 1_000
+
+
+class AlwaysActiveWorker(app.src.Worker):
+    needs_update = True
+
+
+class AlwaysActiveManager(app.src.Manager):
+    needs_update = True
+
+
+def measure(
+    workers: int,
+    worker_class: Type[app.src.Worker],
+    manager_class: Type[app.src.Manager],
+) -> float:
+    """
+    Tasks take from 1 to 10 seconds and virtual clock advances 10ms every tick, so at
+    any time only few workers finish their tasks
+
+    :return: Microseconds per tick
+    """
+    main_app = app.App(clock=app.src.VirtualClock())
+    main_app.log_sink = None
+    tasks = [app.src.Task(f"Task nr {i}") for i in range(10 * workers)]
+    for task in tasks:
+        task.seconds_to_finish = random.uniform(1, 10)
+    main_app.load_tasks(tasks)
+    main_app.add_entities(*(worker_class(f"Worker nr {i}") for i in range(workers)))
+    for i in range(MANAGERS):
+        manager = manager_class(f"Manager nr {i}")
+        manager.max_queued_tasks = workers // MANAGERS
+        manager.batch_mode = True
+        main_app.add_entities(manager)
+
+    # all workers get their first tasks
+    for _ in range(3):
+        main_app.run()
+
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        main_app.clock.advance(0.01)
+        main_app.run()
+    return (time.perf_counter() - start) / TICKS * 1e6
+
+
+if __name__ == "__main__":
+    print(f"{TICKS} ticks of 10ms, {MANAGERS} managers, tasks of 1-10s")
+    print(f"{'workers':>8} | {'all updated':>12} | {'active only':>12} | speedup")
+    for workers in WORKERS:
+        everyone = measure(workers, AlwaysActiveWorker, AlwaysActiveManager)
+        active = measure(workers, app.src.Worker, app.src.Manager)
+        print(
+            f"{workers:>8} | {everyone:>10.1f}us | {active:>10.1f}us | "
+            f"{everyone / active:.1f}x"
+        )
@@ -0,0 +1,160 @@
+"""
+Module for comparing strategies of DisposeTask distribution - total completion time
+and tail latency of seeded workloads, simulated with virtual clock
+
+Usage: python -m code_sandbox.tasks_queue_app.benchmarks.distributions
+"""
+import collections
+import random
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .simulation import percentiles
+from .. import app
+from ... import utils
+
+SEED = 321322
+TASKS = 5_000
+MANAGERS = 4
+# amounts of workers of given speed
+WORKER_SPEEDS = {2.0: 4, 1.0: 8, 0.5: 4}
+# ratios of arriving work to workers' capacity, None for all tasks arriving at once
+UTILIZATIONS = (None, 0.5, 0.8, 0.95)
+
+Strategy = Tuple[Optional[utils.EventDistribution], Optional[app.src.TaskPool]]
+
+
+def shortest_first() -> app.src.TaskPool:
+    return app.src.TaskPool(key=lambda task: task.seconds_to_finish)
+
+
+# distribution of tasks and pool of loaded tasks
+STRATEGIES: Dict[str, Callable[[], Strategy]] = {
+    "last queued": lambda: (None, None),
+    "round robin": lambda: (app.src.RoundRobinDistribution(), None),
+    "least loaded": lambda: (app.src.LeastLoadedDistribution(), None),
+    "shortest expected time": lambda: (
+        app.src.ShortestExpectedTimeDistribution(),
+        None,
+    ),
+    "SET + shortest first": lambda: (
+        app.src.ShortestExpectedTimeDistribution(),
+        shortest_first(),
+    ),
+}
+
+Arrival = Tuple[float, app.src.Task]
+
+
+class ArrivalsClock(app.src.VirtualClock):
+    """Virtual clock loading tasks into its app at their arrival times"""
+
+    app: Optional[app.App]
+    _arrivals: "collections.deque[Arrival]"
+
+    def __init__(self, arrivals: List[Arrival]) -> None:
+        super().__init__()
+        self.app = None
+        self._arrivals = collections.deque(arrivals)
+
+    def arrive(self) -> bool:
+        """
+        Jump to the next arrival time and load all tasks arriving then
+
+        :return: False if all tasks have arrived already
+        """
+        if not self._arrivals:
+            return False
+
+        self.advance(self._arrivals[0][0] - self.now())
+        tasks = []
+        while self._arrivals and self._arrivals[0][0] <= self.now():
+            tasks.append(self._arrivals.popleft()[1])
+        self.app.load_tasks(tasks)
+        return True
+
+    def wait(self, event: threading.Event, deadline: Optional[float] = None) -> bool:
+        if event.is_set():
+            return True
+        if self._arrivals and (deadline is None or self._arrivals[0][0] < deadline):
+            return self.arrive()
+        return super().wait(event, deadline)
+
+
+def workload(utilization: Optional[float]) -> List[Arrival]:
+    """
+    Mostly short tasks with few long ones, arriving at random (Poisson process) with
+    rate giving the utilization of workers - or all at once without utilization
+    """
+    rng = random.Random(SEED)
+    durations = [
+        rng.uniform(5, 20) if rng.random() < 0.2 else rng.uniform(0.1, 1)
+        for _ in range(TASKS)
+    ]
+    capacity = sum(speed * count for speed, count in WORKER_SPEEDS.items())
+    rate = utilization * capacity / (sum(durations) / TASKS) if utilization else None
+
+    arrivals = []
+    now = 0.0
+    for i, duration in enumerate(durations):
+        if rate is not None:
+            now += rng.expovariate(rate)
+        task = app.src.Task(f"Task nr {i}")
+        task.seconds_to_finish = duration
+        arrivals.append((now, task))
+    return arrivals
+
+
+def simulate(utilization: Optional[float], strategy: Strategy) -> Dict[str, float]:
+    """:return: Total completion time and percentiles of tasks' response times"""
+    arrivals = workload(utilization)
+    clock = ArrivalsClock(arrivals)
+    task_distribution, task_pool = strategy
+    main_app = clock.app = app.App(
+        clock=clock, task_pool=task_pool, task_distribution=task_distribution
+    )
+    main_app.log_sink = None
+    main_app.add_entities(
+        *(
+            app.src.Worker(f"Worker {speed}x nr {i}", speed=speed)
+            for speed, count in WORKER_SPEEDS.items()
+            for i in range(count)
+        ),
+        *(app.src.Manager(f"Manager nr {i}") for i in range(MANAGERS)),
+    )
+
+    arrival_times = {task: arrival_time for arrival_time, task in arrivals}
+    finish_times = []
+    responses = []
+
+    def on_task_done(worker: app.src.Worker, task: app.src.Task) -> None:
+        finish_times.append(task.finish_time)
+        responses.append(task.finish_time - arrival_times[task])
+
+    main_app.event_pool[app.src.EntityEvents.TaskDone].attach(on_task_done)
+    while clock.arrive():
+        main_app.run_scheduled(stop_when_idle=True)
+    return {"makespan": max(finish_times), **percentiles(responses)}
+
+
+if __name__ == "__main__":
+    speeds = ", ".join(f"{count}x speed {s}" for s, count in WORKER_SPEEDS.items())
+    print(f"{TASKS} tasks (80% of 0.1-1s, 20% of 5-20s), workers: {speeds}")
+    for utilization_ in UTILIZATIONS:
+        print(
+            "\nall at once"
+            if utilization_ is None
+            else f"\nutilization {utilization_:.0%}"
+        )
+        print(
+            f"{'strategy':>24} | {'makespan':>9} | {'p50':>7} | {'p90':>7} | "
+            f"{'p99':>7} | {'max':>7}"
+        )
+        for name, strategy in STRATEGIES.items():
+            results = simulate(utilization_, strategy())
+            print(
+                f"{name:>24} | {results['makespan']:>8.1f}s | "
+                + " | ".join(
+                    f"{results[key]:>6.2f}s" for key in ("p50", "p90", "p99", "max")
+                )
+            )
@@ -0,0 +1,40 @@
+"""
+Module for measuring enqueue throughput of JournaledTaskPool with and without fsync
+batching
+
+Usage: python -m code_sandbox.tasks_queue_app.benchmarks.journal
+"""
+import os
+import tempfile
+import time
+
+from ..src import JournaledTaskPool, Task, TaskJournal
+
+TASKS = 5000
+
+SETUPS = {
+    "fsync every record": dict(fsync=True, group_size=1),
+    "fsync every 256 records": dict(fsync=True, group_size=256),
+    "no fsync": dict(fsync=False, group_size=256),
+}
+
+
+def enqueue(path: str, **journal_options) -> float:
+    tasks = [Task(f"Task nr {i}") for i in range(TASKS)]
+    start = time.perf_counter()
+    with TaskJournal(path, **journal_options) as journal:
+        pool = JournaledTaskPool(journal, "app")
+        for task in tasks:
+            pool.put(task)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'journal':<24} | tasks/s")
+        for setup, options in SETUPS.items():
+            path = os.path.join(directory, "tasks.journal")
+            if os.path.exists(path):
+                os.remove(path)
+            seconds = enqueue(path, **options)
+            print(f"{setup:<24} | {TASKS / seconds:,.0f}")
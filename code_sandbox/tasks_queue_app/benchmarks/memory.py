@@ -0,0 +1,18 @@
+"""
+Module for measuring memory taken by single Task, Worker and Manager
+
+Usage: python -m code_sandbox.tasks_queue_app.benchmarks.memory
+"""
+from ..src import Manager, Task, Worker
+from ...utils.benchmarks.memory import bytes_per_instance
+
+FACTORIES = {
+    "Task": lambda i: Task("task"),
+    "Worker": lambda i: Worker("worker"),
+    "Manager": lambda i: Manager("manager"),
+}
+
+
+if __name__ == "__main__":
+    for name, factory in FACTORIES.items():
+        print(f"{name:<8} | {bytes_per_instance(factory):,.0f} bytes")
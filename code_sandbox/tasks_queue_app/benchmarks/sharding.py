@@ -0,0 +1,52 @@
+"""
+Module for measuring how ShardedApp throughput scales with amount of shards
+
+Usage: python -m code_sandbox.tasks_queue_app.benchmarks.sharding
+"""
+import functools
+import os
+import time
+from typing import List
+
+from ..sharding import ShardedApp
+from ..src import Entity, Manager, Task, Worker
+
+TASKS = 2000
+SPIN = 20_000
+WORKERS_PER_SHARD = 4
+
+
+def spin(count: int) -> int:
+    """CPU bound payload, holding the GIL all the time"""
+    total = 0
+    for i in range(count):
+        total += i * i
+    return total
+
+
+def create_entities(shard: int) -> List[Entity]:
+    return [Worker(f"w{shard}.{i}") for i in range(WORKERS_PER_SHARD)] + [
+        Manager(f"m{shard}")
+    ]
+
+
+def create_tasks() -> List[Task]:
+    tasks = [Task(f"Task nr {i}") for i in range(TASKS)]
+    for task in tasks:
+        task.seconds_to_finish = 0
+        task.payload = functools.partial(spin, SPIN)
+    return tasks
+
+
+if __name__ == "__main__":
+    print(f"{'shards':>6} | {'tasks/s':>10} | stolen")
+    for shards in sorted({1, 2, 4, os.cpu_count() or 1}):
+        sharded_app = ShardedApp(shards, create_entities)
+        sharded_app.load_tasks(create_tasks())
+        start = time.perf_counter()
+        reports = sharded_app.run()
+        seconds = time.perf_counter() - start
+        print(
+            f"{shards:>6} | {TASKS / seconds:>10,.0f} | "
+            f"{sum(report.stolen for report in reports)}"
+        )
@@ -0,0 +1,144 @@
+"""
+Module for benchmarking the whole tasks queue simulation
+
+Usage: python -m code_sandbox.tasks_queue_app.benchmarks.simulation --help
+"""
+import argparse
+import random
+import time
+import tracemalloc
+from typing import Any, Dict, Iterator, List, NamedTuple
+
+from .. import app
+
+
+class SimulationConfig(NamedTuple):
+    managers: int = 4
+    workers: int = 16
+    tasks: int = 2000
+    min_duration: float = 0.0
+    max_duration: float = 0.001
+    max_queued_tasks: int = 1
+    batch_mode: bool = False
+    scheduled: bool = False
+    virtual_clock: bool = False
+    seed: int = 321322
+    trace_memory: bool = False
+    stream: bool = False
+    high_water: int = 1024
+
+
+def iterate_tasks(config: SimulationConfig) -> Iterator[app.src.Task]:
+    rng = random.Random(config.seed)
+    for i in range(config.tasks):
+        task = app.src.Task(f"Task nr {i}")
+        task.seconds_to_finish = rng.uniform(config.min_duration, config.max_duration)
+        yield task
+
+
+def create_tasks(config: SimulationConfig) -> List[app.src.Task]:
+    return list(iterate_tasks(config))
+
+
+def create_app(config: SimulationConfig) -> app.App:
+    main_app = app.App(clock=app.src.VirtualClock() if config.virtual_clock else None)
+    main_app.log_sink = None
+    main_app.add_entities(
+        *(app.src.Worker(f"Worker nr {i}") for i in range(config.workers))
+    )
+    for i in range(config.managers):
+        manager = app.src.Manager(f"Manager nr {i}")
+        manager.max_queued_tasks = config.max_queued_tasks
+        manager.batch_mode = config.batch_mode
+        main_app.add_entities(manager)
+    return main_app
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    values = sorted(values)
+    if not values:
+        return {}
+
+    def at(fraction: float) -> float:
+        return values[min(len(values) - 1, int(fraction * len(values)))]
+
+    return {"p50": at(0.5), "p90": at(0.9), "p99": at(0.99), "max": values[-1]}
+
+
+def run_simulation(config: SimulationConfig) -> Dict[str, Any]:
+    """Run app until all tasks are done and return measured values"""
+    main_app = create_app(config)
+    if config.trace_memory:
+        tracemalloc.start()
+    tasks = iterate_tasks(config) if config.stream else create_tasks(config)
+
+    queue_waits = []
+    main_app.event_pool[app.src.EntityEvents.TaskDone].attach(
+        lambda worker, task: queue_waits.append(task.start_time - load_time)
+    )
+    ticks = 0
+    run = main_app.run
+
+    def counted_run() -> None:
+        nonlocal ticks
+        ticks += 1
+        run()
+
+    main_app.run = counted_run
+
+    start = time.perf_counter()
+    load_time = main_app.clock.now()
+    if config.stream:
+        main_app.feed_tasks(tasks, config.high_water)
+    else:
+        main_app.load_tasks(tasks)
+    # virtual time moves only while app waits for tasks, so it needs scheduled runs
+    if config.scheduled or config.virtual_clock:
+        main_app.run_scheduled(stop_when_idle=True)
+    while len(queue_waits) < config.tasks:
+        main_app.run()
+    seconds = time.perf_counter() - start
+    peak_memory = tracemalloc.get_traced_memory()[1] if config.trace_memory else None
+    tracemalloc.stop()
+
+    return {
+        "seconds": seconds,
+        "ticks": ticks,
+        "ticks_per_second": ticks / seconds,
+        "tasks_per_second": len(queue_waits) / seconds,
+        "queue_wait": percentiles(queue_waits),
+        "peak_memory": peak_memory,
+        "simulated_seconds": main_app.clock.now() - load_time,
+    }
+
+
+def parse_config() -> SimulationConfig:
+    defaults = SimulationConfig()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    for field, default in defaults._asdict().items():
+        flag = f"--{field.replace('_', '-')}"
+        if isinstance(default, bool):
+            parser.add_argument(flag, action="store_true")
+        else:
+            parser.add_argument(flag, type=type(default), default=default)
+    return SimulationConfig(**vars(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    simulation_config = parse_config()
+    results = run_simulation(simulation_config)
+    print(
+        " | ".join(
+            f"{key}: {value}" for key, value in simulation_config._asdict().items()
+        )
+    )
+    print(f"time:       {results['seconds']:.3f}s")
+    print(f"ticks:      {results['ticks']} ({results['ticks_per_second']:,.0f}/s)")
+    print(f"throughput: {results['tasks_per_second']:,.0f} tasks/s")
+    print(
+        "queue wait: "
+        + ", ".join(f"{k} {v * 1000:.2f}ms" for k, v in results["queue_wait"].items())
+    )
+    print(f"simulated:  {results['simulated_seconds']:.3f}s")
+    if results["peak_memory"] is not None:
+        print(f"peak mem:   {results['peak_memory'] / 2**20:.2f} MiB")
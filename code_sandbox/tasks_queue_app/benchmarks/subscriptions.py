@@ -0,0 +1,41 @@
+"""
+Module for measuring memory kept by entities dropped without unsubscribing
+
+Usage: python -m code_sandbox.tasks_queue_app.benchmarks.subscriptions
+"""
+import time
+import tracemalloc
+from typing import Tuple
+
+from .. import app
+
+WORKERS = 1_000_000
+RUN_EVERY = 100_000
+
+
+def churn(weak_subscriptions: bool) -> Tuple[float, int, int]:
+    """:return: seconds, traced memory after churning, peak traced memory"""
+    main_app = app.App(weak_subscriptions=weak_subscriptions)
+    main_app.log_sink = None
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(1, WORKERS + 1):
+        main_app.add_entities(app.src.Worker(f"Worker nr {i}"))
+        if i % RUN_EVERY == 0:
+            main_app.run()
+    seconds = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, current, peak
+
+
+if __name__ == "__main__":
+    print(f"{WORKERS} short-lived Workers, app runs every {RUN_EVERY} of them")
+    print(f"{'weak':<5} | {'seconds':>8} | {'kept [MiB]':>12} | peak [MiB]")
+    for weak_subscriptions in (True, False):
+        seconds, current, peak = churn(weak_subscriptions)
+        print(
+            f"{str(weak_subscriptions):<5} | {seconds:8.2f} | "
+            f"{current / 2**20:12.1f} | {peak / 2**20:.1f}"
+        )
@@ -0,0 +1,55 @@
+"""
+Module for measuring TaskPool throughput
+
+Usage: python -m code_sandbox.tasks_queue_app.benchmarks.task_pool
+"""
+import random
+import time
+from typing import Callable, List
+
+from ..src import Task, TaskPool
+
+random.seed(321322)
+
+SIZES = [10**3, 10**4, 10**5, 10**6]
+
+
+def fifo_cycle(tasks: List[Task]) -> None:
+    """App -> Manager flow: put everything, then pop one by one"""
+    pool = TaskPool()
+    pool.put(*tasks)
+    while pool.pop():
+        pass
+
+
+def dispose_cycle(tasks: List[Task]) -> None:
+    """Manager.dispose_task flow: get() + remove() pair until the pool is empty"""
+    pool = TaskPool()
+    pool.put(*tasks)
+    while task := pool.get():
+        pool.remove(task)
+
+
+def measure(cycle: Callable[[List[Task]], None], tasks: List[Task]) -> float:
+    start = time.perf_counter()
+    cycle(tasks)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print(f"{'tasks':>10} | {'cycle':<16} | {'priorities':<10} | tasks/s")
+    for size in SIZES:
+        for with_priorities in (False, True):
+            tasks = [
+                Task(
+                    f"Task nr {i}",
+                    priority=random.randint(-2, 2) if with_priorities else 0,
+                )
+                for i in range(size)
+            ]
+            for cycle in (fifo_cycle, dispose_cycle):
+                seconds = measure(cycle, tasks)
+                print(
+                    f"{size:>10} | {cycle.__name__:<16} | {str(with_priorities):<10} | "
+                    f"{size / seconds:,.0f}"
+                )
@@ -24,5 +24,4 @@ if __name__ == "__main__":
 
     main_app.add_entities(w1, w2, m1, m2)
 
-    while True:
-        main_app.run()
+    main_app.run_scheduled(stop_when_idle=True)
@@ -0,0 +1,334 @@
+import multiprocessing
+import multiprocessing.context
+import pickle
+import queue
+import time
+import traceback
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from . import app, src
+
+__all__ = [
+    "ShardError",
+    "ShardReport",
+    "ShardedApp",
+    "TaskOutcome",
+]
+
+EntitiesFactory = Callable[[int], Iterable[src.Entity]]
+
+
+class TaskOutcome(NamedTuple):
+    """Payload's result or exception of a task run by shard"""
+
+    # position of the task among tasks of the run
+    index: int
+    result: Any
+    exception: Optional[BaseException]
+
+
+class ShardReport(NamedTuple):
+    shard: int
+    done: int
+    stolen: int
+    seconds: float
+    # of tasks with payloads only
+    outcomes: Tuple[TaskOutcome, ...] = ()
+
+
+class ShardError(RuntimeError):
+    """Shard's process failed - raised in the parent process"""
+
+    def __init__(self, shard: int, details: str) -> None:
+        super().__init__(f"Shard {shard} failed: {details}")
+        self.shard = shard
+
+
+class _ShardFailure(NamedTuple):
+    shard: int
+    traceback: str
+
+
+# seconds of blocking waits, between which shards' state is checked
+_WAIT = 0.05
+
+
+class ShardedApp:
+    """
+    Runs entities in separate processes, each shard with its own App and event pool.
+
+    Tasks are dealt in batches into shards' queues. Shard takes next batch from its own
+    queue whenever its task pool runs low and steals batches from other shards' queues
+    when its own one runs dry. Only batches still in the queues can be stolen - tasks
+    already loaded into shard's TaskPool stay there, so batch_size bounds the work an
+    idle shard can miss. Every shard needs at least one Worker and one Manager.
+    """
+
+    _shards: int
+    _entities_factory: EntitiesFactory
+    _batch_size: int
+    _context: multiprocessing.context.BaseContext
+    _batches: List[List[List[src.Task]]]
+
+    def __init__(
+        self,
+        shards: int,
+        entities_factory: EntitiesFactory,
+        batch_size: int = 64,
+        mp_context: Optional[multiprocessing.context.BaseContext] = None,
+    ) -> None:
+        """
+        :param shards: Amount of processes
+        :param entities_factory: Picklable callable creating entities of given shard
+        :param batch_size: Amount of tasks moved between processes at once
+        :param mp_context: Multiprocessing context, default one if not given
+        """
+        if shards < 1:
+            raise ValueError("At least one shard is needed")
+
+        self._shards = shards
+        self._entities_factory = entities_factory
+        self._batch_size = batch_size
+        self._context = mp_context or multiprocessing.get_context()
+        self._batches = [[] for _ in range(shards)]
+
+    @property
+    def shards(self) -> int:
+        return self._shards
+
+    def load_tasks(
+        self, tasks_iterable: Iterable[src.Task], shard: Optional[int] = None
+    ) -> None:
+        """
+        :param shard: Shard getting all the tasks, batches are dealt round-robin between
+            shards if not given
+        """
+        tasks = list(tasks_iterable)
+        for start in range(0, len(tasks), self._batch_size):
+            target = (
+                shard
+                if shard is not None
+                else (start // self._batch_size) % self._shards
+            )
+            self._batches[target].append(tasks[start : start + self._batch_size])
+
+    def run(self) -> List[ShardReport]:
+        """
+        Run all loaded tasks to completion and return reports sorted by shard. Results
+        and exceptions of payloads are set on the loaded tasks.
+
+        :raises ShardError: If any shard's process failed
+        :raises pickle.PicklingError: If any task cannot be pickled, before any shard
+            is started - loaded tasks are kept
+        """
+        # batches are pickled here, as queues' feeder threads would only drop them;
+        # tasks travel with their positions, which identify them in reports
+        tasks: List[src.Task] = []
+        pickled_batches: List[List[bytes]] = []
+        for batches in self._batches:
+            pickled_batches.append([])
+            for batch in batches:
+                pickled_batches[-1].append(_pickled_batch(batch, len(tasks)))
+                tasks.extend(batch)
+        self._batches = [[] for _ in range(self._shards)]
+
+        queues = [self._context.Queue() for _ in range(self._shards)]
+        reports = self._context.Queue()
+        undistributed = self._context.Value("q", len(tasks))
+        processes = [
+            self._context.Process(
+                target=_run_shard,
+                args=(
+                    shard,
+                    queues,
+                    undistributed,
+                    reports,
+                    self._entities_factory,
+                    self._batch_size,
+                ),
+                daemon=True,
+            )
+            for shard in range(self._shards)
+        ]
+        for process in processes:
+            process.start()
+
+        # processes are already reading, so full pipes do not block putting
+        for shard_queue, batches in zip(queues, pickled_batches):
+            for batch in batches:
+                shard_queue.put(batch)
+
+        try:
+            results = self._collect_reports(processes, reports)
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+        for report in results:
+            for outcome in report.outcomes:
+                _set_outcome(tasks[outcome.index], outcome)
+        return sorted(results)
+
+    @staticmethod
+    def _collect_reports(
+        processes: List[multiprocessing.Process], reports: multiprocessing.Queue
+    ) -> List[ShardReport]:
+        results: Dict[int, ShardReport] = {}
+        # shards whose processes ended without report, one more wait is given to them
+        # as their report may still be in the pipe
+        missing = set()
+        while len(results) < len(processes):
+            try:
+                report = reports.get(timeout=_WAIT)
+            except queue.Empty:
+                for shard in missing:
+                    raise ShardError(
+                        shard, f"exited with code {processes[shard].exitcode}"
+                    )
+                missing = {
+                    shard
+                    for shard, process in enumerate(processes)
+                    if shard not in results and not process.is_alive()
+                }
+                continue
+
+            if isinstance(report, _ShardFailure):
+                raise ShardError(report.shard, report.traceback)
+            results[report.shard] = report
+            missing.discard(report.shard)
+        return list(results.values())
+
+
+def _set_outcome(task: src.Task, outcome: TaskOutcome) -> None:
+    if outcome.exception is not None:
+        task.set_exception(outcome.exception)
+    else:
+        task.set_result(outcome.result)
+
+
+def _pickled_batch(batch: List[src.Task], first_index: int) -> bytes:
+    try:
+        return pickle.dumps(list(enumerate(batch, first_index)))
+    except Exception as exc:
+        task = next((task for task in batch if not _picklable(task)), batch[0])
+        raise pickle.PicklingError(f"Task {task} cannot be pickled: {exc}") from exc
+
+
+def _picklable(value: Any) -> bool:
+    try:
+        pickle.dumps(value)
+    except Exception:
+        return False
+    return True
+
+
+def _run_shard(
+    shard: int,
+    queues: Sequence[multiprocessing.Queue],
+    undistributed: multiprocessing.Value,
+    reports: multiprocessing.Queue,
+    entities_factory: EntitiesFactory,
+    batch_size: int,
+) -> None:
+    # parent waits for report of every shard, so failures are reported too
+    try:
+        report = _shard_report(
+            shard, queues, undistributed, entities_factory, batch_size
+        )
+    except BaseException:
+        reports.put(_ShardFailure(shard, traceback.format_exc()))
+        raise
+    reports.put(report)
+
+
+def _shard_report(
+    shard: int,
+    queues: Sequence[multiprocessing.Queue],
+    undistributed: multiprocessing.Value,
+    entities_factory: EntitiesFactory,
+    batch_size: int,
+) -> ShardReport:
+    shard_app = app.App()
+    shard_app.log_sink = None
+    shard_app.add_entities(*entities_factory(shard))
+
+    done = stolen = 0
+    # the same task can be queued more than once
+    indexes: Dict[src.Task, List[int]] = {}
+    outcomes: List[TaskOutcome] = []
+
+    def on_task_done(worker: src.Worker, task: src.Task) -> None:
+        nonlocal done
+        done += 1
+        index = indexes[task].pop(0)
+        if task.future is None:
+            return
+
+        result, exception = task.result, task.exception
+        if not _picklable(result):
+            result = repr(result)
+        if exception is not None and not _picklable(exception):
+            exception = RuntimeError(repr(exception))
+        outcomes.append(TaskOutcome(index, result, exception))
+
+    shard_app.event_pool[src.EntityEvents.TaskDone].attach(on_task_done)
+
+    # own queue first, then the others starting from the next shard
+    order = [queues[(shard + i) % len(queues)] for i in range(len(queues))]
+
+    def load_batch(pickled_batch: bytes, queue_number: int) -> None:
+        nonlocal stolen
+        batch: List[Tuple[int, src.Task]] = pickle.loads(pickled_batch)
+        with undistributed.get_lock():
+            undistributed.value -= len(batch)
+        if queue_number:
+            stolen += len(batch)
+        for index, task in batch:
+            indexes.setdefault(task, []).append(index)
+        shard_app.load_tasks(task for _, task in batch)
+
+    def take_batch() -> bool:
+        while True:
+            for i, shard_queue in enumerate(order):
+                try:
+                    batch = shard_queue.get_nowait()
+                except queue.Empty:
+                    continue
+
+                load_batch(batch, i)
+                return True
+
+            with undistributed.get_lock():
+                if undistributed.value == 0:
+                    return False
+            # some batches are still on their way through queues' pipes
+            try:
+                batch = order[0].get(timeout=_WAIT)
+            except queue.Empty:
+                continue
+
+            load_batch(batch, 0)
+            return True
+
+    start = time.perf_counter()
+    while True:
+        if len(shard_app.task_pool) < batch_size:
+            take_batch()
+        if not shard_app.run_step() and not take_batch():
+            break
+
+    return ShardReport(
+        shard, done, stolen, time.perf_counter() - start, tuple(outcomes)
+    )
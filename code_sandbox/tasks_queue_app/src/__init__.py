@@ -1,2 +1,6 @@
+from .clocks import *
+from .distributions import *
 from .entities import *
+from .journal import *
+from .logs import *
 from .tasks import *
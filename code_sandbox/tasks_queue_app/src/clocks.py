@@ -0,0 +1,68 @@
+import abc
+import threading
+import time
+from typing import Optional
+
+__all__ = [
+    "Clock",
+    "WallClock",
+    "VirtualClock",
+    "WALL_CLOCK",
+]
+
+
+class Clock(abc.ABC):
+    @abc.abstractmethod
+    def now(self) -> float:
+        pass
+
+    @abc.abstractmethod
+    def wait(self, event: threading.Event, deadline: Optional[float] = None) -> bool:
+        """
+        Wait until event is set or clock reaches deadline.
+
+        :return: True if event is set
+        """
+
+
+class WallClock(Clock):
+    def now(self) -> float:
+        return time.time()
+
+    def wait(self, event: threading.Event, deadline: Optional[float] = None) -> bool:
+        if deadline is None:
+            return event.wait()
+        return event.wait(max(0.0, deadline - time.time()))
+
+
+class VirtualClock(Clock):
+    """
+    Simulated time. Waiting for deadline does not sleep but sets the time to it, so
+    runs are as fast as computations allow and reproducible.
+    """
+
+    _now: float
+
+    def __init__(self, start: float = 0.0) -> None:
+        self._now = start
+
+    def now(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float) -> None:
+        self._now += max(0.0, seconds)
+
+    def wait(self, event: threading.Event, deadline: Optional[float] = None) -> bool:
+        if event.is_set():
+            return True
+
+        if deadline is None:
+            # nothing to jump to - only other threads can set the event
+            return event.wait()
+
+        # jumping exactly to deadline, adding timeout could fall short of it
+        self._now = max(self._now, deadline)
+        return False
+
+
+WALL_CLOCK = WallClock()
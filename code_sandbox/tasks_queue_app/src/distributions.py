@@ -0,0 +1,145 @@
+import abc
+import enum
+import heapq
+import inspect
+import itertools
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import entities, tasks
+from ... import utils
+
+__all__ = [
+    "TaskDistribution",
+    "RoundRobinDistribution",
+    "LeastLoadedDistribution",
+    "ShortestExpectedTimeDistribution",
+]
+
+# entry of waiting worker: (rank, sequence number, reference of the worker)
+_WaitingEntry = Tuple[Any, int, "weakref.ReferenceType[entities.Worker]"]
+
+
+class TaskDistribution(utils.EventDistribution):
+    """
+    Distribution of DisposeTask event, which chooses the worker getting the task out
+    of all waiting ones - instead of the last queued one. Subscribers of the event are
+    Workers' `work_on` methods, which detach themselves when called.
+
+    Waiting workers are kept in a heap by their ranks, so choosing one takes
+    O(log workers). Workers are pushed when queued (see subscribe), entries of ones
+    which stopped waiting meanwhile or were queued again are dropped lazily. Without
+    subscribing, waiting workers are taken from the event whenever none is known.
+    """
+
+    _waiting: List[_WaitingEntry]
+    _entries: "weakref.WeakKeyDictionary[entities.Worker, _WaitingEntry]"
+
+    def __init__(self) -> None:
+        self._waiting = []
+        self._entries = weakref.WeakKeyDictionary()
+        self._counter = itertools.count()
+
+    def subscribe(self, event_pool: Dict[enum.Enum, utils.Event]) -> None:
+        """Follow queued workers, App does it for its distribution"""
+        event_pool[entities.EntityEvents.WorkerQueued].attach(self.on_worker_queued)
+
+    def on_worker_queued(self, worker: entities.Worker) -> None:
+        entry = (self.rank(worker), next(self._counter), weakref.ref(worker))
+        self._entries[worker] = entry
+        heapq.heappush(self._waiting, entry)
+
+    def call_event(self, task: tasks.Task) -> bool:
+        worker = self._pop_waiting()
+        if worker is None:
+            return False
+
+        self.assign(task, worker)
+        self.context.take(worker.work_on)(task)
+        return True
+
+    @abc.abstractmethod
+    def rank(self, worker: entities.Worker) -> Any:
+        """
+        Rank of queued worker, the waiting worker of the lowest rank gets the next
+        task - the one waiting the longest out of equal ones
+        """
+
+    def assign(self, task: tasks.Task, worker: entities.Worker) -> None:
+        """Called for every disposed task, before the worker gets it"""
+
+    def _pop_waiting(self) -> Optional[entities.Worker]:
+        context = self.context
+        waiting, entries = self._waiting, self._entries
+        synced = False
+        while context:
+            while waiting:
+                entry = heapq.heappop(waiting)
+                worker = entry[2]()
+                if worker is None or entries.get(worker) is not entry:
+                    continue
+
+                del entries[worker]
+                if worker.work_on in context:
+                    return worker
+
+            if synced:
+                break
+            # queued without WorkerQueued event followed, instrumented events hand out
+            # wrappers of subscribers
+            for callback in context:
+                self.on_worker_queued(inspect.unwrap(callback).__self__)
+            synced = True
+        return None
+
+
+class RoundRobinDistribution(TaskDistribution):
+    """Task goes to the waiting worker, which got its last task the longest time ago"""
+
+    _last_tasks: "weakref.WeakKeyDictionary[entities.Worker, int]"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._assignments = itertools.count()
+        self._last_tasks = weakref.WeakKeyDictionary()
+
+    def rank(self, worker: entities.Worker) -> int:
+        return self._last_tasks.get(worker, -1)
+
+    def assign(self, task: tasks.Task, worker: entities.Worker) -> None:
+        self._last_tasks[worker] = next(self._assignments)
+
+
+class LeastLoadedDistribution(TaskDistribution):
+    """
+    Task goes to the waiting worker with the least expected seconds of work given so
+    far - faster workers get more tasks, so all of them are busy for similar time
+    """
+
+    _loads: "weakref.WeakKeyDictionary[entities.Worker, float]"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._loads = weakref.WeakKeyDictionary()
+
+    def rank(self, worker: entities.Worker) -> float:
+        return self._loads.get(worker, 0.0)
+
+    def assign(self, task: tasks.Task, worker: entities.Worker) -> None:
+        self._loads[worker] = self._loads.get(worker, 0.0) + worker.expected_seconds(
+            task
+        )
+
+
+class ShortestExpectedTimeDistribution(TaskDistribution):
+    """
+    Task goes to the waiting worker expected to finish it first - the fastest one.
+    Between equally fast workers, the one waiting the longest gets it.
+
+    Sizes of tasks are ordered by the pool, with one taking the shortest tasks first,
+    e.g. `TaskPool(key=lambda task: task.seconds_to_finish)`, short tasks do not wait
+    behind long ones and go to the fastest workers.
+    """
+
+    def rank(self, worker: entities.Worker) -> float:
+        return -worker.speed
@@ -1,7 +1,17 @@
+import concurrent.futures
 import enum
-from typing import Callable, Dict, Optional, Protocol, runtime_checkable
-
-from . import tasks
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Union,
+    runtime_checkable,
+)
+
+from . import clocks, journal, logs, tasks
 from ... import utils
 
 __all__ = [
@@ -19,26 +29,51 @@ class EntityEvents(enum.Enum):
 
     GetTask = "Get Task Event"
     DisposeTask = "Dispose Task Event"
+    TaskStarted = "Task Started Event"
+    TaskDone = "Task Done Event"
+    WorkerQueued = "Worker Queued Event"
 
     Log = "Log Event"
 
-
-def create_event_pool() -> Dict[enum.Enum, utils.Event]:
+    # members are singletons - identity hash spares Enum's Python level __hash__ on
+    # every event pool lookup
+    __hash__ = object.__hash__
+
+
+def create_event_pool(
+    weak: bool = False, task_distribution: Optional[utils.EventDistribution] = None
+) -> Dict[enum.Enum, utils.Event]:
+    """
+    :param weak: Keep subscribed entities' methods as weak references, so entities
+        dropped without unsubscribing are not kept alive by the event pool
+    :param task_distribution: Distribution of DisposeTask event, choosing which of
+        waiting workers gets the task (see distributions module). The last queued
+        worker gets it if not given.
+    """
     event_pool = {
-        EntityEvents.Update: utils.Event(),
-        EntityEvents.AfterUpdate: utils.Event(),
-        EntityEvents.GetTask: utils.Event(),
-        EntityEvents.Log: utils.Event(),
+        EntityEvents.Update: utils.Event(weak),
+        EntityEvents.AfterUpdate: utils.Event(weak),
+        EntityEvents.GetTask: utils.Event(weak),
+        EntityEvents.TaskStarted: utils.Event(weak),
+        EntityEvents.TaskDone: utils.Event(weak),
+        EntityEvents.WorkerQueued: utils.Event(weak),
+        EntityEvents.Log: utils.Event(weak),
     }
 
-    task_disposition_event = utils.Event()
-    task_disposition_event.event_distribution = utils.ForFirstToTakeDistribution()
+    task_disposition_event = utils.Event(weak)
+    task_disposition_event.event_distribution = (
+        utils.ForFirstToTakeDistribution()
+        if task_distribution is None
+        else task_distribution
+    )
     event_pool[EntityEvents.DisposeTask] = task_disposition_event
     return event_pool
 
 
 @runtime_checkable
 class SupportsUpdates(Protocol):
+    __slots__ = ()
+
     def update(self):
         raise NotImplementedError
 
@@ -48,6 +83,8 @@ class SupportsUpdates(Protocol):
 
 @runtime_checkable
 class SupportsWorking(Protocol):
+    __slots__ = ()
+
     _current_task: Optional[tasks.Task]
 
     @property
@@ -60,6 +97,8 @@ class SupportsWorking(Protocol):
 
 @runtime_checkable
 class SupportsTaskManagement(Protocol):
+    __slots__ = ()
+
     @property
     def can_collect_task(self) -> bool:
         raise NotImplementedError
@@ -72,12 +111,29 @@ class SupportsTaskManagement(Protocol):
 
 
 class Entity(SupportsUpdates):
+    """
+    Entity subscribed to Update and AfterUpdate events. Entities, whose updates have
+    nothing to do, suspend their subscriptions - so events are dispatched to active
+    entities only - and get them resumed by `request_update` when their state changes.
+    """
+
+    # weak references are needed for weak subscriptions of entities' methods
+    __slots__ = ("_event_pool", "_name", "clock", "__weakref__")
+
     _event_pool: Dict[enum.Enum, utils.Event]
     _name: str
+    clock: clocks.Clock
+    # entities with no-op after_update are not subscribed to AfterUpdate at all
+    _updates_after: bool = False
 
     def __init__(self, name: str) -> None:
         self._event_pool = {}
         self._name = name
+        self.clock = clocks.WALL_CLOCK
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._updates_after = cls.after_update is not Entity.after_update
 
     def __str__(self) -> str:
         return self.name
@@ -92,62 +148,186 @@ class Entity(SupportsUpdates):
     def after_update(self):
         pass
 
+    @property
+    def needs_update(self) -> bool:
+        """Whether next update can change anything - entity is active"""
+        return True
+
+    def request_update(self) -> None:
+        """Resume suspended updates, as entity's state changed"""
+        if not self._event_pool:
+            return
+
+        # both are suspended together
+        if (
+            self._event_pool[EntityEvents.Update].resume(self.update)
+            and self._updates_after
+        ):
+            self._event_pool[EntityEvents.AfterUpdate].resume(self.after_update)
+
+    def suspend_if_idle(self) -> bool:
+        """
+        Suspend updates if entity does not need them
+
+        :return: Whether updates were suspended
+        """
+        if self.needs_update:
+            return False
+
+        self._event_pool[EntityEvents.Update].suspend(self.update)
+        if self._updates_after:
+            self._event_pool[EntityEvents.AfterUpdate].suspend(self.after_update)
+        return True
+
     def subscribe(self, event_pool: Dict[enum.Enum, utils.Event]) -> None:
         self._event_pool = event_pool
         self._event_pool[EntityEvents.Update].attach(self.update)
-        self._event_pool[EntityEvents.AfterUpdate].attach(self.after_update)
+        if self._updates_after:
+            self._event_pool[EntityEvents.AfterUpdate].attach(self.after_update)
 
     def unsubscribe(self) -> None:
         self._event_pool[EntityEvents.Update].detach(self.update)
         self._event_pool[EntityEvents.AfterUpdate].detach(self.after_update)
         self._event_pool = {}
 
-    def log(self, msg: str) -> None:
-        self._event_pool[EntityEvents.Log](msg)
+    @property
+    def is_logged(self) -> bool:
+        """Whether any log sink listens, so there is a point in preparing log details"""
+        return bool(self._event_pool.get(EntityEvents.Log))
+
+    def log(
+        self,
+        kind: Union[logs.LogKind, str],
+        task: Optional[tasks.Task] = None,
+        **details: Any,
+    ) -> None:
+        """
+        :param kind: Kind of the record, or already formatted message - logged as
+            LogKind.Message, as with former `log(msg)`
+        """
+        log_event = self._event_pool[EntityEvents.Log]
+        if log_event:
+            if isinstance(kind, str):
+                kind, details = logs.LogKind.Message, {"message": kind, **details}
+            log_event(logs.LogRecord(kind, self, task, self.clock.now(), details))
 
 
 class Worker(Entity, SupportsWorking):
-    def __init__(self, name: str) -> None:
+    __slots__ = ("_current_task", "_wakeup_expected", "_speed", "executor")
+
+    _speed: float
+    executor: Optional[concurrent.futures.Executor]
+
+    def __init__(
+        self,
+        name: str,
+        executor: Optional[concurrent.futures.Executor] = None,
+        speed: float = 1.0,
+    ) -> None:
+        """
+        :param speed: Factor of worker's speed - task takes its seconds_to_finish
+            divided by it
+        """
         super().__init__(name)
         self._current_task = None
+        self._wakeup_expected = False
+        self.executor = executor
+        self.speed = speed
 
     def __repr__(self):
         return f'Worker("{self.name}")'
 
+    @property
+    def speed(self) -> float:
+        return self._speed
+
+    @speed.setter
+    def speed(self, value: float) -> None:
+        if value <= 0:
+            raise ValueError("Worker's speed has to be positive")
+        self._speed = float(value)
+
+    def expected_seconds(self, task: tasks.Task) -> float:
+        """Time the task would take this worker"""
+        return task.seconds_to_finish / self._speed
+
+    @property
+    def needs_update(self) -> bool:
+        """
+        Whether worker is free and not queued yet, or its task is done - or nobody
+        promised to wake the worker up when it is (see `expect_wakeup`)
+        """
+        if self._current_task is None:
+            return self.work_on not in self._event_pool[EntityEvents.DisposeTask]
+        return not self._wakeup_expected or self._current_task.is_done
+
+    def expect_wakeup(self) -> None:
+        """
+        Promise to request worker's update when its current task is done, so the
+        worker suspends its updates meanwhile. Meant for TaskStarted subscribers - like
+        apps with their timers of tasks. Without it, busy worker checks its task on
+        every update.
+        """
+        self._wakeup_expected = True
+
     def update(self) -> None:
-        msgs = []
+        self._update()
+        self.suspend_if_idle()
+
+    def _update(self) -> None:
+        task = None
         if self._current_task and self._current_task.is_done:
-            msgs.append(f"done {self._current_task}")
-            self._current_task = None
+            task, self._current_task = self._current_task, None
+            self._event_pool[EntityEvents.TaskDone](self, task)
 
-        if not self.is_busy and self._event_pool[EntityEvents.DisposeTask].attach(
+        if self.is_busy or not self._event_pool[EntityEvents.DisposeTask].attach(
             self.work_on
         ):
-            msgs.append(f"queued for next task")
+            return
 
-        if msgs:
-            self.log(f"{self} {' and '.join(msgs)}")
+        self._event_pool[EntityEvents.WorkerQueued](self)
+        if task is None:
+            self.log(logs.LogKind.Queued)
+        elif task.exception is not None:
+            self.log(logs.LogKind.TaskFailedAndQueued, task, exception=task.exception)
+        else:
+            self.log(logs.LogKind.TaskDoneAndQueued, task)
 
     def work_on(self, task: tasks.Task) -> None:
         self._event_pool[EntityEvents.DisposeTask].detach(self.work_on)
         self._current_task = task
-        self._current_task.start()
-        self.log(
-            f"{self} starts working on {task} (est. time: {task.seconds_to_finish:.2f}s)"
-        )
+        self._wakeup_expected = False
+        self._current_task.start(self.executor, self.clock, self._speed)
+        self._event_pool[EntityEvents.TaskStarted](self, task)
+        self.log(logs.LogKind.TaskStarted, task, estimate=self.expected_seconds(task))
+        if task.is_done or not self._wakeup_expected:
+            self.request_update()
 
 
 class Manager(Entity, SupportsTaskManagement):
+    __slots__ = (
+        "_task_pool",
+        "_task_queue_len",
+        "_did_task_disposition",
+        "_batch_mode",
+    )
+
     _task_pool: tasks.TaskPool
     _task_queue_len: int
     _did_task_disposition: bool
+    _batch_mode: bool
 
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str, task_pool: Optional[tasks.TaskPool] = None) -> None:
+        """
+        :param task_pool: Pool for collected tasks, e.g. JournaledTaskPool to keep them
+            across restarts. New TaskPool if not given.
+        """
         super().__init__(name)
 
-        self._task_pool = tasks.TaskPool()
+        self._task_pool = tasks.TaskPool() if task_pool is None else task_pool
         self._task_queue_len = 1
         self._did_task_disposition = False
+        self._batch_mode = False
 
     def __repr__(self):
         return f'Manager("{self.name}")'
@@ -160,30 +340,85 @@ class Manager(Entity, SupportsTaskManagement):
     @max_queued_tasks.setter
     def max_queued_tasks(self, value: int) -> None:
         self._task_queue_len = max(0, int(value))
+        self.request_update()
+
+    @property
+    def batch_mode(self) -> bool:
+        """
+        In batch mode manager collects as many tasks as it can in one go and disposes
+        its tasks to all waiting workers in a single update
+        """
+        return self._batch_mode
+
+    @batch_mode.setter
+    def batch_mode(self, value: bool) -> None:
+        self._batch_mode = bool(value)
+
+    @property
+    def needs_update(self) -> bool:
+        """Whether manager can start collecting tasks or has tasks for waiting workers"""
+        if (
+            self.can_collect_task
+            and self.collect_task not in self._event_pool[EntityEvents.GetTask]
+        ):
+            return True
+        return bool(self._task_pool) and bool(
+            self._event_pool[EntityEvents.DisposeTask]
+        )
+
+    def subscribe(self, event_pool: Dict[enum.Enum, utils.Event]) -> None:
+        super().subscribe(event_pool)
+        if isinstance(self._task_pool, journal.JournaledTaskPool):
+            # journal is shared, so it stays subscribed after unsubscribing
+            event_pool[EntityEvents.TaskDone].attach(
+                self._task_pool.journal.on_task_done
+            )
+
+    def unsubscribe(self) -> None:
+        self._event_pool[EntityEvents.WorkerQueued].detach(self.on_worker_queued)
+        super().unsubscribe()
 
     def update(self) -> None:
         if self.can_collect_task:
             self._event_pool[EntityEvents.GetTask].attach(self.collect_task)
 
-        if self._task_pool:
+        if self._task_pool and self.batch_mode:
+            self.dispose_tasks()
+        elif self._task_pool:
             self.dispose_task()
 
     def after_update(self) -> None:
-        if not self._did_task_disposition:
-            return
+        if self._did_task_disposition:
+            # this assures that manager waits for another managers to dispose their
+            # tasks
+            self.rejoin_event_queue(self.update, EntityEvents.Update)
+            self._did_task_disposition = False
 
-        # this assures that manager waits for another managers to dispose their tasks
-        self.rejoin_event_queue(self.update, EntityEvents.Update)
-        self._did_task_disposition = False
+        if self.collect_task not in self._event_pool[EntityEvents.GetTask]:
+            self.suspend_if_idle()
+        # else GetTask comes next, manager is suspended there if nothing is collected
+
+    def suspend_if_idle(self) -> bool:
+        if not super().suspend_if_idle():
+            return False
+
+        if self._task_pool:
+            # tasks wait for workers
+            self._event_pool[EntityEvents.WorkerQueued].attach(self.on_worker_queued)
+        return True
+
+    def on_worker_queued(self, worker: Worker) -> None:
+        self._event_pool[EntityEvents.WorkerQueued].detach(self.on_worker_queued)
+        self.request_update()
 
     def rejoin_event_queue(self, subscriber: Callable, event: EntityEvents) -> None:
         self._event_pool[event].detach(subscriber)
         self._event_pool[event].attach(subscriber)
-        self.log(f"{self} moved to the end of the {event.value} queue")
+        self.log(logs.LogKind.MovedInQueue, queue=event.value)
 
     @property
     def can_collect_task(self) -> bool:
-        return self.max_queued_tasks and len(self._task_pool) < self.max_queued_tasks
+        return not self.max_queued_tasks or len(self._task_pool) < self.max_queued_tasks
 
     def dispose_task(self) -> Optional[tasks.Task]:
         task = self._task_pool.get()
@@ -195,20 +430,44 @@ class Manager(Entity, SupportsTaskManagement):
             return None
 
         self._task_pool.remove(task)
-        self.log(f"{self} disposed {task} successfully")
+        self.log(logs.LogKind.TaskDisposed, task)
         return task
 
+    def dispose_tasks(self) -> List[tasks.Task]:
+        """Dispose tasks until there are no more tasks or no more waiting workers"""
+        disposed = []
+        dispose_event = self._event_pool[EntityEvents.DisposeTask]
+        while self._task_pool and dispose_event:
+            task = self.dispose_task()
+            if not task:
+                break
+            disposed.append(task)
+
+        self._did_task_disposition = bool(disposed)
+        return disposed
+
     def collect_task(self, task_pool: tasks.TaskPool) -> None:
         if not self.can_collect_task:
             self._event_pool[EntityEvents.GetTask].detach(self.collect_task)
             return None
 
-        task = task_pool.pop()
-        if not task:
+        if not self.batch_mode:
+            count = 1
+        elif self.max_queued_tasks:
+            count = self.max_queued_tasks - len(self._task_pool)
+        else:
+            # no limit - all of them
+            count = 0
+        collected = task_pool.pop_many(count)
+        if not collected:
+            self.suspend_if_idle()
             return None
 
-        self._task_pool.put(task)
-        self.log(
-            f"{self} collected {task} | tasks to dispose: "
-            f"{[str(task) for task in self._task_pool]}"
-        )
+        self._task_pool.put(*collected)
+        self.request_update()
+        if self.is_logged:
+            self.log(
+                logs.LogKind.TasksCollected,
+                collected=", ".join(str(task) for task in collected),
+                queued=[str(task) for task in self._task_pool],
+            )
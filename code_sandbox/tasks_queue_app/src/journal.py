@@ -0,0 +1,314 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from . import tasks
+
+__all__ = [
+    "TaskJournal",
+    "JournaledTaskPool",
+]
+
+
+class TaskJournal:
+    """
+    Append-only file of JSON lines recording tasks put into pools, popped from them
+    and done. Records are written in groups - when enough of them is pending or enough
+    time passed since the first pending one, also when no more records follow it (by
+    timer thread) - and every commit is followed by fsync, unless disabled. Journal is
+    compacted on opening and whenever obsolete records outnumber the live ones.
+
+    On opening existing file, tasks that were not done are recovered: each into the
+    last pool it was put into, including tasks that were popped from it but never done.
+    Payloads are not journaled - only name, priority and seconds to finish.
+    """
+
+    _pools: Dict[str, "JournaledTaskPool"]
+    _recovered: Dict[str, List[tasks.Task]]
+    _ids: Dict[tasks.Task, int]
+    _tasks: Dict[int, tasks.Task]
+    _locations: Dict[int, str]
+    _in_flight: Set[int]
+    _pending: List[str]
+    _timer: Optional[threading.Timer]
+
+    def __init__(
+        self,
+        path: str,
+        fsync: bool = True,
+        group_size: int = 256,
+        group_interval: float = 0.05,
+    ) -> None:
+        """
+        :param path: Journal's file, created if it does not exist
+        :param fsync: Force every commit to disk, not only to OS buffers
+        :param group_size: Amount of pending records committed at once
+        :param group_interval: Maximum seconds between commits of pending records
+        """
+        self._path = path
+        self._fsync = fsync
+        self._group_size = max(1, group_size)
+        self._group_interval = group_interval
+
+        self._pools = {}
+        self._recovered = {}
+        self._ids = {}
+        self._tasks = {}
+        self._locations = {}
+        self._in_flight = set()
+        self._next_id = 0
+        self._pending = []
+        self._records = 0
+        self._last_commit = time.monotonic()
+        # guards state shared with the timer committing pending records
+        self._lock = threading.RLock()
+        self._timer = None
+
+        self._file = None
+        self._replay()
+        self.compact()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def recovered_in_flight(self) -> int:
+        """Amount of recovered tasks, that were popped from their pools, but not done"""
+        return self._recovered_in_flight
+
+    def register(self, pool: "JournaledTaskPool") -> List[tasks.Task]:
+        """Register pool and hand it its recovered tasks, in order of putting"""
+        if pool.name in self._pools:
+            raise ValueError(f"Pool {pool.name!r} is already journaled")
+
+        self._pools[pool.name] = pool
+        return self._recovered.pop(pool.name, [])
+
+    def record_put(self, pool_name: str, tasks_: Iterable[tasks.Task]) -> None:
+        with self._lock:
+            self._record_put(pool_name, tasks_)
+
+    def _record_put(self, pool_name: str, tasks_: Iterable[tasks.Task]) -> None:
+        for task in tasks_:
+            task_id = self._ids.get(task)
+            if task_id is None:
+                task_id = self._next_id
+                self._next_id += 1
+                self._ids[task] = task_id
+                self._tasks[task_id] = task
+            # moving to the end keeps locations in order of putting
+            self._locations.pop(task_id, None)
+            self._locations[task_id] = pool_name
+            self._in_flight.discard(task_id)
+            self._append(self._put_record(task_id, pool_name, task))
+
+    def record_pop(self, task: tasks.Task) -> None:
+        with self._lock:
+            task_id = self._ids.get(task)
+            if task_id is None:
+                return
+
+            self._in_flight.add(task_id)
+            self._append({"op": "pop", "id": task_id})
+
+    def record_done(self, task: tasks.Task) -> None:
+        with self._lock:
+            task_id = self._ids.pop(task, None)
+            if task_id is None:
+                return
+
+            del self._tasks[task_id]
+            del self._locations[task_id]
+            self._in_flight.discard(task_id)
+            self._append({"op": "done", "id": task_id})
+
+    def on_task_done(self, worker: Any, task: tasks.Task) -> None:
+        """Subscriber of TaskDone event"""
+        self.record_done(task)
+
+    def commit(self) -> None:
+        """Write pending records to the file"""
+        with self._lock:
+            self._commit()
+
+    def _commit(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._last_commit = time.monotonic()
+        if not self._pending:
+            return
+
+        self._file.write("\n".join(self._pending) + "\n")
+        self._file.flush()
+        if self._fsync:
+            os.fsync(self._file.fileno())
+        self._records += len(self._pending)
+        self._pending = []
+
+        if self._records > 2 * len(self._locations) + 1024:
+            self._compact()
+
+    def compact(self) -> None:
+        """Rewrite the file with records of not done tasks only"""
+        with self._lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+        lines = []
+        for task_id, pool_name in self._locations.items():
+            task = self._tasks[task_id]
+            lines.append(json.dumps(self._put_record(task_id, pool_name, task)))
+            if task_id in self._in_flight:
+                lines.append(json.dumps({"op": "pop", "id": task_id}))
+        lines.extend(self._pending)
+
+        temporary_path = f"{self._path}.compacting"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            file.write("".join(f"{line}\n" for line in lines))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self._path)
+
+        self._records = len(lines)
+        self._pending = []
+        self._file = open(self._path, "a", encoding="utf-8")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is None or self._file.closed:
+                return
+
+            self._commit()
+            self._file.close()
+
+    def __enter__(self) -> "TaskJournal":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        if not self._pending:
+            # interval counts from the oldest pending record
+            self._last_commit = time.monotonic()
+        self._pending.append(json.dumps(record))
+        if (
+            len(self._pending) >= self._group_size
+            or time.monotonic() - self._last_commit >= self._group_interval
+        ):
+            self._commit()
+        elif self._timer is None:
+            self._timer = threading.Timer(self._group_interval, self._on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            # commit meanwhile could have replaced the timer by a newer one
+            if self._timer is threading.current_thread():
+                self._commit()
+
+    @staticmethod
+    def _put_record(task_id: int, pool_name: str, task: tasks.Task) -> Dict[str, Any]:
+        return {
+            "op": "put",
+            "id": task_id,
+            "pool": pool_name,
+            "name": task.name,
+            "priority": task.priority,
+            "seconds": task.seconds_to_finish,
+        }
+
+    def _replay(self) -> None:
+        self._recovered_in_flight = 0
+        if not os.path.exists(self._path):
+            return
+
+        with open(self._path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # torn write of the last group before crash
+                    break
+                self._replay_record(record)
+
+        self._recovered_in_flight = len(self._in_flight)
+        # recovered tasks are back in their pools
+        self._in_flight.clear()
+        for task_id, pool_name in self._locations.items():
+            self._recovered.setdefault(pool_name, []).append(self._tasks[task_id])
+
+    def _replay_record(self, record: Dict[str, Any]) -> None:
+        task_id = record["id"]
+        self._next_id = max(self._next_id, task_id + 1)
+        if record["op"] == "put":
+            task = self._tasks.get(task_id)
+            if task is None:
+                task = tasks.Task(record["name"], record["priority"])
+                task.seconds_to_finish = record["seconds"]
+                self._tasks[task_id] = task
+                self._ids[task] = task_id
+            self._locations.pop(task_id, None)
+            self._locations[task_id] = record["pool"]
+            self._in_flight.discard(task_id)
+        elif record["op"] == "pop":
+            if task_id in self._tasks:
+                self._in_flight.add(task_id)
+        elif record["op"] == "done":
+            task = self._tasks.pop(task_id, None)
+            if task is not None:
+                del self._ids[task]
+                del self._locations[task_id]
+                self._in_flight.discard(task_id)
+
+
+class JournaledTaskPool(tasks.TaskPool):
+    """
+    TaskPool recording its changes in the journal. Pools are recognized in the journal
+    by their names, so after restart pool of the same name gets its tasks back.
+    Journal knows a single location of every task, so putting a task already queued
+    in the pool is ignored.
+    """
+
+    def __init__(self, journal: TaskJournal, name: str) -> None:
+        super().__init__()
+        self._journal = journal
+        self._name = name
+        super().extend(journal.register(self))
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def journal(self) -> TaskJournal:
+        return self._journal
+
+    def extend(self, tasks_: Iterable[tasks.Task]) -> None:
+        for task in tasks_:
+            if task in self._entries:
+                continue
+
+            super().extend((task,))
+            self._journal.record_put(self._name, (task,))
+
+    def pop(self) -> Optional[tasks.Task]:
+        task = super().pop()
+        if task is not None:
+            self._journal.record_pop(task)
+        return task
+
+    def remove(self, task: tasks.Task) -> bool:
+        if not super().remove(task):
+            return False
+
+        self._journal.record_pop(task)
+        return True
@@ -0,0 +1,159 @@
+import abc
+import collections
+import enum
+import json
+import sys
+import threading
+import time
+from typing import Any, Deque, Dict, NamedTuple, Optional, TextIO
+
+__all__ = [
+    "LogKind",
+    "LogRecord",
+    "LogSink",
+    "TextLogSink",
+    "BufferedLogSink",
+]
+
+
+# values written to JSON as they are, other ones are written as their repr
+_JSON_TYPES = (str, int, float, bool, type(None), list, dict)
+
+
+class LogKind(enum.Enum):
+    Queued = "{entity} queued for next task"
+    TaskDoneAndQueued = "{entity} done {task} and queued for next task"
+    TaskFailedAndQueued = (
+        "{entity} failed {task} ({exception!r}) and queued for next task"
+    )
+    TaskStarted = "{entity} starts working on {task} (est. time: {estimate:.2f}s)"
+    TasksCollected = "{entity} collected {collected} | tasks to dispose: {queued}"
+    TaskDisposed = "{entity} disposed {task} successfully"
+    MovedInQueue = "{entity} moved to the end of the {queue} queue"
+    # free-form message, already mentioning the entity
+    Message = "{message}"
+
+
+class LogRecord(NamedTuple):
+    """Log entry, formatted into message only when some sink needs it"""
+
+    kind: LogKind
+    entity: Any
+    task: Any
+    timestamp: float
+    details: Dict[str, Any]
+
+    @property
+    def message(self) -> str:
+        return self.kind.value.format(
+            entity=self.entity, task=self.task, **self.details
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "time": self.timestamp,
+            "event": self.kind.name,
+            "entity": str(self.entity),
+            "task": None if self.task is None else str(self.task),
+            **self.details,
+        }
+
+
+class LogSink(abc.ABC):
+    @abc.abstractmethod
+    def write(self, record: LogRecord) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "LogSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class TextLogSink(LogSink):
+    """Writes formatted messages with time relative to start time right away"""
+
+    def __init__(
+        self, stream: Optional[TextIO] = None, start_time: Optional[float] = None
+    ) -> None:
+        self._stream = stream
+        self.start_time = time.time() if start_time is None else start_time
+
+    def write(self, record: LogRecord) -> None:
+        stream = self._stream or sys.stdout
+        stream.write(
+            f"Time: {record.timestamp - self.start_time:.2f}s | {record.message}\n"
+        )
+
+
+class BufferedLogSink(LogSink):
+    """
+    Collects records in a ring buffer and writes them as JSON lines from background
+    thread. When buffer is full, the oldest records are dropped and counted.
+
+    Buffered records keep names of their entities and tasks, not the objects, so
+    the buffer does not keep them alive.
+    """
+
+    _buffer: Deque[LogRecord]
+    _dropped: int
+    _flushed: threading.Condition
+
+    def __init__(
+        self, stream: TextIO, capacity: int = 65536, flush_interval: float = 0.1
+    ) -> None:
+        self._stream = stream
+        self._buffer = collections.deque(maxlen=capacity)
+        self._dropped = 0
+        self._flush_interval = flush_interval
+        self._flushed = threading.Condition()
+
+        self._closed = threading.Event()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    @property
+    def dropped(self) -> int:
+        """Amount of records dropped because of full buffer"""
+        return self._dropped
+
+    def write(self, record: LogRecord) -> None:
+        if len(self._buffer) == self._buffer.maxlen:
+            self._dropped += 1
+        self._buffer.append(
+            record._replace(
+                entity=str(record.entity),
+                task=None if record.task is None else str(record.task),
+                details={
+                    key: value if isinstance(value, _JSON_TYPES) else repr(value)
+                    for key, value in record.details.items()
+                },
+            )
+        )
+
+    def flush(self) -> None:
+        lines = []
+        while self._buffer:
+            record = self._buffer.popleft()
+            lines.append(json.dumps(record.as_dict(), default=repr))
+        if lines:
+            self._stream.write("\n".join(lines) + "\n")
+            self._stream.flush()
+            with self._flushed:
+                self._flushed.notify_all()
+
+    def close(self) -> None:
+        if self._closed.is_set():
+            return
+
+        self._closed.set()
+        self._writer.join()
+        self.flush()
+
+    def _write_loop(self) -> None:
+        while not self._closed.wait(self._flush_interval):
+            self.flush()
@@ -1,6 +1,11 @@
-import time
-from typing import Iterator, List, Optional
+import asyncio
+import collections
+import concurrent.futures
+import heapq
+import itertools
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Union
 
+from . import clocks
 
 __all__ = [
     "Task",
@@ -9,10 +14,26 @@ __all__ = [
 
 
 class Task:
-    def __init__(self, name: str) -> None:
+    __slots__ = (
+        "_name",
+        "_priority",
+        "_seconds_to_finish",
+        "_start_time",
+        "_payload",
+        "_future",
+        "_clock",
+        "_speed",
+    )
+
+    def __init__(self, name: str, priority: int = 0) -> None:
         self._name = name
+        self._priority = priority
         self._seconds_to_finish = 0
         self._start_time = None
+        self._payload = None
+        self._future = None
+        self._clock = clocks.WALL_CLOCK
+        self._speed = 1.0
 
     def __str__(self) -> str:
         return self.name
@@ -21,6 +42,15 @@ class Task:
     def name(self) -> str:
         return self._name
 
+    @property
+    def priority(self) -> int:
+        """Tasks with higher priority are taken from the TaskPool first"""
+        return self._priority
+
+    @priority.setter
+    def priority(self, value: int) -> None:
+        self._priority = int(value)
+
     @property
     def seconds_to_finish(self) -> float:
         return self._seconds_to_finish
@@ -29,44 +59,233 @@ class Task:
     def seconds_to_finish(self, seconds: float) -> None:
         self._seconds_to_finish = max(0.0, seconds)
 
+    @property
+    def payload(self) -> Optional[Callable[[], Any]]:
+        """
+        Work to run when task starts. For process pool executors it has to be picklable
+        (module level function or functools.partial of one). Coroutine functions are
+        run as asyncio tasks, so they need running event loop (AsyncApp).
+        """
+        return self._payload
+
+    @payload.setter
+    def payload(self, func: Optional[Callable[[], Any]]) -> None:
+        self._payload = func
+
+    @property
+    def future(self) -> Optional[Union[concurrent.futures.Future, asyncio.Future]]:
+        """Future of running payload, None if task has no payload or was not started"""
+        return self._future
+
+    @property
+    def result(self) -> Any:
+        """Payload's return value, None until it is done or if it failed"""
+        if self._future is None or not self._future.done():
+            return None
+        if self._future.exception() is not None:
+            return None
+
+        return self._future.result()
+
+    @property
+    def exception(self) -> Optional[BaseException]:
+        """Exception raised by payload, None until it is done or if there was none"""
+        if self._future is None or not self._future.done():
+            return None
+
+        return self._future.exception()
+
+    def set_result(self, result: Any) -> None:
+        """Mark payload as done with the result, e.g. of task run in other process"""
+        self._future = concurrent.futures.Future()
+        self._future.set_result(result)
+
+    def set_exception(self, exception: BaseException) -> None:
+        """Mark payload as failed with the exception"""
+        self._future = concurrent.futures.Future()
+        self._future.set_exception(exception)
+
+    @property
+    def start_time(self) -> Optional[float]:
+        return self._start_time
+
+    @property
+    def finish_time(self) -> Optional[float]:
+        """Expected time of finishing, None if task was not started yet"""
+        if self._start_time is None:
+            return None
+
+        return self._start_time + self.seconds_to_finish / self._speed
+
     @property
     def is_done(self) -> bool:
-        return time.time() - self._start_time >= self.seconds_to_finish
+        if self._future is not None and not self._future.done():
+            return False
+
+        return self._clock.now() >= self.finish_time
+
+    def start(
+        self,
+        executor: Optional[concurrent.futures.Executor] = None,
+        clock: clocks.Clock = clocks.WALL_CLOCK,
+        speed: float = 1.0,
+    ) -> None:
+        """
+        Start task's timer and its payload, if any. Without executor payload runs
+        synchronously.
 
-    def start(self) -> None:
-        self._start_time = time.time()
+        :param clock: Clock measuring task's time from now on
+        :param speed: Speed of the worker, task's timer takes seconds_to_finish divided
+            by it
+        """
+        self._clock = clock
+        self._speed = speed
+        self._start_time = clock.now()
+        if self._payload is None:
+            return
+
+        if asyncio.iscoroutinefunction(self._payload):
+            self._future = asyncio.ensure_future(self._payload())
+            return
+
+        if executor is not None:
+            self._future = executor.submit(self._payload)
+            return
+
+        self._future = concurrent.futures.Future()
+        try:
+            self._future.set_result(self._payload())
+        except Exception as exc:
+            self._future.set_exception(exc)
+
+
+# entry of a pool's queue: [-priority, key of pools with key, sequence number, task or
+# None when removed]
+_PoolEntry = List
 
 
 class TaskPool:
-    _pool: List[Task]
+    """
+    Queue of tasks. Tasks of default priority (0) are kept in FIFO deque, tasks with any
+    other priority are kept in binary heap. Tasks are taken by priority (highest first)
+    and then by order of putting. Removed tasks are only marked as such and dropped
+    lazily when they reach the front of the queue. Task put more than once is queued
+    as many times.
+
+    Pool with key takes tasks of the same priority by their keys (lowest first) and
+    keeps all of them in the heap, e.g. shortest first with
+    `TaskPool(key=lambda task: task.seconds_to_finish)`.
+    """
 
-    def __init__(self):
-        self._pool = []
+    __slots__ = ("_fifo", "_heap", "_entries", "_counter", "_size", "_key")
+
+    _fifo: Deque[_PoolEntry]
+    _heap: List[_PoolEntry]
+    # queued entries of every task, usually just one
+    _entries: Dict[Task, List[_PoolEntry]]
+    _size: int
+    _key: Optional[Callable[[Task], Any]]
+
+    def __init__(self, key: Optional[Callable[[Task], Any]] = None) -> None:
+        """:param key: Order of tasks of the same priority, order of putting if None"""
+        self._fifo = collections.deque()
+        self._heap = []
+        self._entries = {}
+        self._counter = itertools.count()
+        self._size = 0
+        self._key = key
 
     def put(self, *tasks: Task) -> None:
-        self._pool += list(tasks)
+        self.extend(tasks)
+
+    def extend(self, tasks: Iterable[Task]) -> None:
+        """Put tasks one by one, without collecting them first"""
+        key = self._key
+        for task in tasks:
+            if key is None:
+                entry = [-task.priority, next(self._counter), task]
+            else:
+                entry = [-task.priority, key(task), next(self._counter), task]
+            entries = self._entries.get(task)
+            if entries is None:
+                self._entries[task] = [entry]
+            else:
+                entries.append(entry)
+            self._size += 1
+            if task.priority or key is not None:
+                heapq.heappush(self._heap, entry)
+            else:
+                self._fifo.append(entry)
 
     def pop(self) -> Optional[Task]:
-        if not self._pool:
+        entry = self._front()
+        if entry is None:
             return None
 
-        return self._pool.pop(0)
+        if self._fifo and self._fifo[0] is entry:
+            self._fifo.popleft()
+        else:
+            heapq.heappop(self._heap)
+        self._forget(entry)
+        return entry[-1]
 
-    def get(self) -> Optional[Task]:
-        if not self._pool:
-            return None
+    def pop_many(self, count: int) -> List[Task]:
+        """Pop up to count tasks, all of them if count is 0"""
+        popped = []
+        while (not count or len(popped) < count) and (task := self.pop()):
+            popped.append(task)
+        return popped
 
-        return self._pool[0]
+    def get(self) -> Optional[Task]:
+        entry = self._front()
+        return entry[-1] if entry else None
 
     def remove(self, task: Task) -> bool:
-        if task not in self._pool:
+        """Remove task's first occurrence in the queue"""
+        entries = self._entries.get(task)
+        if entries is None:
             return False
 
-        self._pool.remove(task)
+        entry = min(entries)
+        self._forget(entry)
+        entry[-1] = None
+        self._compact()
         return True
 
     def __iter__(self) -> Iterator[Task]:
-        return self._pool.__iter__()
+        entries = heapq.merge(sorted(self._heap), self._fifo)
+        return (entry[-1] for entry in entries if entry[-1] is not None)
 
     def __len__(self):
-        return len(self._pool)
+        return self._size
+
+    def _front(self) -> Optional[_PoolEntry]:
+        fifo, heap = self._fifo, self._heap
+        while fifo and fifo[0][-1] is None:
+            fifo.popleft()
+        while heap and heap[0][-1] is None:
+            heapq.heappop(heap)
+
+        if heap and (not fifo or heap[0] < fifo[0]):
+            return heap[0]
+        if fifo:
+            return fifo[0]
+        return None
+
+    def _forget(self, entry: _PoolEntry) -> None:
+        """Drop entry, which leaves the queue, from entries of its task"""
+        entries = self._entries[entry[-1]]
+        if len(entries) == 1:
+            del self._entries[entry[-1]]
+        else:
+            entries.remove(entry)
+        self._size -= 1
+
+    def _compact(self) -> None:
+        # rebuild containers once tombstones outnumber live entries
+        if len(self._fifo) + len(self._heap) <= 2 * self._size + 32:
+            return
+
+        self._fifo = collections.deque(e for e in self._fifo if e[-1] is not None)
+        self._heap = [e for e in self._heap if e[-1] is not None]
+        heapq.heapify(self._heap)
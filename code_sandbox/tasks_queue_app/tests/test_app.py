@@ -0,0 +1,529 @@
+"""
+App testing module
+"""
+# pylint: disable-all
+import asyncio
+import concurrent.futures
+import functools
+import gc
+import threading
+import time
+import weakref
+
+import pytest
+
+from .. import app
+from ..src import EntityEvents, Manager, Task, VirtualClock, Worker
+
+
+def square(value: int) -> int:
+    return value * value
+
+
+def fail() -> None:
+    raise ValueError("payload failed")
+
+
+def payload_tasks(func, count):
+    tasks = [Task(f"Task nr {i}") for i in range(count)]
+    for i, task in enumerate(tasks):
+        task.payload = functools.partial(func, i)
+    return tasks
+
+
+@pytest.fixture
+def tasks():
+    tasks = [Task(f"Task nr {i}") for i in range(6)]
+    for task in tasks:
+        task.seconds_to_finish = 0.01
+    return tasks
+
+
+@pytest.fixture
+def main_app(tasks) -> app.App:
+    main_app = app.App()
+    main_app.load_tasks(tasks)
+    main_app.add_entities(Worker("w1"), Worker("w2"), Manager("m1"), Manager("m2"))
+    return main_app
+
+
+class TestRunScheduled:
+    def test_all_tasks_done(self, main_app, tasks):
+        main_app.run_scheduled(stop_when_idle=True)
+        assert all(task.start_time is not None for task in tasks)
+        assert all(task.is_done for task in tasks)
+
+    def test_sleeps_between_task_completions(self, main_app, tasks, monkeypatch):
+        runs = []
+        monkeypatch.setattr(
+            main_app, "run", lambda run=main_app.run: runs.append(run())
+        )
+        start = time.time()
+        main_app.run_scheduled(stop_when_idle=True)
+        assert time.time() - start >= 0.03
+        # 3 rounds of 2 tasks, each round needs only a few updates
+        assert len(runs) < 30
+
+    def test_wakes_only_workers_of_done_tasks(self):
+        tasks = [Task(f"Task nr {i}") for i in range(3)]
+        for i, task in enumerate(tasks):
+            task.seconds_to_finish = i + 1
+        main_app = app.App(clock=VirtualClock())
+        main_app.log_sink = None
+        main_app.load_tasks(tasks)
+        workers = [CountingWorker(f"w{i}") for i in range(3)]
+        manager = Manager("m")
+        manager.max_queued_tasks = 3
+        manager.batch_mode = True
+        main_app.add_entities(*workers, manager)
+        main_app.run_scheduled(stop_when_idle=True)
+        assert main_app.clock.now() == 3
+        # queued once and woken once, by its own task's timer
+        assert [worker.updates for worker in workers] == [2, 2, 2]
+
+    def test_returns_without_entities(self, tasks):
+        main_app = app.App()
+        main_app.load_tasks(tasks)
+        main_app.run_scheduled(stop_when_idle=True)
+        assert all(task.start_time is None for task in tasks)
+
+
+class TestTaskTimes:
+    def test_not_started_task(self):
+        task = Task("task")
+        assert task.start_time is None
+        assert task.finish_time is None
+
+    def test_finish_time(self):
+        task = Task("task")
+        task.seconds_to_finish = 2
+        task.start()
+        assert task.finish_time == task.start_time + 2
+
+
+class TestSlots:
+    @pytest.mark.parametrize(
+        "obj", [Task("task"), Worker("w"), Manager("m")], ids=["task", "w", "m"]
+    )
+    def test_no_instance_dict(self, obj):
+        assert not hasattr(obj, "__dict__")
+
+    def test_entities_can_be_weakly_referenced(self):
+        worker = Worker("w")
+        assert weakref.ref(worker)() is worker
+
+
+class TestVirtualClock:
+    def simulate(self, durations):
+        tasks = [Task(f"Task nr {i}") for i in range(len(durations))]
+        for task, duration in zip(tasks, durations):
+            task.seconds_to_finish = duration
+
+        main_app = app.App(clock=VirtualClock())
+        main_app.load_tasks(tasks)
+        main_app.add_entities(Worker("w1"), Worker("w2"), Manager("m1"))
+        main_app.run_scheduled(stop_when_idle=True)
+        return main_app, tasks
+
+    def test_jumps_to_task_completions(self):
+        start = time.time()
+        main_app, tasks = self.simulate([3600, 7200, 1800])
+        assert time.time() - start < 1
+        assert all(task.is_done for task in tasks)
+        # w1: 3600 + 1800, w2: 7200
+        assert main_app.clock.now() == 7200
+        assert tasks[2].start_time == 3600
+
+    def test_runs_are_reproducible(self, capsys):
+        self.simulate([5, 1, 3, 2, 4])
+        first_output = capsys.readouterr().out
+        self.simulate([5, 1, 3, 2, 4])
+        assert capsys.readouterr().out == first_output
+        assert "Time: 6.00s | w1 done Task nr 3" in first_output
+
+    def test_wait_returns_when_event_set(self):
+        clock = VirtualClock(10)
+        event = threading.Event()
+        assert not clock.wait(event, 15)
+        assert clock.now() == 15
+        event.set()
+        assert clock.wait(event, 20)
+        assert clock.now() == 15
+
+    def test_entities_share_app_clock(self):
+        main_app = app.App(clock=VirtualClock())
+        worker = Worker("w")
+        main_app.add_entities(worker)
+        assert worker.clock is main_app.clock
+
+
+class TestExecutors:
+    def run_app(self, tasks, executor=None):
+        done = []
+        main_app = app.App(executor)
+        main_app._event_pool[EntityEvents.TaskDone].attach(
+            lambda worker, task: done.append(task)
+        )
+        main_app.load_tasks(tasks)
+        main_app.add_entities(Worker("w1"), Worker("w2"), Manager("m1"))
+        main_app.run_scheduled(stop_when_idle=True)
+        return done
+
+    def test_payload_run_without_executor(self):
+        tasks = payload_tasks(square, 4)
+        done = self.run_app(tasks)
+        assert sorted(task.result for task in done) == [0, 1, 4, 9]
+
+    def test_outcome_set_from_outside(self):
+        task, failed = Task("task"), Task("failed")
+        task.set_result(4)
+        failed.set_exception(ValueError("failed"))
+        assert task.result == 4 and task.exception is None
+        assert failed.result is None and isinstance(failed.exception, ValueError)
+
+    def test_thread_pool(self):
+        tasks = payload_tasks(lambda i: time.sleep(0.01) or square(i), 4)
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            done = self.run_app(tasks, executor)
+        assert len(done) == 4
+        assert [task.result for task in tasks] == [0, 1, 4, 9]
+
+    def test_process_pool(self):
+        tasks = payload_tasks(square, 4)
+        with concurrent.futures.ProcessPoolExecutor(2) as executor:
+            self.run_app(tasks, executor)
+        assert [task.result for task in tasks] == [0, 1, 4, 9]
+
+    def test_workers_own_executor_is_kept(self):
+        executor = concurrent.futures.ThreadPoolExecutor(1)
+        worker = Worker("w", executor)
+        app.App().add_entities(worker)
+        assert worker.executor is executor
+        executor.shutdown()
+
+    def test_exception_surfaced_in_log(self, capsys):
+        task = Task("failing")
+        task.payload = fail
+        done = self.run_app([task])
+        assert done == [task]
+        assert isinstance(task.exception, ValueError)
+        assert task.result is None
+        assert (
+            "w2 failed failing (ValueError('payload failed'))"
+            in capsys.readouterr().out
+        )
+
+
+class TestAsyncApp:
+    def run_app(self, tasks, workers_count=2):
+        async def main():
+            main_app = app.AsyncApp()
+            main_app.load_tasks(tasks)
+            main_app.add_entities(*(Worker(f"w{i}") for i in range(workers_count)))
+            main_app.add_entities(Manager("m1"), Manager("m2"))
+            await main_app.run_scheduled(stop_when_idle=True)
+
+        asyncio.run(main())
+
+    def test_timed_tasks_done(self, tasks):
+        self.run_app(tasks)
+        assert all(task.is_done for task in tasks)
+
+    def test_coroutine_payloads_share_event_loop(self, capsys):
+        async def sleep_and_square(i):
+            await asyncio.sleep(0.05)
+            return square(i)
+
+        tasks = payload_tasks(sleep_and_square, 200)
+        start = time.perf_counter()
+        self.run_app(tasks, workers_count=200)
+        assert time.perf_counter() - start < 1
+        assert [task.result for task in tasks] == [square(i) for i in range(200)]
+
+
+class TestFeedTasks:
+    def generate_tasks(self, main_app, count, high_water, prefix="Task"):
+        for i in range(count):
+            assert len(main_app.task_pool) <= high_water
+            yield Task(f"{prefix} nr {i}")
+
+    def create_app(self, **kwargs):
+        main_app = app.App(clock=VirtualClock(), **kwargs)
+        main_app.log_sink = None
+        main_app.add_entities(Worker("w1"), Worker("w2"), Manager("m1"))
+        return main_app
+
+    def test_pool_bounded_by_high_water(self):
+        main_app = self.create_app()
+        main_app.feed_tasks(self.generate_tasks(main_app, 1000, 10), high_water=10)
+        main_app.run_scheduled(stop_when_idle=True)
+        assert not main_app._feeds
+        assert len(main_app.task_pool) == 0
+
+    def test_feeds_consumed_in_order(self):
+        main_app = self.create_app()
+        started = []
+        main_app._event_pool[EntityEvents.TaskStarted].attach(
+            lambda worker, task: started.append(task.name)
+        )
+        main_app.feed_tasks(self.generate_tasks(main_app, 3, 2, "A"), high_water=2)
+        main_app.feed_tasks(self.generate_tasks(main_app, 3, 2, "B"), high_water=2)
+        main_app.run_scheduled(stop_when_idle=True)
+        assert started == [f"{prefix} nr {i}" for prefix in "AB" for i in range(3)]
+
+    def test_high_water_of_each_feed(self):
+        main_app = app.App()
+        main_app.feed_tasks(self.generate_tasks(main_app, 30, 10, "A"), high_water=10)
+        main_app.feed_tasks(self.generate_tasks(main_app, 30, 1024, "B"))
+        sizes = []
+        for _ in range(4):
+            main_app.run()
+            sizes.append(len(main_app.task_pool))
+            main_app.task_pool.pop_many(0)
+        # high water of later feed doesn't apply to the earlier one
+        assert sizes == [10, 10, 10, 30]
+        assert not main_app._feeds
+
+    def test_topped_up_on_every_run(self):
+        main_app = app.App()
+        main_app.feed_tasks(self.generate_tasks(main_app, 7, 5), high_water=5)
+        main_app.run()
+        assert len(main_app.task_pool) == 5
+        main_app.task_pool.pop_many(3)
+        main_app.run()
+        assert len(main_app.task_pool) == 4
+        assert not main_app._feeds
+
+    def test_async_iterable(self):
+        tasks = [Task(f"Task nr {i}") for i in range(20)]
+
+        async def generate_tasks():
+            for task in tasks:
+                await asyncio.sleep(0)
+                yield task
+
+        async def main():
+            main_app = app.AsyncApp()
+            main_app.log_sink = None
+            main_app.add_entities(Worker("w1"), Manager("m1"))
+            main_app.feed_tasks(generate_tasks(), high_water=3)
+            main_app.feed_tasks(iter([Task("last")]))
+            await main_app.run_scheduled(stop_when_idle=True)
+
+        asyncio.run(main())
+        assert all(task.is_done for task in tasks)
+
+
+class TestWeakSubscriptions:
+    def churn_workers(self, main_app, count):
+        for i in range(count):
+            main_app.add_entities(Worker(f"w{i}"))
+            if i % 1000 == 0:
+                main_app.run()
+        gc.collect()
+        main_app.run()
+
+    def test_dropped_workers_are_released(self, capsys):
+        main_app = app.App(weak_subscriptions=True)
+        self.churn_workers(main_app, 10_000)
+        assert len(main_app._event_pool[EntityEvents.Update]) == 0
+        assert len(main_app._event_pool[EntityEvents.DisposeTask]) == 0
+
+    def test_strong_subscriptions_keep_workers(self, capsys):
+        main_app = app.App()
+        self.churn_workers(main_app, 100)
+        assert len(main_app._event_pool[EntityEvents.Update]) == 100
+
+
+class CountingWorker(Worker):
+    def update(self) -> None:
+        self.updates = getattr(self, "updates", 0) + 1
+        super().update()
+
+
+class TestActiveUpdates:
+    @pytest.fixture
+    def busy_app(self):
+        tasks = [Task(f"Task nr {i}") for i in range(4)]
+        for i, task in enumerate(tasks):
+            task.seconds_to_finish = 10 * (i + 1)
+        main_app = app.App(clock=VirtualClock())
+        main_app.log_sink = None
+        main_app.load_tasks(tasks)
+        workers = [CountingWorker(f"w{i}") for i in range(4)]
+        manager = Manager("m")
+        manager.max_queued_tasks = 4
+        manager.batch_mode = True
+        main_app.add_entities(*workers, manager)
+        return main_app, workers, manager
+
+    def test_busy_entities_are_suspended(self, busy_app):
+        main_app, workers, manager = busy_app
+        for _ in range(3):
+            main_app.run()
+        assert all(worker.is_busy for worker in workers)
+        assert main_app._event_pool[EntityEvents.Update].suspended == 5
+
+        for _ in range(10):
+            main_app.run()
+        # queued once, then woken only by their tasks
+        assert [worker.updates for worker in workers] == [1, 1, 1, 1]
+
+    def test_worker_woken_when_task_is_done(self, busy_app):
+        main_app, workers, manager = busy_app
+        for _ in range(3):
+            main_app.run()
+        main_app.clock.advance(10)
+        main_app.run()
+        woken = [worker for worker in workers if worker.updates == 2]
+        assert len(woken) == 1
+        assert not woken[0].is_busy
+        assert main_app._event_pool[EntityEvents.Update].suspended == 5
+
+    def test_worker_without_app_checks_its_task(self):
+        event_pool = app.src.create_event_pool()
+        done = []
+        event_pool[EntityEvents.TaskDone].attach(lambda worker, task: done.append(task))
+        worker = CountingWorker("w")
+        worker.clock = VirtualClock()
+        worker.subscribe(event_pool)
+        task = Task("task")
+        task.seconds_to_finish = 10
+        event_pool[EntityEvents.Update]()
+        assert event_pool[EntityEvents.DisposeTask](task)
+        # nobody promised to wake it up
+        assert worker.needs_update
+        event_pool[EntityEvents.Update]()
+        worker.clock.advance(10)
+        event_pool[EntityEvents.Update]()
+        assert done == [task]
+        assert worker.updates == 3
+
+    def test_no_op_after_update_is_not_subscribed(self):
+        main_app = app.App()
+        worker, manager = Worker("w"), Manager("m")
+        main_app.add_entities(worker, manager)
+        after_update = main_app._event_pool[EntityEvents.AfterUpdate]
+        assert worker.after_update not in after_update
+        assert manager.after_update in after_update
+
+    def test_manager_woken_when_worker_queues(self):
+        manager = Manager("m")
+        main_app = app.App(clock=VirtualClock())
+        main_app.log_sink = None
+        main_app.add_entities(manager)
+        task = Task("task")
+        task.seconds_to_finish = 10
+        main_app.load_tasks([task])
+        for _ in range(3):
+            main_app.run()
+        assert not manager.needs_update
+        assert main_app._event_pool[EntityEvents.Update].suspended == 1
+
+        worker = Worker("w")
+        main_app.add_entities(worker)
+        main_app.run()
+        assert manager.needs_update
+        # manager was updated before the worker queued
+        assert not worker.is_busy
+        main_app.run()
+        assert worker.is_busy
+
+    def test_plain_entities_are_always_updated(self):
+        updates = []
+
+        class Ticker(app.src.Entity):
+            def update(self):
+                updates.append(self.name)
+
+        main_app = app.App()
+        main_app.add_entities(Ticker("t"))
+        for _ in range(3):
+            main_app.run()
+        assert updates == ["t", "t", "t"]
+
+    def test_same_dispatch_as_without_suspending(self, capsys):
+        class AlwaysActiveWorker(Worker):
+            needs_update = True
+
+        class AlwaysActiveManager(Manager):
+            needs_update = True
+
+        outputs = []
+        for worker_class, manager_class in [
+            (Worker, Manager),
+            (AlwaysActiveWorker, AlwaysActiveManager),
+        ]:
+            tasks = [Task(f"Task nr {i}") for i in range(12)]
+            for i, task in enumerate(tasks):
+                task.seconds_to_finish = (7 * i) % 5
+            main_app = app.App(clock=VirtualClock())
+            main_app.load_tasks(tasks)
+            managers = [manager_class(f"m{i}") for i in range(3)]
+            managers[0].max_queued_tasks = 3
+            managers[1].batch_mode = True
+            main_app.add_entities(*(worker_class(f"w{i}") for i in range(4)), *managers)
+            main_app.run_scheduled(stop_when_idle=True)
+            outputs.append(capsys.readouterr().out)
+        assert outputs[0] == outputs[1]
+        assert outputs[0].count("starts working") == 12
+
+
+class TestBatchMode:
+    def started_after_runs(self, batch_mode, runs):
+        tasks = [Task(f"Task nr {i}") for i in range(10)]
+        for task in tasks:
+            task.seconds_to_finish = 10
+        manager = Manager("m")
+        manager.max_queued_tasks = 10
+        manager.batch_mode = batch_mode
+
+        main_app = app.App()
+        main_app.load_tasks(tasks)
+        main_app.add_entities(*(Worker(f"w{i}") for i in range(10)), manager)
+        for _ in range(runs):
+            main_app.run()
+        return sum(task.start_time is not None for task in tasks)
+
+    def test_all_tasks_handed_over_in_single_pass(self, capsys):
+        assert self.started_after_runs(batch_mode=True, runs=2) == 10
+
+    def test_one_task_per_update_without_batch_mode(self, capsys):
+        assert self.started_after_runs(batch_mode=False, runs=2) == 1
+
+    @pytest.mark.parametrize("batch_mode, collected", [(True, 10), (False, 3)])
+    def test_no_limit_of_queued_tasks(self, batch_mode, collected):
+        tasks = [Task(f"Task nr {i}") for i in range(10)]
+        manager = Manager("m")
+        manager.max_queued_tasks = 0
+        manager.batch_mode = batch_mode
+        main_app = app.App()
+        main_app.log_sink = None
+        main_app.load_tasks(tasks)
+        main_app.add_entities(manager)
+        assert manager.can_collect_task
+        for _ in range(3):
+            main_app.run()
+        assert len(manager._task_pool) == collected
+        assert len(main_app.task_pool) == 10 - collected
+        assert manager.can_collect_task
+
+    def test_collected_tasks_logged(self, capsys):
+        self.started_after_runs(batch_mode=True, runs=1)
+        assert "m collected Task nr 0, Task nr 1, Task nr 2" in capsys.readouterr().out
+
+
+class TestProfiling:
+    def test_snapshot_per_event(self, main_app, capsys):
+        main_app.enable_profiling()
+        main_app.run_scheduled(stop_when_idle=True)
+        snapshot = main_app.profile_snapshot()
+        assert set(snapshot) == {event.name for event in EntityEvents}
+        assert snapshot["Update"]["calls"] > 0
+        assert "w1.update" in snapshot["Update"]["subscribers"]
+        assert snapshot["DisposeTask"]["subscribers"]["w1.work_on"]["calls"] == 3
+
+    def test_disable(self, main_app):
+        main_app.enable_profiling()
+        main_app.disable_profiling()
+        assert main_app.profile_snapshot() == {}
@@ -0,0 +1,241 @@
+"""
+Task distributions testing module
+"""
+# pylint: disable-all
+import asyncio
+
+import pytest
+
+from .. import app
+from ..src import (
+    EntityEvents,
+    LeastLoadedDistribution,
+    Manager,
+    RoundRobinDistribution,
+    ShortestExpectedTimeDistribution,
+    Task,
+    VirtualClock,
+    Worker,
+    create_event_pool,
+)
+
+
+def timed_tasks(*durations):
+    tasks = [Task(f"Task nr {i}") for i in range(len(durations))]
+    for task, duration in zip(tasks, durations):
+        task.seconds_to_finish = duration
+    return tasks
+
+
+def simulate(tasks, workers, task_distribution=None, **app_kwargs):
+    main_app = app.App(
+        clock=VirtualClock(), task_distribution=task_distribution, **app_kwargs
+    )
+    main_app.log_sink = None
+    main_app.load_tasks(tasks)
+    # kept alive for weak subscriptions
+    manager = Manager("m1")
+    main_app.add_entities(*workers, manager)
+    main_app.run_scheduled(stop_when_idle=True)
+    return main_app
+
+
+class TestWorkerSpeed:
+    def test_task_takes_time_divided_by_speed(self):
+        task = timed_tasks(8)[0]
+        main_app = simulate([task], [Worker("w", speed=4)])
+        assert task.finish_time - task.start_time == 2
+        assert main_app.clock.now() == 2
+
+    def test_estimate_logged_for_worker(self, capsys):
+        main_app = app.App(clock=VirtualClock())
+        main_app.load_tasks(timed_tasks(3))
+        main_app.add_entities(Worker("w", speed=2), Manager("m1"))
+        main_app.run_scheduled(stop_when_idle=True)
+        assert "(est. time: 1.50s)" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("speed", [0, -1])
+    def test_speed_has_to_be_positive(self, speed):
+        with pytest.raises(ValueError):
+            Worker("w", speed=speed)
+
+
+def queue(*workers):
+    for worker in workers:
+        worker.update()
+
+
+def dispose(event_pool, *tasks):
+    """:return: Names of workers, which got the tasks"""
+    chosen = []
+    started = lambda worker, task: chosen.append(worker.name)
+    event_pool[EntityEvents.TaskStarted].attach(started)
+    for task in tasks:
+        assert event_pool[EntityEvents.DisposeTask](task)
+    event_pool[EntityEvents.TaskStarted].detach(started)
+    return chosen
+
+
+class TestChoice:
+    @pytest.fixture
+    def workers(self):
+        return [
+            Worker("slow", speed=0.5),
+            Worker("fast", speed=2),
+            Worker("w", speed=1),
+        ]
+
+    @pytest.fixture
+    def event_pool(self, workers, request):
+        distribution = request.param()
+        event_pool = create_event_pool(task_distribution=distribution)
+        distribution.subscribe(event_pool)
+        clock = VirtualClock()
+        for worker in workers:
+            worker.clock = clock
+            worker.subscribe(event_pool)
+        return event_pool
+
+    @pytest.mark.parametrize(
+        "event_pool", [ShortestExpectedTimeDistribution], indirect=True
+    )
+    def test_shortest_expected_time_takes_fastest(self, event_pool, workers):
+        queue(*workers)
+        assert dispose(event_pool, *timed_tasks(1, 1, 1)) == ["fast", "w", "slow"]
+
+    def test_shortest_expected_time_tie_goes_to_longest_waiting(self):
+        distribution = ShortestExpectedTimeDistribution()
+        event_pool = create_event_pool(task_distribution=distribution)
+        distribution.subscribe(event_pool)
+        workers = [Worker(f"w{i}") for i in range(3)]
+        for worker in workers:
+            worker.subscribe(event_pool)
+        queue(*workers)
+        assert dispose(event_pool, *timed_tasks(1, 1)) == ["w0", "w1"]
+
+    @pytest.mark.parametrize("event_pool", [RoundRobinDistribution], indirect=True)
+    def test_round_robin(self, event_pool, workers):
+        queue(*workers)
+        assert dispose(event_pool, *timed_tasks(1, 1)) == ["slow", "fast"]
+        workers[0].clock.advance(2)
+        # fast one queued first, but got its last task later
+        queue(workers[1], workers[0])
+        assert dispose(event_pool, *timed_tasks(1, 1, 1)) == ["w", "slow", "fast"]
+
+    @pytest.mark.parametrize("event_pool", [LeastLoadedDistribution], indirect=True)
+    def test_least_loaded_by_assigned_work(self, event_pool, workers):
+        distribution = event_pool[EntityEvents.DisposeTask].event_distribution
+        queue(*workers)
+        assert dispose(event_pool, *timed_tasks(2, 2, 2)) == ["slow", "fast", "w"]
+        workers[0].clock.advance(4)
+        queue(*workers)
+        # loads: slow 4s, fast 1s, w 2s
+        assert dispose(event_pool, *timed_tasks(2, 2, 2)) == ["fast", "w", "slow"]
+        assert [distribution.rank(worker) for worker in workers] == [8, 2, 4]
+
+    @pytest.mark.parametrize(
+        "event_pool, chosen",
+        [(LeastLoadedDistribution, "fast"), (RoundRobinDistribution, "slow")],
+        indirect=["event_pool"],
+    )
+    def test_least_loaded_differs_from_round_robin(self, event_pool, chosen, workers):
+        slow, fast = workers[:2]
+        queue(slow, fast)
+        assert dispose(event_pool, *timed_tasks(2, 2)) == ["slow", "fast"]
+        slow.clock.advance(4)
+        # slow one waits the longest and got its last task first
+        queue(slow, fast)
+        assert dispose(event_pool, *timed_tasks(1)) == [chosen]
+
+    @pytest.mark.parametrize("event_pool", [LeastLoadedDistribution], indirect=True)
+    def test_least_loaded_before_longest_waiting(self, event_pool, workers):
+        distribution = event_pool[EntityEvents.DisposeTask].event_distribution
+        # work given before queueing
+        distribution.assign(timed_tasks(1)[0], workers[0])
+        queue(*workers)
+        assert dispose(event_pool, *timed_tasks(1, 1, 1)) == ["fast", "w", "slow"]
+
+    @pytest.mark.parametrize("event_pool", [RoundRobinDistribution], indirect=True)
+    def test_workers_no_longer_waiting_skipped(self, event_pool, workers):
+        queue(*workers)
+        event_pool[EntityEvents.DisposeTask].detach(workers[0].work_on)
+        assert dispose(event_pool, *timed_tasks(1)) == ["fast"]
+        assert dispose(event_pool, *timed_tasks(1)) == ["w"]
+        assert not event_pool[EntityEvents.DisposeTask](timed_tasks(1)[0])
+
+    def test_without_subscribing_waiting_taken_from_event(self, workers):
+        event_pool = create_event_pool(
+            task_distribution=ShortestExpectedTimeDistribution()
+        )
+        for worker in workers:
+            worker.subscribe(event_pool)
+        queue(*workers)
+        assert dispose(event_pool, *timed_tasks(1, 1)) == ["fast", "w"]
+
+
+class TestDisposition:
+    def test_default_gives_task_to_last_queued(self):
+        tasks = timed_tasks(8)
+        main_app = simulate(tasks, [Worker("fast", speed=4), Worker("slow")])
+        assert main_app.clock.now() == 8
+
+    def test_selected_in_app(self):
+        tasks = timed_tasks(8)
+        main_app = simulate(
+            tasks,
+            [Worker("fast", speed=4), Worker("slow")],
+            ShortestExpectedTimeDistribution(),
+        )
+        assert main_app.clock.now() == 2
+
+    def test_all_tasks_done(self):
+        tasks = timed_tasks(*range(1, 21))
+        workers = [Worker(f"w{i}", speed=1 + i % 3) for i in range(5)]
+        done = []
+        main_app = app.App(
+            clock=VirtualClock(), task_distribution=LeastLoadedDistribution()
+        )
+        main_app.log_sink = None
+        main_app._event_pool[app.src.EntityEvents.TaskDone].attach(
+            lambda worker, task: done.append(task)
+        )
+        main_app.load_tasks(tasks)
+        main_app.add_entities(*workers, Manager("m1"), Manager("m2"))
+        main_app.run_scheduled(stop_when_idle=True)
+        assert sorted(done, key=tasks.index) == tasks
+
+    def test_with_profiling(self):
+        main_app = app.App(
+            clock=VirtualClock(), task_distribution=ShortestExpectedTimeDistribution()
+        )
+        main_app.log_sink = None
+        main_app.enable_profiling()
+        main_app.load_tasks(timed_tasks(8))
+        main_app.add_entities(Worker("fast", speed=4), Worker("slow"), Manager("m1"))
+        main_app.run_scheduled(stop_when_idle=True)
+        assert main_app.clock.now() == 2
+        subscribers = main_app.profile_snapshot()["DisposeTask"]["subscribers"]
+        assert list(subscribers) == ["fast.work_on"]
+
+    def test_weak_subscriptions(self):
+        main_app = simulate(
+            timed_tasks(8),
+            [Worker("fast", speed=4), Worker("slow")],
+            RoundRobinDistribution(),
+            weak_subscriptions=True,
+        )
+        assert main_app.clock.now() == 2
+
+    def test_async_app(self):
+        tasks = timed_tasks(0.01, 0.01, 0.01)
+        workers = [Worker("w1"), Worker("w2")]
+
+        async def main():
+            main_app = app.AsyncApp(task_distribution=RoundRobinDistribution())
+            main_app.log_sink = None
+            main_app.load_tasks(tasks)
+            main_app.add_entities(*workers, Manager("m1"))
+            await main_app.run_scheduled(stop_when_idle=True)
+
+        asyncio.run(main())
+        assert all(task.is_done for task in tasks)
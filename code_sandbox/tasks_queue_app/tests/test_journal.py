@@ -0,0 +1,171 @@
+"""
+journal testing module
+"""
+# pylint: disable-all
+import time
+
+import pytest
+
+from .. import app
+from ..src import JournaledTaskPool, Manager, Task, TaskJournal, VirtualClock, Worker
+
+
+def create_tasks(count, seconds_to_finish=0.0):
+    tasks = [Task(f"Task nr {i}", priority=i % 2) for i in range(count)]
+    for task in tasks:
+        task.seconds_to_finish = seconds_to_finish
+    return tasks
+
+
+def names(tasks):
+    return [task.name for task in tasks]
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "tasks.journal")
+
+
+class TestTaskJournal:
+    def test_recovers_not_done_tasks(self, path):
+        with TaskJournal(path) as journal:
+            pool = JournaledTaskPool(journal, "app")
+            pool.put(*create_tasks(4))
+            in_flight = pool.pop()
+            done = pool.pop()
+            journal.record_done(done)
+
+        with TaskJournal(path) as journal:
+            pool = JournaledTaskPool(journal, "app")
+            assert journal.recovered_in_flight == 1
+            assert names(pool) == [in_flight.name, "Task nr 0", "Task nr 2"]
+            restored = next(task for task in pool if task.name == "Task nr 2")
+            assert restored.priority == 0
+            assert restored.seconds_to_finish == 0
+
+    def test_tasks_recovered_into_last_pool(self, path):
+        with TaskJournal(path) as journal:
+            app_pool = JournaledTaskPool(journal, "app")
+            manager_pool = JournaledTaskPool(journal, "manager")
+            app_pool.put(*create_tasks(3))
+            manager_pool.put(*app_pool.pop_many(2))
+            manager_pool.remove(manager_pool.get())
+
+        with TaskJournal(path) as journal:
+            assert names(JournaledTaskPool(journal, "app")) == ["Task nr 2"]
+            assert names(JournaledTaskPool(journal, "manager")) == [
+                "Task nr 1",
+                "Task nr 0",
+            ]
+
+    def test_group_commit(self, path):
+        journal = TaskJournal(path, fsync=False, group_size=10, group_interval=60)
+        pool = JournaledTaskPool(journal, "app")
+        pool.put(*create_tasks(5))
+        assert open(path).read() == ""
+        pool.put(*create_tasks(5))
+        assert len(open(path).readlines()) == 10
+        pool.pop()
+        journal.commit()
+        assert len(open(path).readlines()) == 11
+        journal.close()
+
+    def test_pending_records_committed_when_idle(self, path):
+        journal = TaskJournal(path, fsync=False, group_size=100, group_interval=0.05)
+        JournaledTaskPool(journal, "app").put(*create_tasks(3))
+        assert open(path).read() == ""
+        deadline = time.monotonic() + 5
+        while not open(path).read() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # crashed without closing the journal
+        with TaskJournal(path) as recovered:
+            assert len(JournaledTaskPool(recovered, "app")) == 3
+        journal.close()
+
+    def test_torn_last_record_ignored(self, path):
+        with TaskJournal(path) as journal:
+            JournaledTaskPool(journal, "app").put(*create_tasks(2))
+        with open(path, "a") as file:
+            file.write('{"op": "put", "id": 7, "po')
+
+        with TaskJournal(path) as journal:
+            assert len(JournaledTaskPool(journal, "app")) == 2
+
+    def test_compaction(self, path):
+        with TaskJournal(path, fsync=False) as journal:
+            pool = JournaledTaskPool(journal, "app")
+            for task in create_tasks(3000):
+                pool.put(task)
+                journal.record_done(pool.pop())
+            pool.put(*create_tasks(2))
+        assert len(open(path).readlines()) < 1100
+
+        with TaskJournal(path) as journal:
+            assert len(open(path).readlines()) == 2
+            assert len(JournaledTaskPool(journal, "app")) == 2
+
+    def test_queued_task_is_not_put_again(self, path):
+        with TaskJournal(path, fsync=False) as journal:
+            pool = JournaledTaskPool(journal, "app")
+            tasks = create_tasks(2)
+            pool.put(*tasks)
+            pool.put(tasks[0])
+            assert len(pool) == 2
+
+    def test_pool_names_are_unique(self, path):
+        with TaskJournal(path) as journal:
+            JournaledTaskPool(journal, "app")
+            with pytest.raises(ValueError):
+                JournaledTaskPool(journal, "app")
+
+
+class TestJournaledApp:
+    def create_app(self, journal):
+        main_app = app.App(
+            clock=VirtualClock(), task_pool=JournaledTaskPool(journal, "app")
+        )
+        main_app.log_sink = None
+        manager = Manager("m1", task_pool=JournaledTaskPool(journal, "m1"))
+        manager.max_queued_tasks = 3
+        manager.batch_mode = True
+        main_app.add_entities(Worker("w1"), manager)
+        return main_app, manager
+
+    def test_restart_rebuilds_app_and_manager_pools(self, path):
+        with TaskJournal(path) as journal:
+            main_app, manager = self.create_app(journal)
+            main_app.load_tasks(create_tasks(6, seconds_to_finish=1))
+            for _ in range(3):
+                main_app.run()
+            queued = names(main_app.task_pool)
+            collected = names(manager._task_pool)
+            assert len(queued) == 2
+            assert len(collected) == 3
+
+        # crashed with one task in progress - it goes back to manager's pool
+        with TaskJournal(path) as journal:
+            main_app, manager = self.create_app(journal)
+            assert journal.recovered_in_flight == 1
+            assert names(main_app.task_pool) == queued
+            assert len(manager._task_pool) == 4
+            assert names(manager._task_pool)[1:] == collected
+            main_app.run_scheduled(stop_when_idle=True)
+            assert len(main_app.task_pool) == 0
+
+        with TaskJournal(path) as journal:
+            assert len(JournaledTaskPool(journal, "app")) == 0
+            assert len(JournaledTaskPool(journal, "m1")) == 0
+
+    def test_manager_pool_records_done_tasks(self, path):
+        with TaskJournal(path) as journal:
+            main_app = app.App(clock=VirtualClock())
+            main_app.log_sink = None
+            manager = Manager("m1", task_pool=JournaledTaskPool(journal, "m1"))
+            main_app.add_entities(Worker("w1"), manager)
+            main_app.load_tasks(create_tasks(3, seconds_to_finish=1))
+            main_app.run_scheduled(stop_when_idle=True)
+
+        with TaskJournal(path) as journal:
+            assert journal.recovered_in_flight == 0
+            assert len(JournaledTaskPool(journal, "m1")) == 0
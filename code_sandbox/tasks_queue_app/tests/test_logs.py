@@ -0,0 +1,157 @@
+"""
+logs testing module
+"""
+# pylint: disable-all
+import gc
+import io
+import json
+import weakref
+
+import pytest
+
+from .. import app
+from ..src import (
+    BufferedLogSink,
+    LogKind,
+    LogRecord,
+    Manager,
+    Task,
+    TextLogSink,
+    Worker,
+)
+
+
+@pytest.fixture
+def record() -> LogRecord:
+    task = Task("Task nr 0")
+    return LogRecord(
+        LogKind.TaskStarted, Worker("Steve"), task, 12.5, {"estimate": 0.2}
+    )
+
+
+class TestLogRecord:
+    def test_message(self, record):
+        assert record.message == "Steve starts working on Task nr 0 (est. time: 0.20s)"
+
+    def test_as_dict(self, record):
+        assert record.as_dict() == {
+            "time": 12.5,
+            "event": "TaskStarted",
+            "entity": "Steve",
+            "task": "Task nr 0",
+            "estimate": 0.2,
+        }
+
+
+class TestTextLogSink:
+    def test_time_relative_to_start(self, record):
+        stream = io.StringIO()
+        TextLogSink(stream, start_time=10).write(record)
+        assert stream.getvalue() == (
+            "Time: 2.50s | Steve starts working on Task nr 0 (est. time: 0.20s)\n"
+        )
+
+
+class TestBufferedLogSink:
+    def test_json_lines_written_on_close(self, record):
+        stream = io.StringIO()
+        with BufferedLogSink(stream, flush_interval=60) as sink:
+            sink.write(record)
+            sink.write(record._replace(kind=LogKind.TaskDisposed, details={}))
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [line["event"] for line in lines] == ["TaskStarted", "TaskDisposed"]
+
+    def test_oldest_records_dropped_when_full(self, record):
+        stream = io.StringIO()
+        sink = BufferedLogSink(stream, capacity=2, flush_interval=60)
+        for timestamp in range(5):
+            sink.write(record._replace(timestamp=timestamp))
+        sink.close()
+        assert sink.dropped == 3
+        assert [
+            json.loads(line)["time"] for line in stream.getvalue().splitlines()
+        ] == [
+            3,
+            4,
+        ]
+
+    def test_written_in_background(self, record):
+        stream = io.StringIO()
+        sink = BufferedLogSink(stream, flush_interval=0.001)
+        with sink._flushed:
+            sink.write(record)
+            assert sink._flushed.wait_for(stream.getvalue, timeout=5)
+        sink.close()
+
+    def test_buffer_does_not_keep_entities(self, record):
+        stream = io.StringIO()
+        sink = BufferedLogSink(stream, flush_interval=60)
+        worker = Worker("w")
+        sink.write(
+            record._replace(entity=worker, details={"exception": ValueError("x")})
+        )
+        reference = weakref.ref(worker)
+        del worker
+        gc.collect()
+        assert reference() is None
+        sink.close()
+        line = json.loads(stream.getvalue())
+        assert (line["entity"], line["task"]) == ("w", "Task nr 0")
+        assert line["exception"] == "ValueError('x')"
+
+
+class TestMessages:
+    def test_entity_logs_formatted_message(self):
+        stream = io.StringIO()
+        main_app = app.App()
+        main_app.log_sink = TextLogSink(stream, start_time=main_app.clock.now())
+        worker = Worker("w")
+        main_app.add_entities(worker)
+        worker.log(f"{worker} says hello")
+        assert stream.getvalue().endswith("| w says hello\n")
+
+    def test_message_record(self):
+        stream = io.StringIO()
+        with BufferedLogSink(stream) as sink:
+            main_app = app.App()
+            main_app.log_sink = sink
+            worker = Worker("w")
+            main_app.add_entities(worker)
+            worker.log("w says hello")
+        assert json.loads(stream.getvalue())["message"] == "w says hello"
+
+    def test_print_log(self, capsys):
+        app.App().print_log("hello")
+        assert capsys.readouterr().out == "Time: 0.00s | hello\n"
+
+
+class TestAppLogging:
+    def run_app(self, main_app):
+        task = Task("Task nr 0")
+        main_app.load_tasks([task])
+        main_app.add_entities(Worker("w"), Manager("m"))
+        main_app.run_scheduled(stop_when_idle=True)
+
+    def test_records_not_created_without_sink(self, monkeypatch):
+        created = []
+        monkeypatch.setattr(LogRecord, "__new__", lambda *args: created.append(args))
+        main_app = app.App()
+        main_app.log_sink = None
+        self.run_app(main_app)
+        assert created == []
+
+    def test_buffered_sink(self):
+        stream = io.StringIO()
+        main_app = app.App()
+        with BufferedLogSink(stream) as sink:
+            main_app.log_sink = sink
+            self.run_app(main_app)
+        events = [json.loads(line)["event"] for line in stream.getvalue().splitlines()]
+        assert events == [
+            "Queued",
+            "TasksCollected",
+            "TaskStarted",
+            "TaskDisposed",
+            "MovedInQueue",
+            "TaskDoneAndQueued",
+        ]
@@ -0,0 +1,111 @@
+"""
+sharding testing module
+"""
+# pylint: disable-all
+import functools
+import os
+import pickle
+import time
+
+import pytest
+
+from ..sharding import ShardError, ShardedApp
+from ..src import Manager, Task, Worker
+
+
+def create_entities(shard):
+    return [Worker(f"w{shard}.{i}") for i in range(4)] + [Manager(f"m{shard}")]
+
+
+def failing_entities(shard):
+    if shard == 1:
+        raise ValueError("no entities")
+    return create_entities(shard)
+
+
+def dying_entities(shard):
+    if shard == 1:
+        os._exit(3)
+    return create_entities(shard)
+
+
+def square(value):
+    return value * value
+
+
+def fail(value):
+    raise ValueError(value)
+
+
+def create_tasks(count, seconds_to_finish=0.0):
+    tasks = [Task(f"Task nr {i}") for i in range(count)]
+    for task in tasks:
+        task.seconds_to_finish = seconds_to_finish
+    return tasks
+
+
+class TestShardedApp:
+    def test_all_tasks_done(self):
+        sharded_app = ShardedApp(3, create_entities, batch_size=10)
+        sharded_app.load_tasks(create_tasks(95))
+        reports = sharded_app.run()
+        assert [report.shard for report in reports] == [0, 1, 2]
+        assert sum(report.done for report in reports) == 95
+
+    def test_idle_shards_steal_tasks(self):
+        sharded_app = ShardedApp(2, create_entities, batch_size=4)
+        sharded_app.load_tasks(create_tasks(80, 0.01), shard=0)
+        reports = sharded_app.run()
+        assert sum(report.done for report in reports) == 80
+        assert reports[0].stolen == 0
+        assert reports[1].stolen == reports[1].done > 0
+
+    def test_runs_again_with_new_tasks(self):
+        sharded_app = ShardedApp(2, create_entities)
+        sharded_app.load_tasks(create_tasks(10))
+        sharded_app.run()
+        assert sum(report.done for report in sharded_app.run()) == 0
+        sharded_app.load_tasks(create_tasks(5))
+        assert sum(report.done for report in sharded_app.run()) == 5
+
+    def test_at_least_one_shard(self):
+        with pytest.raises(ValueError):
+            ShardedApp(0, create_entities)
+
+    def test_payload_outcomes_set_on_tasks(self):
+        tasks = create_tasks(20)
+        for i, task in enumerate(tasks):
+            task.payload = functools.partial(fail if i == 7 else square, i)
+        sharded_app = ShardedApp(2, create_entities, batch_size=3)
+        sharded_app.load_tasks(tasks)
+        reports = sharded_app.run()
+        assert sum(len(report.outcomes) for report in reports) == 20
+        assert [task.result for task in tasks] == [
+            None if i == 7 else i * i for i in range(20)
+        ]
+        assert isinstance(tasks[7].exception, ValueError)
+
+    def test_unpicklable_task_raises(self):
+        tasks = create_tasks(4)
+        tasks[2].payload = lambda: 1
+        sharded_app = ShardedApp(2, create_entities, batch_size=2)
+        sharded_app.load_tasks(tasks)
+        start = time.perf_counter()
+        with pytest.raises(pickle.PicklingError, match="Task nr 2"):
+            sharded_app.run()
+        assert time.perf_counter() - start < 10
+        # not lost
+        tasks[2].payload = None
+        assert sum(report.done for report in sharded_app.run()) == 4
+
+    @pytest.mark.parametrize("factory", [failing_entities, dying_entities])
+    def test_failed_shard_raises(self, factory):
+        sharded_app = ShardedApp(2, factory, batch_size=4)
+        sharded_app.load_tasks(create_tasks(20, 0.01))
+        start = time.perf_counter()
+        with pytest.raises(ShardError) as error:
+            sharded_app.run()
+        assert error.value.shard == 1
+        if factory is failing_entities:
+            assert "ValueError: no entities" in str(error.value)
+        assert time.perf_counter() - start < 10
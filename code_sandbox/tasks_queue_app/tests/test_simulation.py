@@ -0,0 +1,34 @@
+"""
+simulation benchmark testing module
+"""
+# pylint: disable-all
+import pytest
+
+from ..benchmarks.simulation import SimulationConfig, create_tasks, run_simulation
+
+
+class TestSimulation:
+    @pytest.mark.parametrize("scheduled", [False, True])
+    def test_all_tasks_done(self, scheduled):
+        config = SimulationConfig(managers=2, workers=4, tasks=50, scheduled=scheduled)
+        results = run_simulation(config)
+        assert results["ticks"] > 0
+        assert results["tasks_per_second"] > 0
+        assert 0 <= results["queue_wait"]["p50"] <= results["queue_wait"]["max"]
+        assert results["peak_memory"] is None
+
+    def test_seeded_durations(self):
+        config = SimulationConfig(tasks=10)
+        durations = [task.seconds_to_finish for task in create_tasks(config)]
+        assert durations == [task.seconds_to_finish for task in create_tasks(config)]
+        assert durations != [
+            task.seconds_to_finish for task in create_tasks(config._replace(seed=1))
+        ]
+
+    def test_streamed_tasks(self):
+        config = SimulationConfig(managers=1, workers=2, tasks=50, stream=True)
+        assert run_simulation(config._replace(high_water=5))["ticks"] > 0
+
+    def test_peak_memory(self):
+        config = SimulationConfig(managers=1, workers=1, tasks=5, trace_memory=True)
+        assert run_simulation(config)["peak_memory"] > 0
@@ -0,0 +1,143 @@
+"""
+TaskPool testing module
+"""
+# pylint: disable-all
+import pytest
+
+from ..src import Task, TaskPool
+
+
+@pytest.fixture
+def tasks():
+    return [Task(f"Task nr {i}") for i in range(5)]
+
+
+@pytest.fixture
+def pool(tasks) -> TaskPool:
+    pool = TaskPool()
+    pool.put(*tasks)
+    return pool
+
+
+class TestFifoOrder:
+    def test_empty_pool(self):
+        pool = TaskPool()
+        assert not pool
+        assert pool.get() is None
+        assert pool.pop() is None
+
+    def test_pop_in_order_of_putting(self, pool, tasks):
+        assert [pool.pop() for _ in tasks] == tasks
+        assert pool.pop() is None
+
+    def test_get_does_not_take_task(self, pool, tasks):
+        assert pool.get() is tasks[0]
+        assert pool.get() is tasks[0]
+        assert len(pool) == len(tasks)
+
+    def test_iter_in_order_of_putting(self, pool, tasks):
+        assert list(pool) == tasks
+
+    def test_putting_same_task_twice(self, pool, tasks):
+        pool.put(tasks[0])
+        assert len(pool) == len(tasks) + 1
+        assert list(pool) == tasks + tasks[:1]
+        assert pool.pop_many(0) == tasks + tasks[:1]
+
+
+class TestPriorities:
+    def test_higher_priority_taken_first(self, pool, tasks):
+        urgent = Task("urgent", priority=2)
+        important = Task("important", priority=1)
+        pool.put(important, urgent)
+        assert pool.pop() is urgent
+        assert pool.pop() is important
+        assert pool.pop() is tasks[0]
+
+    def test_negative_priority_taken_last(self, pool, tasks):
+        late = Task("late", priority=-1)
+        pool.put(late)
+        assert list(pool) == tasks + [late]
+
+    def test_same_priority_in_order_of_putting(self):
+        pool = TaskPool()
+        first, second = Task("first", priority=3), Task("second", priority=3)
+        pool.put(first, second)
+        assert list(pool) == [first, second]
+
+
+class TestKey:
+    @pytest.fixture
+    def sized(self):
+        tasks = [Task(f"Task nr {i}") for i in range(4)]
+        for task, size in zip(tasks, (3, 1, 2, 1)):
+            task.seconds_to_finish = size
+        return tasks
+
+    def test_lowest_key_taken_first(self, sized):
+        pool = TaskPool(key=lambda task: task.seconds_to_finish)
+        pool.put(*sized)
+        # equal keys in order of putting
+        assert list(pool) == [sized[1], sized[3], sized[2], sized[0]]
+        assert [pool.pop() for _ in sized] == [sized[1], sized[3], sized[2], sized[0]]
+
+    def test_priority_before_key(self, sized):
+        pool = TaskPool(key=lambda task: task.seconds_to_finish)
+        urgent = Task("urgent", priority=1)
+        urgent.seconds_to_finish = 10
+        pool.put(*sized, urgent)
+        pool.remove(sized[3])
+        assert pool.pop_many(0) == [urgent, sized[1], sized[2], sized[0]]
+
+
+class TestRemoval:
+    def test_remove_missing_task(self, pool):
+        assert not pool.remove(Task("not in pool"))
+
+    def test_get_and_remove(self, pool, tasks):
+        for task in tasks:
+            assert pool.get() is task
+            assert pool.remove(task)
+        assert not pool
+        assert pool.get() is None
+
+    def test_remove_from_the_middle(self, pool, tasks):
+        assert pool.remove(tasks[2])
+        assert not pool.remove(tasks[2])
+        assert list(pool) == tasks[:2] + tasks[3:]
+        assert [pool.pop() for _ in range(4)] == tasks[:2] + tasks[3:]
+
+    def test_remove_first_occurrence(self, pool, tasks):
+        pool.put(tasks[0])
+        assert pool.remove(tasks[0])
+        assert list(pool) == tasks[1:] + tasks[:1]
+        assert pool.remove(tasks[0])
+        assert not pool.remove(tasks[0])
+        assert list(pool) == tasks[1:]
+
+    def test_removed_task_can_be_put_again(self, pool, tasks):
+        pool.remove(tasks[0])
+        pool.put(tasks[0])
+        assert list(pool) == tasks[1:] + tasks[:1]
+
+    def test_many_removals_keep_order(self):
+        pool = TaskPool()
+        tasks = [Task(str(i), priority=i % 3) for i in range(1000)]
+        pool.put(*tasks)
+        for task in tasks[::2]:
+            pool.remove(task)
+        expected = sorted(tasks[1::2], key=lambda t: -t.priority)
+        assert len(pool) == len(expected)
+        assert list(pool) == expected
+        assert [pool.pop() for _ in expected] == expected
+
+
+class TestPopMany:
+    def test_pop_up_to_count(self, pool, tasks):
+        assert pool.pop_many(2) == tasks[:2]
+        assert pool.pop_many(10) == tasks[2:]
+        assert pool.pop_many(1) == []
+
+    def test_zero_pops_all(self, pool, tasks):
+        assert pool.pop_many(0) == tasks
+        assert not pool
@@ -0,0 +1,3 @@
+"""
+utils benchmarks package - run modules with `python -m`
+"""
@@ -0,0 +1,55 @@
+"""
+Module for comparing turn_into_floats with bulk turn_into_float_array
+
+Usage: python -m code_sandbox.utils.benchmarks.conversion
+"""
+import random
+import time
+from array import array
+from typing import Callable
+
+from .. import turn_into_float_array, turn_into_floats
+
+random.seed(321322)
+
+NUMBERS = 1_000_000
+
+
+def measure(conversion: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    conversion()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    values = [random.uniform(-1000, 1000) for _ in range(NUMBERS)]
+    text = " ".join(map(str, values))
+    buffer = array("d", values)
+
+    conversions = {
+        "list": (
+            lambda: turn_into_floats(*values),
+            lambda: turn_into_float_array(values),
+        ),
+        "text": (
+            lambda: turn_into_floats(*text.split()),
+            lambda: turn_into_float_array(text),
+        ),
+        "buffer": (
+            lambda: turn_into_floats(*buffer),
+            lambda: turn_into_float_array(buffer),
+        ),
+        "padded list": (
+            lambda: turn_into_floats(*values, output_count=2 * NUMBERS),
+            lambda: turn_into_float_array(values, output_count=2 * NUMBERS),
+        ),
+    }
+
+    print(f"{NUMBERS} numbers")
+    print(f"{'input':<12} | {'floats':>9} | {'array':>9} | speedup")
+    for name, (one_by_one, bulk) in conversions.items():
+        one_by_one_seconds, bulk_seconds = measure(one_by_one), measure(bulk)
+        print(
+            f"{name:<12} | {one_by_one_seconds * 1000:>7.1f}ms | "
+            f"{bulk_seconds * 1000:>7.1f}ms | {one_by_one_seconds / bulk_seconds:,.1f}x"
+        )
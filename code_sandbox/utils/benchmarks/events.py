@@ -0,0 +1,79 @@
+"""
+Module for measuring cost of Event subscribers management
+
+Usage: python -m code_sandbox.utils.benchmarks.events
+"""
+import time
+from typing import Callable, List
+
+from .. import Event
+
+SUBSCRIBERS = 10_000
+DISPATCHES = 100
+
+
+class Subscriber:
+    def update(self) -> None:
+        pass
+
+
+class ListEvent:
+    """List backed subscribers' management, as Event was implemented before"""
+
+    def __init__(self) -> None:
+        self._list: List[Callable] = []
+
+    def __call__(self, *args, **kwargs) -> None:
+        for item in self._list:
+            item(*args, **kwargs)
+
+    def attach(self, func: Callable) -> bool:
+        if func not in self._list:
+            self._list.append(func)
+            return True
+        return False
+
+    def detach(self, func: Callable) -> bool:
+        if func in self._list:
+            self._list.remove(func)
+            return True
+        return False
+
+    def reattach(self, func: Callable) -> None:
+        self.detach(func)
+        self.attach(func)
+
+
+def measure(event_type: type, subscribers: List[Subscriber]) -> List[float]:
+    event = event_type()
+    timings = []
+    for operation in (event.attach, event.reattach):
+        start = time.perf_counter()
+        for subscriber in subscribers:
+            operation(subscriber.update)
+        timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(DISPATCHES):
+        event()
+    timings.append((time.perf_counter() - start) / DISPATCHES)
+
+    start = time.perf_counter()
+    for subscriber in subscribers:
+        event.detach(subscriber.update)
+    timings.append(time.perf_counter() - start)
+    return timings
+
+
+if __name__ == "__main__":
+    subscribers = [Subscriber() for _ in range(SUBSCRIBERS)]
+    print(
+        f"{SUBSCRIBERS} subscribers, seconds for all of them to (or single dispatch):"
+    )
+    print(f"{'event':<10} | {'attach':>8} | {'reattach':>8} | {'dispatch':>8} | detach")
+    for event_type in (ListEvent, Event):
+        attach, reattach, dispatch, detach = measure(event_type, subscribers)
+        print(
+            f"{event_type.__name__:<10} | {attach:8.4f} | {reattach:8.4f} | "
+            f"{dispatch:8.4f} | {detach:.4f}"
+        )
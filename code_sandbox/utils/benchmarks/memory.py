@@ -0,0 +1,19 @@
+"""
+Module with helpers for measuring memory taken by objects
+"""
+import gc
+import tracemalloc
+from typing import Any, Callable
+
+
+def bytes_per_instance(factory: Callable[[int], Any], count: int = 100_000) -> float:
+    """Average amount of bytes allocated for keeping single object made by factory"""
+    objects = [None] * count
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        objects[i] = factory(i)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
@@ -4,9 +4,11 @@ Conversion utilities module
 
 __all__ = [
     "turn_into_floats",
+    "turn_into_float_array",
 ]
 
-from typing import Any, List
+from array import array
+from typing import Any, Iterable, List, Union
 
 
 def turn_into_floats(*args: Any, output_count: int = 0) -> List[float]:
@@ -29,3 +31,77 @@ def turn_into_floats(*args: Any, output_count: int = 0) -> List[float]:
     if output_count and len(numbers) > output_count:
         del numbers[output_count:]
     return numbers
+
+
+def turn_into_float_array(
+    data: Union[str, Iterable[Any], Any], output_count: int = 0
+) -> Union[array, memoryview]:
+    """
+    Bulk version of `turn_into_floats`, for large amounts of numbers.
+
+    :param data: One of:
+        - str, bytes, bytearray or memoryview of bytes with numbers delimited by
+          whitespaces, commas or semicolons
+        - other object supporting buffer protocol (array, memoryview, NumPy array...) -
+          its items are taken as numbers, buffers of doubles are not copied
+        - iterable of anything convertible into float
+    :param output_count: Optional fixed length, same as for `turn_into_floats`
+    :return: Array of doubles or, when data is a buffer of doubles and no padding is
+        needed, memoryview of that buffer
+    """
+
+    if output_count < 0:
+        return array("d")
+
+    if isinstance(data, str):
+        numbers = array(
+            "d", map(float, data.replace(",", " ").replace(";", " ").split())
+        )
+    elif isinstance(data, (bytes, bytearray)) or (
+        isinstance(data, memoryview) and data.format == "B"
+    ):
+        # float() parses bytes too, without decoding them first
+        numbers = array(
+            "d", map(float, bytes(data).replace(b",", b" ").replace(b";", b" ").split())
+        )
+    else:
+        try:
+            view = memoryview(data)
+        except TypeError:
+            numbers = _doubles_of_iterable(data)
+        else:
+            numbers = _doubles_of_buffer(view, output_count)
+            if isinstance(numbers, memoryview):
+                return numbers
+
+    if output_count and len(numbers) < output_count:
+        numbers.frombytes(bytes(numbers.itemsize * (output_count - len(numbers))))
+    if output_count and len(numbers) > output_count:
+        del numbers[output_count:]
+    return numbers
+
+
+def _doubles_of_buffer(view: memoryview, output_count: int) -> Union[array, memoryview]:
+    """Flat view of buffer of doubles, if it is enough, or array with its items"""
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes()).cast(view.format)
+    elif view.ndim != 1:
+        view = view.cast("B").cast(view.format)
+
+    if view.format != "d":
+        return array("d", view)
+    if output_count and len(view) < output_count:
+        numbers = array("d")
+        numbers.frombytes(view.cast("B"))
+        return numbers
+    return view[:output_count] if output_count else view
+
+
+def _doubles_of_iterable(data: Iterable[Any]) -> array:
+    if isinstance(data, (list, tuple)):
+        try:
+            # array converts ints and floats by itself, much faster than float() calls
+            return array("d", data)
+        except TypeError:
+            pass
+    return array("d", map(float, data))
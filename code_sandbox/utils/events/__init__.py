@@ -1 +1,2 @@
 from .events import *
+from .instrumentation import *
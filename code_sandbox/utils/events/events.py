@@ -1,9 +1,14 @@
 import abc
-from typing import Callable, Iterator, List, Optional
+import asyncio
+import functools
+import inspect
+import weakref
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional, Union
 
 
 __all__ = [
     "Event",
+    "EventDistribution",
     "ForEveryCallbackDistribution",
     "ForFirstToTakeDistribution",
 ]
@@ -19,6 +24,58 @@ class EventDistribution(abc.ABC):
     def call_event(self, *args, **kwargs) -> bool:
         pass
 
+    async def call_event_async(self, *args, **kwargs) -> bool:
+        """
+        Same as call_event, but awaits callbacks returning awaitables. By default
+        callbacks are called by call_event and their awaitables are awaited together.
+        """
+        awaitables = []
+        context = self.context
+        self.context = _AwaitablesCollector(context, awaitables)
+        try:
+            result = self.call_event(*args, **kwargs)
+        finally:
+            self.context = context
+        if awaitables:
+            await asyncio.gather(*awaitables)
+        return result
+
+
+class _AwaitablesCollector:
+    """View of the event handing out callbacks, which collect returned awaitables"""
+
+    def __init__(self, event: "Event", awaitables: List[Awaitable]) -> None:
+        self._event = event
+        self._awaitables = awaitables
+
+    def __bool__(self) -> bool:
+        return bool(self._event)
+
+    def __len__(self) -> int:
+        return len(self._event)
+
+    def __contains__(self, item: Callable) -> bool:
+        return item in self._event
+
+    def __iter__(self) -> Iterator[Callable]:
+        return (self._collecting(item) for item in self._event)
+
+    def take(self, func: Callable) -> Callable:
+        return self._collecting(self._event.take(func))
+
+    def pop(self, idx: Optional[int] = None) -> Callable:
+        return self._collecting(self._event.pop(idx))
+
+    def _collecting(self, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def collecting(*args, **kwargs):
+            result = func(*args, **kwargs)
+            if inspect.isawaitable(result):
+                self._awaitables.append(result)
+            return result
+
+        return collecting
+
 
 class ForEveryCallbackDistribution(EventDistribution):
     def call_event(self, *args, **kwargs):
@@ -27,6 +84,13 @@ class ForEveryCallbackDistribution(EventDistribution):
         else:
             return True
 
+    async def call_event_async(self, *args, **kwargs) -> bool:
+        results = [item(*args, **kwargs) for item in self.context]
+        awaitables = [result for result in results if inspect.isawaitable(result)]
+        if awaitables:
+            await asyncio.gather(*awaitables)
+        return True
+
 
 class ForFirstToTakeDistribution(EventDistribution):
     def call_event(self, *args, **kwargs) -> bool:
@@ -37,26 +101,95 @@ class ForFirstToTakeDistribution(EventDistribution):
         item(*args, **kwargs)
         return True
 
+    async def call_event_async(self, *args, **kwargs) -> bool:
+        if not self.context:
+            return False
+
+        result = self.context.pop()(*args, **kwargs)
+        if inspect.isawaitable(result):
+            await result
+        return True
+
+
+# fields of nodes of Event's linked list
+_PREV, _NEXT, _KEY, _ORDER = range(4)
+
 
 class Event:
-    _list: List[Callable]
+    """
+    Ordered set of callbacks. Callbacks are mapped to numbers growing with every
+    attaching - their order - and kept in doubly linked list sorted by it, with dict of
+    its nodes. Membership check, attaching, detaching, suspending and moving to the end
+    are O(1).
+
+    In weak mode bound methods are kept as weak references, so subscribing does not
+    keep their objects alive. References of dead objects are only noted when objects
+    die and dropped lazily, on next use of the event.
+
+    Attached callbacks can be suspended - they keep their order, but are unlinked until
+    resumed, so calling the event takes time proportional to amount of not suspended
+    callbacks only. Unlinked nodes keep pointing to the next ones, resumed callback is
+    linked back in front of the first linked node found that way - resuming takes time
+    proportional to amount of callbacks unlinked after it or linked next to it since it
+    was suspended.
+    """
+
+    # nodes of not suspended callbacks and of suspended ones
+    _nodes: Dict[Union[Callable, weakref.WeakMethod], List]
+    _suspended: Dict[Union[Callable, weakref.WeakMethod], List]
+    # node before the first one and after the last one, of the lowest order
+    _root: List
+    _next_order: int
     _event_distribution: EventDistribution
+    _weak: bool
+    _dead: List[weakref.WeakMethod]
 
-    def __init__(self) -> None:
-        self._list = []
+    def __init__(self, weak: bool = False) -> None:
+        self._nodes = {}
+        self._suspended = {}
+        self._root = [None, None, None, -1]
+        self._root[_PREV] = self._root[_NEXT] = self._root
+        self._next_order = 0
+        self._weak = weak
+        self._dead = []
         self.event_distribution = ForEveryCallbackDistribution()
 
     def __bool__(self) -> bool:
-        return True if self._list else False
+        if self._dead:
+            self._drop_dead()
+        return True if self._nodes or self._suspended else False
 
     def __call__(self, *args, **kwargs) -> bool:
         return self._event_distribution.call_event(*args, **kwargs)
 
+    async def call_async(self, *args, **kwargs) -> bool:
+        """Call event awaiting coroutine callbacks concurrently"""
+        return await self._event_distribution.call_event_async(*args, **kwargs)
+
     def __contains__(self, item: Callable) -> bool:
-        return item in self._list
+        key = self._key(item) if self._weak else item
+        return key in self._nodes or key in self._suspended
 
     def __iter__(self) -> Iterator[Callable]:
-        return self._list.__iter__()
+        """
+        Iterates over not suspended callbacks in their order, so callbacks can be
+        attached and detached meanwhile. Callbacks attached meanwhile, also the ones
+        moved to the end, are left for the next iteration, detached or suspended ones
+        are skipped and resumed ones are included if their turn has not passed yet.
+        """
+        if self._dead:
+            self._drop_dead()
+        return self._iter_ordered()
+
+    def __len__(self) -> int:
+        """Amount of attached callbacks, including suspended ones"""
+        if self._dead:
+            self._drop_dead()
+        return len(self._nodes) + len(self._suspended)
+
+    @property
+    def weak(self) -> bool:
+        return self._weak
 
     @property
     def empty(self) -> bool:
@@ -71,26 +204,188 @@ class Event:
         self._event_distribution = event_distribution
         self._event_distribution.set_context(self)
 
+    @property
+    def suspended(self) -> int:
+        """Amount of suspended callbacks"""
+        return len(self._suspended)
+
     def pop(self, idx: Optional[int] = None) -> Callable:
-        if idx is None:
-            idx = -1
+        """
+        Detach and return callback of given index, suspended callbacks are skipped.
+        The first and the last ones are taken in O(1), others in O(distance to them).
+        """
+        if self._dead:
+            self._drop_dead()
+        if not self._nodes:
+            raise IndexError("pop from empty Event")
+
+        root = self._root
+        if idx is None or idx == -1:
+            node = root[_PREV]
+        elif idx == 0:
+            node = root[_NEXT]
+        else:
+            size = len(self._nodes)
+            if idx < 0:
+                idx += size
+            if not 0 <= idx < size:
+                raise IndexError("Event index out of range")
+
+            if idx < size // 2:
+                node = root[_NEXT]
+                for _ in range(idx):
+                    node = node[_NEXT]
+            else:
+                node = root[_PREV]
+                for _ in range(size - 1 - idx):
+                    node = node[_PREV]
 
-        return self._list.pop(idx)
+        key = node[_KEY]
+        del self._nodes[key]
+        self._drop(node)
+        return self._resolve(key)
+
+    def take(self, func: Callable) -> Callable:
+        """Detach and return not suspended callback like pop, ValueError if it is not"""
+        if self._dead:
+            self._drop_dead()
+
+        key = self._key(func) if self._weak else func
+        node = self._nodes.pop(key, None)
+        if node is None:
+            raise ValueError(f"{func!r} is not attached or is suspended")
+
+        self._drop(node)
+        return self._resolve(key)
 
     def attach(self, func: Callable) -> bool:
-        if func not in self._list:
-            self._list.append(func)
-            return True
+        if self._dead:
+            self._drop_dead()
 
-        return False
+        key = self._key(func) if self._weak else func
+        if key in self._nodes or key in self._suspended:
+            return False
+
+        root = self._root
+        last = root[_PREV]
+        node = last[_NEXT] = root[_PREV] = [last, root, key, self._next_order]
+        self._nodes[key] = node
+        self._next_order += 1
+        return True
 
     def detach(self, func: Callable = None) -> bool:
-        if func in self._list:
-            self._list.remove(func)
+        key = self._key(func) if self._weak else func
+        node = self._nodes.pop(key, None)
+        if node is not None:
+            self._drop(node)
             return True
 
-        return False
+        node = self._suspended.pop(key, None)
+        if node is None:
+            return False
+
+        node[_KEY] = None
+        return True
+
+    def suspend(self, func: Callable) -> bool:
+        """Stop calling attached callback, until it is resumed"""
+        key = self._key(func) if self._weak else func
+        node = self._nodes.pop(key, None)
+        if node is None:
+            return False
+
+        self._suspended[key] = node
+        self._unlink(node)
+        return True
+
+    def resume(self, func: Callable) -> bool:
+        """Call suspended callback again, in its place in the order"""
+        if not self._suspended:
+            return False
+
+        key = self._key(func) if self._weak else func
+        node = self._suspended.pop(key, None)
+        if node is None:
+            return False
+
+        self._nodes[key] = node
+        following = self._following(node)
+        previous = following[_PREV]
+        node[_PREV], node[_NEXT] = previous, following
+        previous[_NEXT] = following[_PREV] = node
+        return True
 
     def reattach(self, func: Callable) -> None:
         self.detach(func)
         self.attach(func)
+
+    def _key(self, func: Callable) -> Union[Callable, weakref.WeakMethod]:
+        if self._weak and inspect.ismethod(func):
+            return weakref.WeakMethod(func, self._dead.append)
+        return func
+
+    @staticmethod
+    def _resolve(key: Union[Callable, weakref.WeakMethod]) -> Optional[Callable]:
+        """Callback of the key, None if it is reference of dead object"""
+        if isinstance(key, weakref.WeakMethod):
+            return key()
+        return key
+
+    @staticmethod
+    def _unlink(node: List) -> None:
+        # next node is kept, for iterations and resuming
+        previous, following = node[_PREV], node[_NEXT]
+        previous[_NEXT] = following
+        following[_PREV] = previous
+        node[_PREV] = None
+
+    def _drop(self, node: List) -> None:
+        """Unlink node of detached callback"""
+        self._unlink(node)
+        # node can still be pointed to by unlinked ones, callback is not kept by it
+        node[_KEY] = None
+
+    @staticmethod
+    def _following(node: List) -> List:
+        """First linked node of higher order than given one, which may be unlinked"""
+        following = node[_NEXT]
+        if following[_PREV] is None:
+            skipped = []
+            while following[_PREV] is None:
+                skipped.append(following)
+                following = following[_NEXT]
+            # shortcut for next walks through them
+            for unlinked in skipped:
+                unlinked[_NEXT] = following
+        if node[_PREV] is None:
+            node[_NEXT] = following
+
+        # nodes linked meanwhile are before the one found, root has the lowest order
+        order = node[_ORDER]
+        while following[_PREV][_ORDER] > order:
+            following = following[_PREV]
+        return following
+
+    def _iter_ordered(self) -> Iterator[Callable]:
+        root, weak = self._root, self._weak
+        # callbacks attached meanwhile get orders from this one on
+        end = self._next_order
+        node = root[_NEXT]
+        while node is not root and node[_ORDER] < end:
+            func = self._resolve(node[_KEY]) if weak else node[_KEY]
+            if func is not None:
+                yield func
+            # node unlinked meanwhile still leads to the following ones
+            node = node[_NEXT] if node[_PREV] is not None else self._following(node)
+
+    def _drop_dead(self) -> None:
+        # dead references are equal only to themselves, so they do not block
+        # attaching methods of new objects, but their hashes may collide with them
+        while self._dead:
+            key = self._dead.pop()
+            node = self._nodes.pop(key, None)
+            if node is not None:
+                self._drop(node)
+            node = self._suspended.pop(key, None)
+            if node is not None:
+                node[_KEY] = None
@@ -0,0 +1,161 @@
+import collections
+import functools
+import inspect
+import time
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, Optional
+
+from .events import Event, EventDistribution
+
+__all__ = [
+    "EventStats",
+    "InstrumentedDistribution",
+]
+
+
+class LatencyStats:
+    """Calls count, cumulative time and recent samples for percentiles"""
+
+    calls: int
+    total: float
+    _samples: Deque[float]
+
+    def __init__(self, max_samples: int) -> None:
+        self.calls = 0
+        self.total = 0.0
+        self._samples = collections.deque(maxlen=max_samples)
+
+    def add(self, seconds: float) -> None:
+        self.calls += 1
+        self.total += seconds
+        self._samples.append(seconds)
+
+    def percentile(self, fraction: float) -> float:
+        if not self._samples:
+            return 0.0
+
+        samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "calls": self.calls,
+            "total": self.total,
+            "p50": self.percentile(0.5),
+            "p99": self.percentile(0.99),
+        }
+
+
+class EventStats:
+    """
+    Latencies of event's calls and of each of its subscribers. Subscribers are
+    identified by labels, so bound methods of equally named objects are summed up.
+    """
+
+    event: LatencyStats
+    subscribers: Dict[str, LatencyStats]
+
+    def __init__(self, max_samples: int = 1024) -> None:
+        self._max_samples = max_samples
+        self.event = LatencyStats(max_samples)
+        self.subscribers = {}
+
+    def add(self, label: str, seconds: float) -> None:
+        stats = self.subscribers.get(label)
+        if stats is None:
+            stats = self.subscribers[label] = LatencyStats(self._max_samples)
+        stats.add(seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            **self.event.summary(),
+            "subscribers": {
+                label: stats.summary() for label, stats in self.subscribers.items()
+            },
+        }
+
+
+def label_of(func: Callable) -> str:
+    if inspect.ismethod(func):
+        return f"{func.__self__}.{func.__name__}"
+    return getattr(func, "__qualname__", repr(func))
+
+
+class InstrumentedContext:
+    """View of the event for wrapped distribution, handing out timed callbacks"""
+
+    def __init__(self, event: Event, stats: EventStats) -> None:
+        self._event = event
+        self._stats = stats
+
+    def __bool__(self) -> bool:
+        return bool(self._event)
+
+    def __len__(self) -> int:
+        return len(self._event)
+
+    def __contains__(self, item: Callable) -> bool:
+        return item in self._event
+
+    def __iter__(self) -> Iterator[Callable]:
+        return (self._timed(item) for item in self._event)
+
+    def take(self, func: Callable) -> Callable:
+        return self._timed(self._event.take(func))
+
+    def pop(self, idx: Optional[int] = None) -> Callable:
+        return self._timed(self._event.pop(idx))
+
+    def _timed(self, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            if inspect.isawaitable(result):
+                return self._timed_awaitable(func, result, start)
+
+            self._stats.add(label_of(func), time.perf_counter() - start)
+            return result
+
+        return timed
+
+    async def _timed_awaitable(
+        self, func: Callable, awaitable: Awaitable, start: float
+    ) -> Any:
+        try:
+            return await awaitable
+        finally:
+            self._stats.add(label_of(func), time.perf_counter() - start)
+
+
+class InstrumentedDistribution(EventDistribution):
+    """
+    Wrapper of other distribution, recording latencies of event calls and of each
+    called subscriber. Events without this wrapper have no instrumentation overhead.
+    """
+
+    distribution: EventDistribution
+    stats: EventStats
+
+    def __init__(
+        self, distribution: EventDistribution, stats: Optional[EventStats] = None
+    ) -> None:
+        self.distribution = distribution
+        self.stats = EventStats() if stats is None else stats
+
+    def set_context(self, context):
+        super().set_context(context)
+        self.distribution.set_context(InstrumentedContext(context, self.stats))
+
+    def call_event(self, *args, **kwargs) -> bool:
+        start = time.perf_counter()
+        try:
+            return self.distribution.call_event(*args, **kwargs)
+        finally:
+            self.stats.event.add(time.perf_counter() - start)
+
+    async def call_event_async(self, *args, **kwargs) -> bool:
+        start = time.perf_counter()
+        try:
+            return await self.distribution.call_event_async(*args, **kwargs)
+        finally:
+            self.stats.event.add(time.perf_counter() - start)
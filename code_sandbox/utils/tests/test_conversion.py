@@ -2,9 +2,11 @@
 conversion utilities testing module
 """
 # pylint: disable-all
+from array import array
+
 import pytest
 
-from .. import turn_into_floats
+from .. import turn_into_float_array, turn_into_floats
 
 
 class TestTurnIntoFloats:
@@ -36,3 +38,75 @@ class TestTurnIntoFloats:
 
     def test_negative_limit(self):
         assert turn_into_floats(1, 2, 3, output_count=-1) == []
+
+
+class TestTurnIntoFloatArray:
+    def test_iterable(self):
+        numbers = turn_into_float_array(range(6))
+        assert isinstance(numbers, array)
+        assert numbers.typecode == "d"
+        assert list(numbers) == list(range(6))
+
+    def test_delimited_text(self):
+        assert list(turn_into_float_array("1, 2;3\n -4.5e1")) == [1, 2, 3, -45]
+
+    def test_empty_text(self):
+        assert list(turn_into_float_array("")) == []
+
+    def test_wrong_string_passed(self):
+        with pytest.raises(ValueError):
+            turn_into_float_array("1, not_a_number")
+
+    def test_buffer_of_doubles_not_copied(self):
+        numbers = array("d", [1, 2, 3])
+        view = turn_into_float_array(numbers)
+        assert isinstance(view, memoryview)
+        assert view.obj is numbers
+        numbers[0] = 10
+        assert list(view) == [10, 2, 3]
+
+    def test_other_buffers_converted(self):
+        assert list(turn_into_float_array(array("i", [1, -2]))) == [1, -2]
+
+    @pytest.mark.parametrize(
+        "data",
+        [b"1.5,2;-3", bytearray(b"1.5,2;-3"), memoryview(b"1.5,2;-3")],
+        ids=["bytes", "bytearray", "memoryview"],
+    )
+    def test_bytes_parsed_as_delimited_text(self, data):
+        assert list(turn_into_float_array(data)) == [1.5, 2, -3]
+        assert list(turn_into_float_array(data, output_count=4)) == [1.5, 2, -3, 0]
+
+    def test_wrong_bytes_passed(self):
+        with pytest.raises(ValueError):
+            turn_into_float_array(b"1, not_a_number")
+
+    def test_empty_bytes(self):
+        assert list(turn_into_float_array(b"")) == []
+
+    @pytest.mark.parametrize(
+        "data",
+        [array("B", b"1 2"), memoryview(b"1 2").cast("b")],
+        ids=["array", "memoryview"],
+    )
+    def test_typed_buffers_of_bytes_taken_as_raw_items(self, data):
+        assert list(turn_into_float_array(data)) == [49, 32, 50]
+
+    def test_not_contiguous_and_multidimensional_buffers(self):
+        numbers = array("d", range(4))
+        assert list(turn_into_float_array(memoryview(numbers)[::2])) == [0, 2]
+        square = memoryview(numbers).cast("B").cast("d", [2, 2])
+        assert list(turn_into_float_array(square)) == [0, 1, 2, 3]
+
+    @pytest.mark.parametrize(
+        "data", [[1, 2, 3], "1 2 3", array("d", [1, 2, 3])], ids=["list", "str", "buf"]
+    )
+    def test_output_count(self, data):
+        assert list(turn_into_float_array(data, output_count=2)) == [1, 2]
+        assert list(turn_into_float_array(data, output_count=5)) == [1, 2, 3, 0, 0]
+        assert list(turn_into_float_array(data, output_count=0)) == [1, 2, 3]
+        assert list(turn_into_float_array(data, output_count=-1)) == []
+
+    def test_truncated_buffer_is_view(self):
+        numbers = array("d", [1, 2, 3])
+        assert turn_into_float_array(numbers, output_count=2).obj is numbers
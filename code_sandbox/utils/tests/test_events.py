@@ -0,0 +1,352 @@
+"""
+events utilities testing module
+"""
+# pylint: disable-all
+import asyncio
+import time
+
+import pytest
+
+from .. import Event, EventDistribution, ForFirstToTakeDistribution
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def callbacks(calls):
+    return [lambda *args, i=i: calls.append((i, args)) for i in range(3)]
+
+
+@pytest.fixture
+def event(callbacks) -> Event:
+    event = Event()
+    for callback in callbacks:
+        event.attach(callback)
+    return event
+
+
+class Subscriber:
+    def __init__(self):
+        self.calls = 0
+
+    def callback(self):
+        self.calls += 1
+
+
+class TestEvent:
+    def test_attach_only_once(self, event, callbacks):
+        assert not event.attach(callbacks[0])
+        assert len(event) == 3
+
+    def test_bound_methods_of_same_object(self):
+        event, subscriber = Event(), Subscriber()
+        assert event.attach(subscriber.callback)
+        assert not event.attach(subscriber.callback)
+        assert subscriber.callback in event
+        assert Subscriber().callback not in event
+        assert event.detach(subscriber.callback)
+        assert event.empty
+
+    def test_detach(self, event, callbacks):
+        assert event.detach(callbacks[1])
+        assert not event.detach(callbacks[1])
+        assert list(event) == [callbacks[0], callbacks[2]]
+
+    def test_reattach_moves_to_the_end(self, event, callbacks):
+        event.reattach(callbacks[0])
+        assert list(event) == callbacks[1:] + callbacks[:1]
+
+    def test_pop(self, event, callbacks):
+        assert event.pop() is callbacks[2]
+        assert event.pop(0) is callbacks[0]
+        assert event.pop(-1) is callbacks[1]
+        with pytest.raises(IndexError):
+            event.pop()
+
+    def test_pop_from_the_middle(self, event, callbacks):
+        event.attach(callbacks[0])
+        extra = [lambda: None for _ in range(4)]
+        for callback in extra:
+            event.attach(callback)
+        assert event.pop(1) is callbacks[1]
+        assert event.pop(-2) is extra[2]
+        assert list(event) == callbacks[::2] + extra[:2] + extra[3:]
+        with pytest.raises(IndexError):
+            event.pop(5)
+
+    def test_take(self, event, callbacks):
+        assert event.take(callbacks[1]) is callbacks[1]
+        event.suspend(callbacks[0])
+        with pytest.raises(ValueError):
+            event.take(callbacks[0])
+        with pytest.raises(ValueError):
+            event.take(callbacks[1])
+        assert list(event) == [callbacks[2]]
+
+    def test_detached_during_call_is_skipped(self, callbacks, calls):
+        event = Event()
+        event.attach(callbacks[0])
+        event.attach(lambda: event.detach(callbacks[0]) and event.detach(callbacks[2]))
+        event.attach(callbacks[1])
+        event.attach(callbacks[2])
+        event()
+        assert [i for i, _ in calls] == [0, 1]
+
+    def test_attached_during_call_waits_for_next_call(self, calls):
+        event = Event()
+        event.attach(lambda: event.attach(lambda: calls.append("new")))
+        event()
+        assert calls == []
+        event()
+        assert calls == ["new"]
+
+
+class TestSuspendedCallbacks:
+    def test_suspended_are_not_called(self, event, callbacks, calls):
+        assert event.suspend(callbacks[1])
+        assert not event.suspend(callbacks[1])
+        event()
+        assert [i for i, _ in calls] == [0, 2]
+        assert callbacks[1] in event
+        assert len(event) == 3
+        assert event.suspended == 1
+
+    def test_resumed_keep_their_place(self, event, callbacks):
+        event.suspend(callbacks[0])
+        event.suspend(callbacks[1])
+        assert list(event) == [callbacks[2]]
+        assert event.resume(callbacks[1])
+        assert event.resume(callbacks[0])
+        assert not event.resume(callbacks[0])
+        assert list(event) == callbacks
+        assert event.suspended == 0
+
+    def test_attach_and_detach_suspended(self, event, callbacks):
+        event.suspend(callbacks[0])
+        assert not event.attach(callbacks[0])
+        assert event.detach(callbacks[0])
+        assert not event.resume(callbacks[0])
+        assert list(event) == callbacks[1:]
+
+    def test_resumed_during_call(self, callbacks, calls):
+        event = Event()
+        event.attach(callbacks[0])
+        event.attach(lambda: event.resume(callbacks[0]) and event.resume(callbacks[2]))
+        event.attach(callbacks[1])
+        event.attach(callbacks[2])
+        event.suspend(callbacks[0])
+        event.suspend(callbacks[2])
+        event()
+        # callback before the resuming one has to wait for next call
+        assert [i for i, _ in calls] == [1, 2]
+        event()
+        assert [i for i, _ in calls] == [1, 2, 0, 1, 2]
+
+    def test_resumed_in_order_while_stale_ones_are_dropped(self, calls):
+        callbacks = [lambda i=i: calls.append(i) for i in range(10)]
+
+        def resume_all():
+            calls.append("resume")
+            for callback in reversed(callbacks):
+                event.resume(callback)
+
+        event = Event()
+        for callback in callbacks[:5] + [resume_all] + callbacks[5:]:
+            event.attach(callback)
+        for callback in callbacks[:9]:
+            event.suspend(callback)
+        event()
+        # turn of the ones before resuming callback has passed
+        assert calls == ["resume", 5, 6, 7, 8, 9]
+        calls.clear()
+        event.detach(resume_all)
+        event.suspend(callbacks[2])
+        event.pop(0)
+        event()
+        assert calls == [1, 3, 4, 5, 6, 7, 8, 9]
+
+    @pytest.mark.parametrize("weak", [False, True])
+    def test_same_calls_with_other_callback_suspended(self, weak, calls):
+        def dispatched(suspend_other):
+            calls.clear()
+            event = Event(weak)
+            c, d = lambda: calls.append("C"), lambda: calls.append("D")
+            other = lambda: calls.append("other")
+            event.attach(lambda: calls.append("A") or event.reattach(c))
+            for callback in (lambda: calls.append("B"), c, d, other):
+                event.attach(callback)
+            if suspend_other:
+                event.suspend(other)
+            event()
+            return [call for call in calls if call != "other"]
+
+        # moved to the end meanwhile, so left for the next call
+        assert dispatched(False) == dispatched(True) == ["A", "B", "D"]
+
+    def test_suspended_during_call_is_skipped(self, callbacks, calls):
+        event = Event()
+        event.attach(lambda: event.suspend(callbacks[0]))
+        event.attach(callbacks[0])
+        event()
+        assert calls == []
+
+    def test_weak_event(self):
+        event = Event(weak=True)
+        first, second = Subscriber(), Subscriber()
+        event.attach(first.callback)
+        event.attach(second.callback)
+        event.suspend(first.callback)
+        event()
+        event.resume(first.callback)
+        event()
+        assert (first.calls, second.calls) == (1, 2)
+        event.suspend(second.callback)
+        del second
+        assert len(event) == 1
+
+
+class TestForEveryCallbackDistribution:
+    def test_calls_every_callback_in_order(self, event, calls):
+        assert event("arg")
+        assert calls == [(0, ("arg",)), (1, ("arg",)), (2, ("arg",))]
+
+    def test_empty_event(self):
+        assert Event()()
+
+    def test_async_call_with_sync_callbacks(self, event, calls):
+        assert asyncio.run(event.call_async("arg"))
+        assert [i for i, _ in calls] == [0, 1, 2]
+
+    def test_async_callbacks_awaited_concurrently(self):
+        finished = []
+
+        async def callback(i):
+            await asyncio.sleep(0.05)
+            finished.append(i)
+
+        event = Event()
+        for i in range(10):
+            event.attach(lambda i=i: callback(i))
+
+        start = time.perf_counter()
+        asyncio.run(event.call_async())
+        assert time.perf_counter() - start < 0.25
+        assert sorted(finished) == list(range(10))
+
+
+class TestForFirstToTakeDistribution:
+    @pytest.fixture
+    def event(self, event) -> Event:
+        event.event_distribution = ForFirstToTakeDistribution()
+        return event
+
+    def test_last_attached_takes(self, event, calls):
+        assert event("arg")
+        assert calls == [(2, ("arg",))]
+        assert len(event) == 2
+
+    def test_empty_event(self):
+        event = Event()
+        event.event_distribution = ForFirstToTakeDistribution()
+        assert not event()
+        assert not asyncio.run(event.call_async())
+
+    def test_async_callback_awaited(self, event):
+        finished = []
+
+        async def callback():
+            await asyncio.sleep(0)
+            finished.append(True)
+
+        event.attach(callback)
+        assert asyncio.run(event.call_async())
+        assert finished == [True]
+        assert callback not in event
+
+
+class FirstAttachedDistribution(EventDistribution):
+    """Distribution implementing only synchronous calls"""
+
+    def call_event(self, *args, **kwargs) -> bool:
+        if not self.context:
+            return False
+
+        self.context.pop(0)(*args, **kwargs)
+        return True
+
+
+class TestCustomDistribution:
+    @pytest.fixture
+    def event(self, event) -> Event:
+        event.event_distribution = FirstAttachedDistribution()
+        return event
+
+    def test_async_call_falls_back_to_call_event(self, event, calls):
+        assert asyncio.run(event.call_async("arg"))
+        assert calls == [(0, ("arg",))]
+        assert isinstance(event.event_distribution.context, Event)
+
+    def test_async_callback_awaited(self):
+        finished = []
+
+        async def callback():
+            await asyncio.sleep(0)
+            finished.append(True)
+
+        event = Event()
+        event.event_distribution = FirstAttachedDistribution()
+        event.attach(callback)
+        assert asyncio.run(event.call_async())
+        assert finished == [True]
+        assert not asyncio.run(event.call_async())
+
+
+class TestWeakEvent:
+    @pytest.fixture
+    def event(self) -> Event:
+        return Event(weak=True)
+
+    def test_does_not_keep_subscriber_alive(self, event):
+        subscriber = Subscriber()
+        event.attach(subscriber.callback)
+        assert subscriber.callback in event
+        del subscriber
+        assert not event
+        assert len(event) == 0
+
+    def test_calls_live_subscribers_only(self, event):
+        subscribers = [Subscriber() for _ in range(4)]
+        for subscriber in subscribers:
+            event.attach(subscriber.callback)
+        del subscribers[1:3]
+        event()
+        assert [subscriber.calls for subscriber in subscribers] == [1, 1]
+        assert len(event._nodes) == 2
+
+    def test_detach_and_reattach(self, event):
+        first, second = Subscriber(), Subscriber()
+        event.attach(first.callback)
+        event.attach(second.callback)
+        assert not event.attach(first.callback)
+        event.reattach(first.callback)
+        assert list(event) == [second.callback, first.callback]
+        assert event.detach(first.callback)
+        assert list(event) == [second.callback]
+
+    def test_pop_skips_dead_subscribers(self, event):
+        event.event_distribution = ForFirstToTakeDistribution()
+        first, second = Subscriber(), Subscriber()
+        event.attach(first.callback)
+        event.attach(second.callback)
+        del second
+        assert event()
+        assert first.calls == 1
+        assert not event()
+
+    def test_functions_are_kept_strongly(self, event, calls):
+        event.attach(lambda: calls.append(True))
+        event()
+        assert calls == [True]
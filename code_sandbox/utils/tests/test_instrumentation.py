@@ -0,0 +1,105 @@
+"""
+events instrumentation testing module
+"""
+# pylint: disable-all
+import asyncio
+import time
+
+import pytest
+
+from .. import (
+    Event,
+    EventStats,
+    ForEveryCallbackDistribution,
+    ForFirstToTakeDistribution,
+    InstrumentedDistribution,
+)
+
+
+class Subscriber:
+    def __init__(self, name):
+        self.name = name
+
+    def __str__(self):
+        return self.name
+
+    def callback(self, seconds=0):
+        time.sleep(seconds)
+
+
+@pytest.fixture
+def subscribers():
+    return [Subscriber("first"), Subscriber("second")]
+
+
+@pytest.fixture
+def event(subscribers) -> Event:
+    event = Event()
+    for subscriber in subscribers:
+        event.attach(subscriber.callback)
+    event.event_distribution = InstrumentedDistribution(event.event_distribution)
+    return event
+
+
+class TestInstrumentedDistribution:
+    def test_counts_calls(self, event):
+        event()
+        event()
+        snapshot = event.event_distribution.stats.snapshot()
+        assert snapshot["calls"] == 2
+        assert {label: s["calls"] for label, s in snapshot["subscribers"].items()} == {
+            "first.callback": 2,
+            "second.callback": 2,
+        }
+
+    def test_latencies(self, event):
+        event(0.01)
+        snapshot = event.event_distribution.stats.snapshot()
+        assert snapshot["total"] >= 0.02
+        subscriber = snapshot["subscribers"]["first.callback"]
+        assert 0.01 <= subscriber["p50"] == subscriber["p99"] <= subscriber["total"]
+
+    def test_first_to_take(self, event, subscribers):
+        event.event_distribution = InstrumentedDistribution(
+            ForFirstToTakeDistribution()
+        )
+        assert event()
+        assert len(event) == 1
+        stats = event.event_distribution.stats
+        assert list(stats.subscribers) == ["second.callback"]
+
+    def test_async_subscribers_timed_until_done(self):
+        async def callback():
+            await asyncio.sleep(0.01)
+
+        event = Event()
+        event.attach(callback)
+        event.event_distribution = InstrumentedDistribution(
+            ForEveryCallbackDistribution()
+        )
+        asyncio.run(event.call_async())
+        stats = event.event_distribution.stats.subscribers
+        assert stats[callback.__qualname__].total >= 0.01
+
+    def test_unwrapping(self, event):
+        event.event_distribution = event.event_distribution.distribution
+        assert isinstance(event.event_distribution, ForEveryCallbackDistribution)
+        assert event.event_distribution.context is event
+
+
+class TestEventStats:
+    def test_percentiles(self):
+        stats = EventStats()
+        for i in range(100):
+            stats.add("callback", i)
+        summary = stats.snapshot()["subscribers"]["callback"]
+        assert summary["p50"] == 50
+        assert summary["p99"] == 99
+        assert summary["calls"] == 100
+
+    def test_samples_limit(self):
+        stats = EventStats(max_samples=10)
+        for i in range(100):
+            stats.add("callback", i)
+        assert stats.subscribers["callback"].percentile(0) == 90
+        assert stats.subscribers["callback"].calls == 100
@@ -0,0 +1,3 @@
+"""
+battleships field validator benchmarks package - run modules with `python -m`
+"""
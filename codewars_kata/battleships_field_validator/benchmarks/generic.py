@@ -0,0 +1,61 @@
+"""
+Module for measuring validate_field on growing boards densely packed with ships, and on
+classic boards against validate_battlefield
+
+Usage: python -m codewars_kata.battleships_field_validator.benchmarks.generic
+"""
+import random
+import time
+from typing import Callable, Dict, List, Tuple
+
+from ..generic import FleetRules, validate_field
+from ..validator import validate_battlefield
+from .validation import random_field
+
+random.seed(321322)
+
+SIZES = (20, 100, 300, 1000)
+CLASSIC_BOARDS = 10_000
+
+
+def packed_field(size: int) -> Tuple[List[List[int]], Dict[int, int]]:
+    """Every other row filled with ships of random lengths, with the fleet they make"""
+    field = [[0] * size for _ in range(size)]
+    fleet: Dict[int, int] = {}
+    for row in range(0, size, 2):
+        col = 0
+        while True:
+            length = random.randint(1, 6)
+            if col + length > size:
+                break
+            field[row][col : col + length] = [1] * length
+            fleet[length] = fleet.get(length, 0) + 1
+            col += length + 1
+    return field, fleet
+
+
+def measure(validation: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    validation()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print(f"{'board':<10} | {'ships':>7} | {'seconds':>8} | cells/s")
+    for size in SIZES:
+        field, fleet = packed_field(size)
+        rules = FleetRules(size, size, fleet)
+        assert validate_field(field, rules)
+        seconds = measure(lambda: validate_field(field, rules))
+        print(
+            f"{f'{size}x{size}':<10} | {sum(fleet.values()):>7} | {seconds:>8.4f} | "
+            f"{size * size / seconds:,.0f}"
+        )
+
+    fields = [random_field() for _ in range(CLASSIC_BOARDS)]
+    reference = measure(lambda: [validate_battlefield(f) for f in fields])
+    generic = measure(lambda: [validate_field(f) for f in fields])
+    print(
+        f"\n{CLASSIC_BOARDS} classic boards: validate_battlefield {reference:.2f}s, "
+        f"validate_field {generic:.2f}s, {reference / generic:.1f}x"
+    )
@@ -0,0 +1,92 @@
+"""
+Module for comparing revalidation of the whole board after every placed ship with
+IncrementalValidator, during setup of random boards
+
+Usage: python -m codewars_kata.battleships_field_validator.benchmarks.incremental
+"""
+import random
+import time
+from typing import Callable, List
+
+from ..generic import FleetRules, validate_field
+from ..incremental import IncrementalValidator, Ship
+from ..validator import validate_battlefield
+from .generic import packed_field
+from .validation import random_field
+
+random.seed(321322)
+
+CLASSIC_SETUPS = 2_000
+BIG_BOARD = 100
+
+
+def ships_of(field: List[List[int]]) -> List[Ship]:
+    """Ships of the valid field in random order of placing"""
+    ships = []
+    seen = set()
+    for row, cells in enumerate(field):
+        for col, cell in enumerate(cells):
+            if not cell or (row, col) in seen:
+                continue
+            horizontal = col + 1 < len(cells) and cells[col + 1]
+            length = 1
+            while True:
+                r, c = (row, col + length) if horizontal else (row + length, col)
+                if r >= len(field) or c >= len(cells) or not field[r][c]:
+                    break
+                length += 1
+            ship = Ship(row, col, length, bool(horizontal) or length == 1)
+            seen.update(ship.cells())
+            ships.append(ship)
+    random.shuffle(ships)
+    return ships
+
+
+def setup_seconds(setup: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    setup()
+    return time.perf_counter() - start
+
+
+def revalidating_setup(
+    ships: List[Ship], rules: FleetRules, validate: Callable[[List[List[int]]], object]
+) -> None:
+    field = [[0] * rules.cols for _ in range(rules.rows)]
+    for ship in ships:
+        for row, col in ship.cells():
+            field[row][col] = 1
+        validate(field)
+
+
+def incremental_setup(ships: List[Ship], rules: FleetRules) -> None:
+    validator = IncrementalValidator(rules)
+    for ship in ships:
+        validator.place(ship)
+        validator.valid
+
+
+if __name__ == "__main__":
+    rules = FleetRules()
+    setups = [ships_of(random_field()) for _ in range(CLASSIC_SETUPS)]
+    reference = setup_seconds(
+        lambda: [revalidating_setup(s, rules, validate_battlefield) for s in setups]
+    )
+    incremental = setup_seconds(lambda: [incremental_setup(s, rules) for s in setups])
+    print(
+        f"{CLASSIC_SETUPS} classic setups: validate_battlefield after every ship "
+        f"{reference:.3f}s, incremental {incremental:.3f}s, "
+        f"{reference / incremental:.1f}x"
+    )
+
+    field, fleet = packed_field(BIG_BOARD)
+    rules = FleetRules(BIG_BOARD, BIG_BOARD, fleet)
+    ships = ships_of(field)
+    reference = setup_seconds(
+        lambda: revalidating_setup(ships, rules, lambda f: validate_field(f, rules))
+    )
+    incremental = setup_seconds(lambda: incremental_setup(ships, rules))
+    print(
+        f"{BIG_BOARD}x{BIG_BOARD} setup of {len(ships)} ships: validate_field after "
+        f"every ship {reference:.3f}s, incremental {incremental:.3f}s, "
+        f"{reference / incremental:.0f}x"
+    )
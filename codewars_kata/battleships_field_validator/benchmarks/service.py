@@ -0,0 +1,65 @@
+"""
+Module for measuring ValidationService on replay-like stream of boards - many boards
+repeated, one at a time validation with validate_battlefield as the reference
+
+Usage: python -m codewars_kata.battleships_field_validator.benchmarks.service
+"""
+import os
+import random
+import time
+from typing import Callable, List
+
+from ..service import ValidationService
+from ..validator import validate_battlefield
+from .validation import random_field
+
+random.seed(321322)
+
+BOARDS = 1_000_000
+DISTINCT_BOARDS = 50_000
+REFERENCE_BOARDS = 20_000
+BATCH = 10_000
+
+
+def boards_per_second(validation: Callable[[], List[bool]], boards: int) -> float:
+    start = time.perf_counter()
+    validation()
+    return boards / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    distinct = [random_field() for _ in range(DISTINCT_BOARDS)]
+    for field in random.sample(distinct, DISTINCT_BOARDS // 2):
+        field[random.randrange(10)][random.randrange(10)] ^= 1
+    # some boards are replayed far more often than others
+    fields = random.choices(
+        distinct, weights=[1 / (i + 1) for i in range(DISTINCT_BOARDS)], k=BOARDS
+    )
+
+    print(
+        f"{BOARDS} boards in batches of {BATCH}, {DISTINCT_BOARDS} distinct ones, "
+        f"{os.cpu_count()} CPUs\n"
+        f"{'validation':<32} | {'boards/s':>10} | hit rate"
+    )
+    reference = boards_per_second(
+        lambda: [validate_battlefield(f) for f in fields[:REFERENCE_BOARDS]],
+        REFERENCE_BOARDS,
+    )
+    print(f"{'validate_battlefield':<32} | {reference:>10,.0f} |")
+
+    services = {
+        "service, no cache": dict(cache_size=0, processes=1),
+        "service, cache": dict(processes=1),
+        "service, cache and process pool": dict(),
+        "service, process pool": dict(cache_size=0),
+    }
+    for name, options in services.items():
+        with ValidationService(**options) as service:
+            rate = boards_per_second(
+                lambda: [
+                    service.validate_many(fields[start : start + BATCH])
+                    for start in range(0, BOARDS, BATCH)
+                ],
+                BOARDS,
+            )
+            print(f"{name:<32} | {rate:>10,.0f} | {service.stats.hit_rate:.1%}")
@@ -0,0 +1,79 @@
+"""
+Module for comparing validate_battlefield with bitboard based validate_many on a batch
+of boards - proper ones and ones with a few cells flipped
+
+Usage: python -m codewars_kata.battleships_field_validator.benchmarks.validation
+"""
+import random
+import time
+from typing import Callable, List
+
+from ..bitboard import FLEET, Field, field_to_bitboard, validate_many
+from ..validator import validate_battlefield
+
+random.seed(321322)
+
+BOARDS = 20_000
+BROKEN_RATIO = 0.5
+
+
+def random_field() -> Field:
+    """Proper field with ships placed at random"""
+    while True:
+        field = [[0] * 10 for _ in range(10)]
+        lengths = sorted(
+            (length for length, count in FLEET.items() for _ in range(count)),
+            reverse=True,
+        )
+        if all(place_ship(field, length) for length in lengths):
+            return field
+
+
+def place_ship(field: Field, length: int, attempts: int = 100) -> bool:
+    for _ in range(attempts):
+        horizontal = random.random() < 0.5
+        row = random.randrange(10 - (0 if horizontal else length - 1))
+        col = random.randrange(10 - (length - 1 if horizontal else 0))
+        cells = [
+            (row, col + i) if horizontal else (row + i, col) for i in range(length)
+        ]
+        if not any(
+            field[r][c]
+            for cell_row, cell_col in cells
+            for r in range(max(0, cell_row - 1), min(10, cell_row + 2))
+            for c in range(max(0, cell_col - 1), min(10, cell_col + 2))
+        ):
+            for r, c in cells:
+                field[r][c] = 1
+            return True
+    return False
+
+
+def measure(validation: Callable[[], List[bool]]) -> float:
+    start = time.perf_counter()
+    validation()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    fields = [random_field() for _ in range(BOARDS)]
+    for field in random.sample(fields, int(BROKEN_RATIO * BOARDS)):
+        for _ in range(random.randint(1, 3)):
+            field[random.randrange(10)][random.randrange(10)] ^= 1
+    bitboards = [field_to_bitboard(field) for field in fields]
+
+    validations = {
+        "validate_battlefield": lambda: [validate_battlefield(f) for f in fields],
+        "validate_many (lists)": lambda: list(validate_many(fields)),
+        "validate_many (ints)": lambda: list(validate_many(bitboards)),
+    }
+
+    print(f"{BOARDS} boards, {BROKEN_RATIO:.0%} with flipped cells")
+    baseline = None
+    for name, validation in validations.items():
+        seconds = measure(validation)
+        baseline = baseline or seconds
+        print(
+            f"{name:<22} | {seconds * 1000:>7.1f}ms | "
+            f"{BOARDS / seconds:>9,.0f} boards/s | {baseline / seconds:,.1f}x"
+        )
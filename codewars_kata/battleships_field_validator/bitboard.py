@@ -0,0 +1,86 @@
+import itertools
+from typing import Dict, Iterable, Iterator, List, Union
+
+SIZE = 10
+FULL = (1 << SIZE * SIZE) - 1
+
+# cell (row, col) is bit row * 10 + col - east neighbour is next bit, south one is
+# 10 bits further. Shifting by columns wraps into neighbouring rows, so columns that
+# wrapped are masked out.
+_COLUMNS = [sum(1 << row * SIZE + col for row in range(SIZE)) for col in range(SIZE)]
+# cells which have at least n columns to the east of them
+_EAST_ROOM = [FULL & ~sum(_COLUMNS[SIZE - n :]) for n in range(SIZE)]
+
+_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+FLEET = {4: 1, 3: 2, 2: 3, 1: 4}
+
+Field = List[List[int]]
+
+
+def field_to_bitboard(field: Field) -> int:
+    """10x10 field of 0/1 cells as 100-bit integer"""
+    cells = bytes(itertools.chain.from_iterable(field)).translate(_DIGITS)
+    return int(cells[::-1], 2)
+
+
+def _east(board: int, distance: int) -> int:
+    """Cells whose neighbour in distance to the east is occupied"""
+    return (board >> distance) & _EAST_ROOM[distance]
+
+
+def _south(board: int, distance: int) -> int:
+    """Cells whose neighbour in distance to the south is occupied"""
+    return board >> SIZE * distance
+
+
+def ships_count(board: int) -> Dict[int, int]:
+    """
+    Amount of ships of each length on board, which ships are already known to be
+    straight and separated
+    """
+    # ship's head is its cell without neighbours to the west and to the north
+    heads = board & ~((board << 1) & ~_COLUMNS[0]) & ~(board << SIZE)
+    counts = {}
+    horizontal = vertical = heads
+    at_least = heads.bit_count()
+    for length in range(1, SIZE + 1):
+        horizontal &= _east(board, length)
+        vertical &= _south(board, length)
+        longer = horizontal.bit_count() + vertical.bit_count()
+        counts[length] = at_least - longer
+        if not longer:
+            break
+        at_least = longer
+    return counts
+
+
+def validate_bitboard(board: int) -> bool:
+    if board.bit_count() != sum(length * count for length, count in FLEET.items()):
+        return False
+
+    # contact by corner - occupied south-east or south-west neighbour
+    south_east = (board >> SIZE + 1) & _EAST_ROOM[1]
+    south_west = (board >> SIZE - 1) & ~_COLUMNS[0]
+    if board & (south_east | south_west):
+        return False
+
+    # L and T shapes - cell with both horizontal and vertical neighbours
+    horizontal = board & (_east(board, 1) | (board << 1) & ~_COLUMNS[0])
+    vertical = board & (_south(board, 1) | board << SIZE)
+    if horizontal & vertical:
+        return False
+
+    return ships_count(board) == FLEET
+
+
+def validate_battlefield_bitboard(field: Field) -> bool:
+    return validate_bitboard(field_to_bitboard(field))
+
+
+def validate_many(fields: Iterable[Union[Field, int]]) -> Iterator[bool]:
+    """Lazily validate stream of fields, given as 10x10 lists or as bitboards"""
+    for field in fields:
+        if not isinstance(field, int):
+            field = field_to_bitboard(field)
+        yield validate_bitboard(field)
@@ -0,0 +1,97 @@
+import enum
+from typing import Dict, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+CLASSIC_FLEET = {4: 1, 3: 2, 2: 3, 1: 4}
+
+# any non zero cell is occupied
+_OCCUPIED = bytes([0] + [1] * 255)
+_VISITED = 2
+
+
+class Rule(enum.Enum):
+    DIMENSIONS = "field has other dimensions than the board"
+    SHAPE = "ship is not a straight line"
+    CONTACT = "ships are in contact by corner"
+    LENGTH = "ship of length not present in the fleet"
+    FLEET = "amount of ships differs from the fleet"
+
+
+class FleetRules(NamedTuple):
+    rows: int = 10
+    cols: int = 10
+    # amount of ships of each length
+    fleet: Mapping[int, int] = CLASSIC_FLEET
+
+
+class ValidationResult(NamedTuple):
+    violation: Optional[Rule] = None
+    # (row, col) of violating ship's first cell, if the rule concerns single ship
+    cell: Optional[Tuple[int, int]] = None
+
+    @property
+    def valid(self) -> bool:
+        return self.violation is None
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+
+def validate_field(
+    field: Sequence[Sequence[int]], rules: FleetRules = FleetRules()
+) -> ValidationResult:
+    """
+    Validate field of any dimensions against the fleet in a single pass over cells.
+
+    Field is copied into a bytearray with an empty border, that removes bounds checks.
+    The same bytearray serves as visited map - ship's cells are marked once its first
+    cell is found, so every cell is looked at constant amount of times.
+    """
+    if len(field) != rules.rows or any(len(row) != rules.cols for row in field):
+        return ValidationResult(Rule.DIMENSIONS)
+
+    # every row ends with an empty cell, which is also west neighbour of the next row
+    width = rules.cols + 1
+    grid = bytearray(width)
+    for row in field:
+        grid += bytes(row).translate(_OCCUPIED)
+        grid.append(0)
+    grid += bytes(width + 1)
+
+    counts: Dict[int, int] = {}
+    head = grid.find(1)
+    while head != -1:
+        # scanning goes row by row, so the first found cell is ship's west/north end
+        step = 1 if grid[head + 1] or not grid[head + width] else width
+        side = width if step == 1 else 1
+        tail = head
+        while grid[tail + step]:
+            tail += step
+        length = (tail - head) // step + 1
+        grid[head : tail + 1 : step] = bytes([_VISITED]) * length
+
+        cell = divmod(head - width, width)
+        if (
+            grid[head - step]
+            or any(grid[head - side : tail - side + 1 : step])
+            or any(grid[head + side : tail + side + 1 : step])
+        ):
+            return ValidationResult(Rule.SHAPE, cell)
+        if (
+            grid[head - step - side]
+            or grid[head - step + side]
+            or grid[tail + step - side]
+            or grid[tail + step + side]
+        ):
+            return ValidationResult(Rule.CONTACT, cell)
+        if length not in rules.fleet:
+            return ValidationResult(Rule.LENGTH, cell)
+
+        counts[length] = counts.get(length, 0) + 1
+        if counts[length] > rules.fleet[length]:
+            return ValidationResult(Rule.FLEET, cell)
+
+        head = grid.find(1, head + 1)
+
+    if any(counts.get(length, 0) != count for length, count in rules.fleet.items()):
+        return ValidationResult(Rule.FLEET)
+    return ValidationResult()
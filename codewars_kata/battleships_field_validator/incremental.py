@@ -0,0 +1,156 @@
+from array import array
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .generic import FleetRules, Rule
+
+
+class Ship(NamedTuple):
+    row: int
+    col: int
+    length: int
+    horizontal: bool = True
+
+    def cells(self) -> Iterator[Tuple[int, int]]:
+        row_step, col_step = (0, 1) if self.horizontal else (1, 0)
+        for i in range(self.length):
+            yield self.row + i * row_step, self.col + i * col_step
+
+
+class IncrementalValidator:
+    """
+    Board validated ship by ship, as the ships are placed on it or removed from it.
+
+    For every cell it keeps amount of ships occupying it and amount of ships covering it
+    with their surroundings - cells of the ship and all their neighbours. Ships are in
+    contact when one occupies a cell covered by the other one, so the amount of such
+    contacts and ships' counts are updated in time proportional to ship's length, and
+    answering if the board is still valid or already complete takes constant time.
+    """
+
+    _occupied: array
+    _covered: array
+    _ships: Dict[Ship, None]
+    _counts: Dict[int, int]
+
+    def __init__(self, rules: FleetRules = FleetRules()) -> None:
+        self._rules = rules
+        self._occupied = array("I", bytes(4 * rules.rows * rules.cols))
+        self._covered = array("I", bytes(4 * rules.rows * rules.cols))
+        self._ships = {}
+        self._counts = {}
+        # pairs of ship's cell and other ship's surroundings covering it
+        self._contacts = 0
+        self._unknown = 0
+        self._excess = 0
+        self._missing = sum(rules.fleet.values())
+
+    @property
+    def rules(self) -> FleetRules:
+        return self._rules
+
+    @property
+    def ships(self) -> List[Ship]:
+        return list(self._ships)
+
+    @property
+    def violation(self) -> Optional[Rule]:
+        """Rule broken by ships placed so far, missing ships are not a violation"""
+        if self._contacts:
+            return Rule.CONTACT
+        if self._unknown:
+            return Rule.LENGTH
+        if self._excess:
+            return Rule.FLEET
+        return None
+
+    @property
+    def valid(self) -> bool:
+        """The board can still be completed by placing more ships"""
+        return not (self._contacts or self._unknown or self._excess)
+
+    @property
+    def complete(self) -> bool:
+        """The board is valid and has the whole fleet"""
+        return self.valid and not self._missing
+
+    def place(self, ship: Ship) -> None:
+        if ship in self._ships:
+            raise ValueError(f"{ship} is already placed")
+        cells = self._cell_indexes(ship)
+
+        covered, occupied = self._covered, self._occupied
+        surroundings = self._surroundings(ship)
+        self._contacts += sum(covered[i] for i in cells) + sum(
+            occupied[i] for i in surroundings
+        )
+        for i in cells:
+            occupied[i] += 1
+        for i in surroundings:
+            covered[i] += 1
+
+        self._ships[ship] = None
+        self._count(ship.length, 1)
+
+    def remove(self, ship: Ship) -> None:
+        if ship not in self._ships:
+            raise ValueError(f"{ship} is not placed")
+        cells = self._cell_indexes(ship)
+
+        covered, occupied = self._covered, self._occupied
+        surroundings = self._surroundings(ship)
+        for i in cells:
+            occupied[i] -= 1
+        for i in surroundings:
+            covered[i] -= 1
+        self._contacts -= sum(covered[i] for i in cells) + sum(
+            occupied[i] for i in surroundings
+        )
+
+        del self._ships[ship]
+        self._count(ship.length, -1)
+
+    def to_field(self) -> List[List[int]]:
+        cols = self._rules.cols
+        occupied = [int(bool(count)) for count in self._occupied]
+        return [
+            occupied[start : start + cols] for start in range(0, len(occupied), cols)
+        ]
+
+    def _count(self, length: int, change: int) -> None:
+        expected = self._rules.fleet.get(length, 0)
+        if not expected:
+            self._unknown += change
+        before = self._counts.get(length, 0)
+        after = self._counts[length] = before + change
+        # ships up to expected amount reduce missing ones, above it - make excess
+        self._missing -= min(after, expected) - min(before, expected)
+        self._excess += max(after - expected, 0) - max(before - expected, 0)
+
+    def _cell_indexes(self, ship: Ship) -> List[int]:
+        rows, cols = self._rules.rows, self._rules.cols
+        last_row, last_col = self._last_cell(ship)
+        if ship.length < 1 or not (
+            0 <= ship.row and last_row < rows and 0 <= ship.col and last_col < cols
+        ):
+            raise ValueError(f"{ship} does not fit the board")
+
+        step = 1 if ship.horizontal else cols
+        start = ship.row * cols + ship.col
+        return list(range(start, start + step * ship.length, step))
+
+    def _surroundings(self, ship: Ship) -> List[int]:
+        """Indexes of ship's cells and their neighbours"""
+        rows, cols = self._rules.rows, self._rules.cols
+        last_row, last_col = self._last_cell(ship)
+        col_range = range(max(ship.col - 1, 0), min(last_col + 2, cols))
+        return [
+            row * cols + col
+            for row in range(max(ship.row - 1, 0), min(last_row + 2, rows))
+            for col in col_range
+        ]
+
+    @staticmethod
+    def _last_cell(ship: Ship) -> Tuple[int, int]:
+        if ship.horizontal:
+            return ship.row, ship.col + ship.length - 1
+        return ship.row + ship.length - 1, ship.col
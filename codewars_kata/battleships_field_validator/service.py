@@ -0,0 +1,149 @@
+import concurrent.futures
+import itertools
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Union
+
+from .bitboard import Field, field_to_bitboard, validate_bitboard
+
+Board = Union[Field, int]
+BoardValidator = Callable[[int], bool]
+
+
+class ValidationStats(NamedTuple):
+    boards: int
+    cache_hits: int
+    seconds: float
+
+    @property
+    def hit_rate(self) -> float:
+        return self.cache_hits / self.boards if self.boards else 0.0
+
+    @property
+    def boards_per_second(self) -> float:
+        return self.boards / self.seconds if self.seconds else 0.0
+
+
+def board_key(board: Board) -> int:
+    """Canonical hashable form of the board - its bitboard"""
+    return board if isinstance(board, int) else field_to_bitboard(board)
+
+
+def _validate_chunk(validator: BoardValidator, keys: List[int]) -> List[bool]:
+    return [validator(key) for key in keys]
+
+
+class ValidationService:
+    """
+    Validates boards by their canonical keys, remembering results of recently validated
+    ones in LRU cache. Batches with enough not cached boards are validated in chunks by
+    a pool of processes, smaller ones - in the calling process.
+    """
+
+    _cache: "OrderedDict[int, bool]"
+    _executor: Optional[concurrent.futures.ProcessPoolExecutor]
+
+    def __init__(
+        self,
+        validator: BoardValidator = validate_bitboard,
+        cache_size: int = 1 << 16,
+        processes: Optional[int] = None,
+        chunk_size: int = 4096,
+        parallel_threshold: int = 1 << 14,
+    ) -> None:
+        """
+        :param validator: Picklable callable validating bitboards
+        :param cache_size: Maximum amount of remembered results, 0 disables the cache
+        :param processes: Size of the pool, amount of CPUs if not given, 1 disables
+            the pool
+        :param chunk_size: Amount of boards sent to the pool's process at once
+        :param parallel_threshold: Minimum amount of not cached boards in the batch
+            validated by the pool
+        """
+        self._validator = validator
+        self._cache_size = cache_size
+        self._processes = processes
+        self._chunk_size = max(1, chunk_size)
+        self._parallel_threshold = parallel_threshold
+
+        self._cache = OrderedDict()
+        self._executor = None
+        self._boards = self._cache_hits = 0
+        self._seconds = 0.0
+
+    @property
+    def stats(self) -> ValidationStats:
+        return ValidationStats(self._boards, self._cache_hits, self._seconds)
+
+    def reset_stats(self) -> None:
+        self._boards = self._cache_hits = 0
+        self._seconds = 0.0
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def validate(self, board: Board) -> bool:
+        return self.validate_many((board,))[0]
+
+    def validate_many(self, boards: Iterable[Board]) -> List[bool]:
+        """Results in order of boards"""
+        start = time.perf_counter()
+        keys = [board_key(board) for board in boards]
+
+        results: Dict[int, bool] = {}
+        for key in keys:
+            if key in results:
+                continue
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                results[key] = result
+
+        # the same board repeated in the batch counts as a hit after its first time
+        missing = [key for key in dict.fromkeys(keys) if key not in results]
+        results.update(zip(missing, self._validate_keys(missing)))
+        self._remember(missing, results)
+
+        self._boards += len(keys)
+        self._cache_hits += len(keys) - len(missing)
+        self._seconds += time.perf_counter() - start
+        return [results[key] for key in keys]
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "ValidationService":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _validate_keys(self, keys: List[int]) -> List[bool]:
+        if len(keys) < self._parallel_threshold or self._processes == 1:
+            return _validate_chunk(self._validator, keys)
+
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(self._processes)
+        chunks = [
+            keys[start : start + self._chunk_size]
+            for start in range(0, len(keys), self._chunk_size)
+        ]
+        return list(
+            itertools.chain.from_iterable(
+                self._executor.map(
+                    _validate_chunk, itertools.repeat(self._validator), chunks
+                )
+            )
+        )
+
+    def _remember(self, keys: List[int], results: Dict[int, bool]) -> None:
+        if not self._cache_size:
+            return
+
+        # only the most recent results would survive anyway
+        for key in keys[-self._cache_size :]:
+            self._cache[key] = results[key]
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
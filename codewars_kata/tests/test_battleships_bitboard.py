@@ -0,0 +1,85 @@
+from ..battleships_field_validator.bitboard import (
+    field_to_bitboard,
+    ships_count,
+    validate_battlefield_bitboard,
+    validate_many,
+)
+
+PROPER_FIELD = [
+    [0, 1, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 1, 0, 1, 1, 1],
+    [0, 0, 0, 0, 0, 1, 0, 0, 0, 0],
+    [1, 1, 0, 0, 0, 1, 0, 1, 0, 1],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [1, 1, 1, 1, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 1, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 1, 0, 1, 1],
+    [0, 0, 0, 1, 0, 0, 0, 0, 0, 0],
+]
+
+
+def changed(*cells):
+    field = [row[:] for row in PROPER_FIELD]
+    for row, col in cells:
+        field[row][col] ^= 1
+    return field
+
+
+def test_field_to_bitboard():
+    assert field_to_bitboard([[0] * 10 for _ in range(10)]) == 0
+    field = [[0] * 10 for _ in range(10)]
+    field[0][0] = field[0][9] = field[9][9] = 1
+    assert field_to_bitboard(field) == 1 | 1 << 9 | 1 << 99
+    assert field_to_bitboard(PROPER_FIELD).bit_count() == 20
+
+
+def test_ships_count():
+    assert ships_count(field_to_bitboard(PROPER_FIELD)) == {1: 4, 2: 3, 3: 2, 4: 1}
+
+
+def test_proper_setup():
+    assert validate_battlefield_bitboard(PROPER_FIELD)
+
+
+def test_l_shaped_four_field_ship():
+    assert not validate_battlefield_bitboard(changed((6, 3), (7, 2)))
+
+
+def test_wrong_shaped_five_field_ship():
+    assert not validate_battlefield_bitboard(changed((7, 2), (9, 3)))
+    assert not validate_battlefield_bitboard(changed((7, 0), (9, 3)))
+
+
+def test_wrong_neigbour_by_diagonal():
+    assert not validate_battlefield_bitboard(changed((7, 4), (9, 3)))
+    assert not validate_battlefield_bitboard(changed((4, 4), (9, 3)))
+    assert not validate_battlefield_bitboard(changed((0, 4), (9, 3)))
+    # corners below the last cell of vertical ship
+    assert not validate_battlefield_bitboard(changed((0, 1), (9, 3), (9, 5)))
+    assert not validate_battlefield_bitboard(changed((0, 1), (9, 3), (9, 7)))
+
+
+def test_ships_not_wrapped_between_rows():
+    # cells at the end of one row and at the start of the next one are not neighbours
+    field = changed((0, 1), (9, 0))
+    assert field[8][9] and field[9][0]
+    assert validate_battlefield_bitboard(field)
+
+
+def test_five_long_ship():
+    assert not validate_battlefield_bitboard(changed((6, 4), (9, 3)))
+
+
+def test_too_many_one_field_ships():
+    assert not validate_battlefield_bitboard(changed((1, 3)))
+
+
+def test_too_less_one_field_ships():
+    assert not validate_battlefield_bitboard(changed((0, 1)))
+
+
+def test_validate_many():
+    fields = [PROPER_FIELD, changed((0, 1)), field_to_bitboard(PROPER_FIELD)]
+    assert list(validate_many(fields)) == [True, False, True]
+    assert list(validate_many(iter(()))) == []
@@ -0,0 +1,96 @@
+from ..battleships_field_validator.generic import (
+    FleetRules,
+    Rule,
+    ValidationResult,
+    validate_field,
+)
+from .test_battleships_bitboard import PROPER_FIELD, changed
+
+
+def test_classic_rules():
+    assert validate_field(PROPER_FIELD)
+    assert validate_field(PROPER_FIELD) == ValidationResult()
+    assert validate_field(PROPER_FIELD).valid
+
+
+def test_classic_violations():
+    assert validate_field(changed((6, 3), (7, 2))) == ValidationResult(
+        Rule.SHAPE, (6, 0)
+    )
+    assert validate_field(changed((7, 4), (9, 3))) == ValidationResult(
+        Rule.CONTACT, (6, 0)
+    )
+    assert validate_field(changed((0, 1), (9, 3), (9, 5))) == ValidationResult(
+        Rule.CONTACT, (7, 6)
+    )
+    assert validate_field(changed((6, 4), (9, 3))) == ValidationResult(
+        Rule.LENGTH, (6, 0)
+    )
+    assert validate_field(changed((1, 3))) == ValidationResult(Rule.FLEET, (9, 3))
+    assert validate_field(changed((0, 1))) == ValidationResult(Rule.FLEET)
+    assert not validate_field(changed((0, 1))).valid
+
+
+def test_dimensions():
+    assert validate_field(PROPER_FIELD[:9]).violation is Rule.DIMENSIONS
+    assert (
+        validate_field([row[:9] for row in PROPER_FIELD]).violation is Rule.DIMENSIONS
+    )
+    assert (
+        validate_field(PROPER_FIELD, FleetRules(rows=11)).violation is Rule.DIMENSIONS
+    )
+
+
+def test_ships_not_wrapped_between_rows():
+    rules = FleetRules(rows=2, cols=3, fleet={2: 1, 1: 1})
+    assert validate_field([[0, 1, 1], [0, 0, 0]], FleetRules(2, 3, {2: 1}))
+    assert validate_field([[0, 1, 1], [1, 0, 0]], rules).violation is Rule.CONTACT
+    assert validate_field([[0, 0, 1], [1, 0, 0]], FleetRules(2, 3, {1: 2}))
+    assert validate_field([[0, 0, 1], [0, 0, 0], [1, 0, 0]], FleetRules(3, 3, {1: 2}))
+
+
+def test_custom_board_and_fleet():
+    rules = FleetRules(rows=4, cols=6, fleet={5: 1, 1: 2})
+    assert validate_field(
+        [
+            [1, 1, 1, 1, 1, 0],
+            [0, 0, 0, 0, 0, 0],
+            [1, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 1, 0],
+        ],
+        rules,
+    )
+    assert validate_field(
+        [
+            [1, 0, 0, 0, 0, 0],
+            [1, 0, 0, 0, 0, 0],
+            [1, 0, 1, 0, 1, 0],
+            [1, 0, 0, 0, 0, 0],
+        ],
+        FleetRules(rows=4, cols=6, fleet={4: 1, 1: 2}),
+    )
+    assert validate_field(
+        [
+            [1, 1, 1, 1, 0, 0],
+            [0, 0, 0, 0, 0, 0],
+            [1, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 1, 0],
+        ],
+        rules,
+    ) == ValidationResult(Rule.LENGTH, (0, 0))
+
+
+def test_big_board():
+    size = 1000
+    field = [[0] * size for _ in range(size)]
+    for row in range(0, size, 2):
+        field[row][: size - 1] = [1, 1, 1, 0] * ((size - 1) // 4) + [0] * 3
+    rules = FleetRules(size, size, {3: size // 2 * ((size - 1) // 4)})
+    assert validate_field(field, rules)
+
+    field[1][1] = 1
+    assert validate_field(field, rules) == ValidationResult(Rule.SHAPE, (0, 0))
+
+
+def test_non_binary_cells_are_occupied():
+    assert validate_field([[7, 0, 1]], FleetRules(1, 3, {1: 2}))
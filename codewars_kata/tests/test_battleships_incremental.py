@@ -0,0 +1,98 @@
+import pytest
+
+from ..battleships_field_validator.generic import FleetRules, Rule, validate_field
+from ..battleships_field_validator.incremental import IncrementalValidator, Ship
+from .test_battleships_bitboard import PROPER_FIELD
+
+PROPER_SHIPS = [
+    Ship(0, 1, 1),
+    Ship(1, 5, 3, horizontal=False),
+    Ship(1, 7, 3),
+    Ship(3, 0, 2),
+    Ship(3, 7, 1),
+    Ship(3, 9, 1),
+    Ship(6, 0, 4),
+    Ship(7, 6, 2, horizontal=False),
+    Ship(8, 8, 2),
+    Ship(9, 3, 1),
+]
+
+
+def test_ship_cells():
+    assert list(Ship(1, 2, 3).cells()) == [(1, 2), (1, 3), (1, 4)]
+    assert list(Ship(1, 2, 2, horizontal=False).cells()) == [(1, 2), (2, 2)]
+
+
+def test_placing_proper_fleet():
+    validator = IncrementalValidator()
+    for ship in PROPER_SHIPS:
+        assert not validator.complete
+        validator.place(ship)
+        assert validator.valid
+        assert validator.violation is None
+    assert validator.complete
+    assert validator.to_field() == PROPER_FIELD
+    assert validate_field(validator.to_field())
+
+    validator.remove(Ship(9, 3, 1))
+    assert validator.valid
+    assert not validator.complete
+
+
+def test_contact():
+    validator = IncrementalValidator()
+    validator.place(Ship(0, 0, 4))
+    validator.place(Ship(1, 4, 1))
+    assert validator.violation is Rule.CONTACT
+    assert not validator.valid
+
+    validator.remove(Ship(1, 4, 1))
+    assert validator.valid
+    # overlapping and touching by edge
+    validator.place(Ship(0, 2, 3, horizontal=False))
+    validator.place(Ship(1, 0, 2))
+    assert validator.violation is Rule.CONTACT
+    validator.remove(Ship(0, 2, 3, horizontal=False))
+    assert validator.violation is Rule.CONTACT
+    validator.remove(Ship(1, 0, 2))
+    assert validator.valid
+
+
+def test_fleet():
+    validator = IncrementalValidator()
+    validator.place(Ship(0, 0, 5))
+    assert validator.violation is Rule.LENGTH
+    validator.remove(Ship(0, 0, 5))
+
+    for col in range(0, 10, 2):
+        validator.place(Ship(0, col, 1))
+    assert validator.violation is Rule.FLEET
+    validator.remove(Ship(0, 0, 1))
+    assert validator.valid
+
+
+def test_custom_rules():
+    validator = IncrementalValidator(FleetRules(rows=3, cols=12, fleet={6: 1, 2: 1}))
+    validator.place(Ship(0, 6, 6))
+    validator.place(Ship(1, 0, 2, horizontal=False))
+    assert validator.complete
+    assert validator.ships == [Ship(0, 6, 6), Ship(1, 0, 2, horizontal=False)]
+
+
+def test_wrong_operations():
+    validator = IncrementalValidator()
+    validator.place(Ship(0, 0, 1))
+    with pytest.raises(ValueError):
+        validator.place(Ship(0, 0, 1))
+    with pytest.raises(ValueError):
+        validator.remove(Ship(5, 5, 1))
+    with pytest.raises(ValueError):
+        validator.place(Ship(0, 8, 3))
+    with pytest.raises(ValueError):
+        validator.place(Ship(8, 0, 3, horizontal=False))
+    with pytest.raises(ValueError):
+        validator.place(Ship(-1, 0, 1))
+    with pytest.raises(ValueError):
+        validator.place(Ship(0, 0, 0))
+    assert validator.ships == [Ship(0, 0, 1)]
+    assert validator.valid
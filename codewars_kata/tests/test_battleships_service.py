@@ -0,0 +1,89 @@
+import pytest
+
+from ..battleships_field_validator.bitboard import field_to_bitboard
+from ..battleships_field_validator.service import (
+    ValidationService,
+    ValidationStats,
+    board_key,
+)
+from .test_battleships_bitboard import PROPER_FIELD, changed
+
+INVALID_FIELD = changed((0, 1))
+
+
+def test_board_key():
+    assert board_key(PROPER_FIELD) == field_to_bitboard(PROPER_FIELD)
+    assert board_key(board_key(PROPER_FIELD)) == board_key(PROPER_FIELD)
+    assert board_key(PROPER_FIELD) != board_key(INVALID_FIELD)
+
+
+def test_validate():
+    service = ValidationService()
+    assert service.validate(PROPER_FIELD)
+    assert not service.validate(INVALID_FIELD)
+    assert service.validate(field_to_bitboard(PROPER_FIELD))
+    assert service.stats.boards == 3
+    assert service.stats.cache_hits == 1
+
+
+def test_validate_many_keeps_order_and_counts_repeats_as_hits():
+    service = ValidationService()
+    boards = [PROPER_FIELD, INVALID_FIELD, PROPER_FIELD, INVALID_FIELD, PROPER_FIELD]
+    assert service.validate_many(boards) == [True, False, True, False, True]
+    assert service.stats.cache_hits == 3
+    assert service.stats.hit_rate == pytest.approx(0.6)
+    assert service.validate_many([]) == []
+
+
+def test_cache_is_bounded_lru():
+    calls = []
+
+    def validator(board):
+        calls.append(board)
+        return True
+
+    service = ValidationService(validator, cache_size=2)
+    service.validate_many([1, 2])
+    service.validate(1)
+    # 2 is the least recently used one
+    service.validate(3)
+    service.validate_many([1, 3, 2])
+    assert calls == [1, 2, 3, 2]
+
+    service.clear_cache()
+    service.validate(1)
+    assert calls[-1] == 1
+
+
+def test_disabled_cache():
+    calls = []
+
+    def validator(board):
+        calls.append(board)
+        return False
+
+    service = ValidationService(validator, cache_size=0)
+    service.validate(1)
+    service.validate(1)
+    assert calls == [1, 1]
+
+
+def test_process_pool():
+    boards = [PROPER_FIELD, INVALID_FIELD] * 5 + [changed((0, 1), (9, 0))]
+    with ValidationService(processes=2, chunk_size=1, parallel_threshold=1) as service:
+        assert service.validate_many(boards) == [True, False] * 5 + [True]
+        assert service.validate_many(boards) == [True, False] * 5 + [True]
+    assert service.stats.cache_hits == 2 * len(boards) - 3
+
+
+def test_stats():
+    stats = ValidationStats(boards=10, cache_hits=4, seconds=0.5)
+    assert stats.hit_rate == 0.4
+    assert stats.boards_per_second == 20
+    assert ValidationStats(0, 0, 0.0).hit_rate == 0.0
+
+    service = ValidationService()
+    service.validate(PROPER_FIELD)
+    assert service.stats.seconds > 0
+    service.reset_stats()
+    assert service.stats == ValidationStats(0, 0, 0.0)